@@ -6,6 +6,7 @@
 ################################################################################
 from __future__ import annotations
 
+import importlib
 import logging as lg
 
 # Version of the package
@@ -13,18 +14,11 @@ from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any, ClassVar, Literal, Optional
 
-from energy_pandas.units import unit_registry
-
 try:
     from pydantic_settings import BaseSettings
 except ImportError:
     from pydantic_settings import BaseSettingsModel as BaseSettings
-from pydantic import DirectoryPath, Field
-
-try:
-    from pydantic import field_validator
-except ImportError:
-    from pydantic import validator as field_validator
+from pydantic import DirectoryPath, Field, PrivateAttr
 
 
 class ZoneWeight:
@@ -56,6 +50,14 @@ class Settings(BaseSettings, arbitrary_types_allowed=True, validate_assignment=T
 
     # cache server responses
     cache_responses: bool = Field(False, validation_alias="ARCHETYPAL_CACHE_RESPONSES")
+    # seconds after which a cached response is requested again (None = never)
+    cache_expire_after: Optional[float] = Field(None, validation_alias="ARCHETYPAL_CACHE_EXPIRE_AFTER")
+    # maximum size in bytes of the compressed responses kept in the cache
+    cache_max_size: int = Field(256 * 2**20, validation_alias="ARCHETYPAL_CACHE_MAX_SIZE")
+    # reuse the results of identical Basement and Slab calculations
+    cache_ground_heat_transfer: bool = Field(True, validation_alias="ARCHETYPAL_CACHE_GROUND_HEAT_TRANSFER")
+    # where the programs run (e.g. a tmpfs mount); next to the outputs if None
+    run_folder: Optional[Path] = Field(None, validation_alias="ARCHETYPAL_RUN_FOLDER")
 
     # Debug behavior
     debug: bool = Field(False, validation_alias="ARCHETYPAL_DEBUG")
@@ -177,11 +179,23 @@ class Settings(BaseSettings, arbitrary_types_allowed=True, validate_assignment=T
         description="Root directory of the EnergyPlus install.",
     )
 
-    unit_registry: Any = None
+    _unit_registry: Any = PrivateAttr(None)
+
+    @property
+    def unit_registry(self):
+        """The pint unit registry shared with energy_pandas.
+
+        energy_pandas is slow to import, so the registry is only loaded on first
+        use.
+        """
+        if self._unit_registry is None:
+            from energy_pandas.units import unit_registry
+
+            self.unit_registry = unit_registry
+        return self._unit_registry
 
-    @field_validator("unit_registry")
-    @classmethod
-    def initialize_units(cls, v):
+    @unit_registry.setter
+    def unit_registry(self, v):
         if v is not None:
             additional_units = (
                 "Dimensionless = dimensionless = Fraction = fraction",
@@ -189,20 +203,40 @@ class Settings(BaseSettings, arbitrary_types_allowed=True, validate_assignment=T
             )
             for unit in additional_units:
                 v.define(unit)
-        return v
+        self._unit_registry = v
 
 
 settings = Settings()
-settings.unit_registry = unit_registry
-
-# After settings are loaded, import other modules
-from .eplus_interface.version import EnergyPlusVersion  # noqa: E402
-from .idfclass import IDF  # noqa: E402
-from .umi_template import (  # noqa: E402
-    BuildingTemplate,
-    UmiTemplateLibrary,
-)
-from .utils import clear_cache, config, parallel_process  # noqa: E402
+
+# Public objects and submodules imported on first access (PEP 562), so that
+# `import archetypal` does not pull in pandas, energy_pandas, scikit-learn,
+# matplotlib or the template hierarchy.
+_LAZY_ATTRIBUTES = {
+    "EnergyPlusVersion": "archetypal.eplus_interface.version",
+    "IDF": "archetypal.idfclass",
+    "BuildingTemplate": "archetypal.umi_template",
+    "UmiTemplateLibrary": "archetypal.umi_template",
+    "clear_cache": "archetypal.utils",
+    "config": "archetypal.utils",
+    "parallel_process": "archetypal.utils",
+}
+_LAZY_SUBMODULES = ("dataportal", "utils")
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
+
 
 try:
     __version__ = version("archetypal")
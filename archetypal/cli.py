@@ -11,8 +11,7 @@ import click
 from path import Path
 
 from archetypal import __version__, settings
-from archetypal.idfclass import IDF
-from archetypal.umi_template import UmiTemplateLibrary
+from archetypal.tracing import tracing
 from archetypal.utils import config, docstring_parameter, log, parallel_process, timeit
 
 from .eplus_interface.exceptions import EnergyPlusVersionError
@@ -109,6 +108,12 @@ pass_config = click.make_pass_decorator(CliConfig, ensure=True)
     default=False,
     help="Will break on any exception. Useful when debugging",
 )
+@click.option(
+    "--trace",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="write a flame-graph profile of the command to this file (Chrome trace, or folded stacks for *.folded)",
+)
 @pass_config
 def cli(
     cli_config,
@@ -124,6 +129,7 @@ def cli(
     log_filename,
     ep_version,
     debug,
+    trace,
 ):
     """archetypal: Retrieve, construct, simulate, convert and analyse building
     simulation templates
@@ -145,6 +151,8 @@ def cli(
     cli_config.debug = debug
     # apply new config params
     config(**cli_config.__dict__)
+    if trace is not None:
+        click.get_current_context().with_resource(tracing(trace))
 
 
 @timeit
@@ -200,6 +208,9 @@ def reduce(ctx, idf, output, weather, cores, all_zones, as_version):
     Example: % archetypal -csl reduce "." "elsewhere/model1.idf" -w "weather.epw"
 
     """
+    # Imported here to keep the start-up of the other commands fast.
+    from archetypal.umi_template import UmiTemplateLibrary
+
     output = Path(output)
     name = output.stem
     ext = output.suffix if output.suffix == ".json" else ".json"
@@ -288,6 +299,8 @@ def transition(idf, to_version, cores, yes):
     {ep_version}.
 
     """
+    from archetypal.idfclass import IDF
+
     file_paths, file_list = idf
     log(
         f"executing {len(file_paths)} file(s):\n{file_list}",
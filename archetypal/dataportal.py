@@ -12,13 +12,21 @@ import json
 import logging as lg
 import os
 import re
+import sqlite3
+import threading
 import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
 from warnings import warn
 
 import pandas as pd
 import pycountry as pycountry
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from archetypal import settings
 from archetypal.utils import log
@@ -34,13 +42,19 @@ def tabula_available_buildings(country_name="France"):
     """
     # Check code country
     code_country = _resolve_codecountry(country_name)
+
+    # Serve from the local typology database, if harvested
+    store = TabulaStore.local()
+    if store is not None:
+        df = store.available_buildings(code_country)
+        if df is not None:
+            return df
+
     data = {"code_country": code_country}
     json_response = tabula_api_request(data, table="all-country")
 
     # load data
-    df = pd.DataFrame(json_response)
-    df = df.data.apply(pd.Series)
-    return df
+    return _tabula_records_frame(json_response)
 
 
 def tabula_api_request(data, table="detail"):
@@ -53,22 +67,7 @@ def tabula_api_request(data, table="detail"):
             'buildingtype', 'suffix', and 'variant'.
         table (str): the server-table to query. 'detail' or 'all-country'
     """
-    # Prepare URL
-    if table == "all-country":
-        codehex = str(int(hashlib.md5(data["code_country"].encode("utf-8")).hexdigest(), 16))[0:13]
-        url_base = "http://webtool.building-typology.eu/data/matrix/building/{0}/p/0/o/0/l/10/dc/{1}"
-        prepared_url = url_base.format(data["code_country"], codehex)
-
-    elif table == "detail":
-        buildingtype = ".".join(s for s in data["buildingtype"])
-        suffix = ".".join(s for s in data["suffix"])
-        bldname = buildingtype + "." + suffix
-        hexint = hashlib.md5(bldname.encode("utf-8")).hexdigest()[0:13]
-        url_base = "http://webtool.building-typology.eu/data/adv/building/detail/{0}/bv/{1}/dc/{2}"
-        prepared_url = url_base.format(bldname, data["variant"], hexint)
-
-    else:
-        raise ValueError(f'server-table name "{table}" invalid')
+    prepared_url = _tabula_url(data, table)
 
     # First, try to get the cached resonse from file
     cached_response_json = get_from_cache(prepared_url)
@@ -79,7 +78,7 @@ def tabula_api_request(data, table="detail"):
         return cached_response_json
     else:
         # if this URL is not already in the cache, request it
-        response = requests.get(prepared_url)
+        response = _http_get(prepared_url)
         if response.status_code == 200:
             response_json = response.json()
             if "remark" in response_json:
@@ -100,6 +99,26 @@ def tabula_api_request(data, table="detail"):
             pass
 
 
+def _tabula_url(data, table="detail"):
+    """Return the TABULA API URL of a query. See :func:`tabula_api_request`."""
+    # Prepare URL
+    if table == "all-country":
+        codehex = str(int(hashlib.md5(data["code_country"].encode("utf-8")).hexdigest(), 16))[0:13]
+        url_base = "http://webtool.building-typology.eu/data/matrix/building/{0}/p/0/o/0/l/10/dc/{1}"
+        return url_base.format(data["code_country"], codehex)
+
+    elif table == "detail":
+        buildingtype = ".".join(s for s in data["buildingtype"])
+        suffix = ".".join(s for s in data["suffix"])
+        bldname = buildingtype + "." + suffix
+        hexint = hashlib.md5(bldname.encode("utf-8")).hexdigest()[0:13]
+        url_base = "http://webtool.building-typology.eu/data/adv/building/detail/{0}/bv/{1}/dc/{2}"
+        return url_base.format(bldname, data["variant"], hexint)
+
+    else:
+        raise ValueError(f'server-table name "{table}" invalid')
+
+
 def tabula_building_details_sheet(
     code_building=None,
     code_country="FR",
@@ -156,6 +175,56 @@ def tabula_building_details_sheet(
     Returns:
         pandas.DataFrame: The DataFrame from the
     """
+    data, code_country = _tabula_building_query(
+        code_building,
+        code_country,
+        code_typologyregion,
+        code_buildingsizeclass,
+        code_construcionyearclass,
+        code_additional_parameter,
+        code_type,
+        code_num,
+        code_variantnumber,
+    )
+
+    # Serve from the local typology database, if harvested
+    store = TabulaStore.local()
+    if store is not None:
+        df = store.building_details(_tabula_code_building(data))
+        if df is not None:
+            return df
+
+    json_response = tabula_api_request(data, table="detail")
+
+    if json_response is not None:
+        log("")
+        # load data
+        return _tabula_details_frame(json_response)
+    else:
+        raise ValueError(
+            'No data found in TABULA matrix with query:"{}"\nRun '
+            "archetypal.dataportal.tabula_available_buildings() "
+            'with country code "{}" to get list of possible '
+            "building types"
+            "".format(".".join(s for s in data["buildingtype"]), code_country)
+        )
+
+
+def _tabula_building_query(
+    code_building,
+    code_country,
+    code_typologyregion,
+    code_buildingsizeclass,
+    code_construcionyearclass,
+    code_additional_parameter,
+    code_type,
+    code_num,
+    code_variantnumber,
+):
+    """Validate the building codes and return the (data, code_country) of the query.
+
+    See :func:`tabula_building_details_sheet` for the arguments.
+    """
     # Parse builsing_code
     if code_building is not None:
         try:
@@ -210,25 +279,26 @@ def tabula_building_details_sheet(
         "suffix": [code_type, code_num],
         "variant": code_variantnumber,
     }
-    json_response = tabula_api_request(data, table="detail")
+    return data, code_country
 
-    if json_response is not None:
-        log("")
-        # load data
-        df = pd.DataFrame(json_response)
-        df = df.data.apply(pd.Series)
 
-        # remove html tags from labels
-        df.label = df.label.str.replace("<[^<]+?>", " ", regex=True)
-        return df
-    else:
-        raise ValueError(
-            'No data found in TABULA matrix with query:"{}"\nRun '
-            "archetypal.dataportal.tabula_available_buildings() "
-            'with country code "{}" to get list of possible '
-            "building types"
-            "".format(".".join(s for s in data["buildingtype"]), code_country)
-        )
+def _tabula_code_building(data):
+    """Return the whole building code (e.g. "AT.MT.AB.02.Gen.ReEx.001.001") of a query."""
+    return ".".join([*data["buildingtype"], *data["suffix"], data["variant"]])
+
+
+def _tabula_records_frame(json_response):
+    """Return the "data" records of a TABULA response as a DataFrame."""
+    df = pd.DataFrame(json_response)
+    return df.data.apply(pd.Series)
+
+
+def _tabula_details_frame(json_response):
+    """Return a TABULA building detail response as a DataFrame."""
+    df = _tabula_records_frame(json_response)
+    # remove html tags from labels
+    df.label = df.label.str.replace("<[^<]+?>", " ", regex=True)
+    return df
 
 
 def tabula_system(code_country, code_boundarycond="SUH", code_variantnumber=1):
@@ -257,13 +327,20 @@ def tabula_system(code_country, code_boundarycond="SUH", code_variantnumber=1):
 
     # prepare data
     data = {"systype": [code_country, code_boundarycond, code_variantnumber]}
+
+    # Serve from the local typology database, if harvested
+    store = TabulaStore.local()
+    if store is not None:
+        df = store.system(".".join(data["systype"]))
+        if df is not None:
+            return df
+
     json_response = tabula_system_request(data)
 
     if json_response is not None:
         log("")
         # load data
-        df = pd.DataFrame(json_response)
-        return df.data.to_frame()
+        return _tabula_system_frame(json_response)
     else:
         raise ValueError(
             'No data found in TABULA matrix with query:"{}"\nRun '
@@ -283,11 +360,8 @@ def tabula_system_request(data):
     Args:
         data (dict): prepared data for html query
     """
-    system = ".".join(s for s in data["systype"])
-    hexint = hashlib.md5(system.encode("utf-8")).hexdigest()[0:13]
-
-    log(f"quering system type {system}")
-    prepared_url = "http://webtool.building-typology.eu/data/matrix/system" f"/detail/{system}/dc/{hexint}"
+    log(f"quering system type {'.'.join(data['systype'])}")
+    prepared_url = _tabula_system_url(data)
 
     cached_response_json = get_from_cache(prepared_url)
 
@@ -298,7 +372,7 @@ def tabula_system_request(data):
 
     else:
         # if this URL is not already in the cache, pause, then request it
-        response = requests.get(prepared_url)
+        response = _http_get(prepared_url)
 
         try:
             response_json = response.json()
@@ -316,6 +390,302 @@ def tabula_system_request(data):
             return response_json
 
 
+def _tabula_system_url(data):
+    """Return the TABULA API URL of a system query. See :func:`tabula_system_request`."""
+    system = ".".join(s for s in data["systype"])
+    hexint = hashlib.md5(system.encode("utf-8")).hexdigest()[0:13]
+    return "http://webtool.building-typology.eu/data/matrix/system" f"/detail/{system}/dc/{hexint}"
+
+
+def _tabula_system_frame(json_response):
+    """Return a TABULA system response as a DataFrame."""
+    df = pd.DataFrame(json_response)
+    return df.data.to_frame()
+
+
+# Countries of the TABULA webtool, as ISO 3166-1 alpha-2 codes.
+TABULA_COUNTRIES = (
+    "AT",
+    "BA",
+    "BE",
+    "CY",
+    "CZ",
+    "DE",
+    "DK",
+    "ES",
+    "FR",
+    "GB",
+    "GR",
+    "HU",
+    "IE",
+    "IT",
+    "NL",
+    "NO",
+    "PL",
+    "RS",
+    "SE",
+    "SI",
+)
+
+
+class TabulaStore:
+    """A local, indexed SQLite database of the TABULA typology.
+
+    The database is filled by :func:`harvest_tabula` and holds three tables:
+    the building types of each country (``buildings``), the detail sheet rows of
+    each building variant (``building_details``) and the system responses
+    (``systems``). Its query methods return the same DataFrames as
+    :func:`tabula_available_buildings`, :func:`tabula_building_details_sheet` and
+    :func:`tabula_system`, and are used by these functions when the default
+    database exists.
+
+    Args:
+        path (str or Path): The path of the SQLite file.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS buildings (
+            code_country TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            code_buildingtype TEXT,
+            suffix_building TEXT,
+            record TEXT NOT NULL,
+            PRIMARY KEY (code_country, position)
+        );
+        CREATE TABLE IF NOT EXISTS building_details (
+            code_building TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            label TEXT,
+            val TEXT,
+            record TEXT NOT NULL,
+            PRIMARY KEY (code_building, position)
+        );
+        CREATE TABLE IF NOT EXISTS systems (
+            code_system TEXT PRIMARY KEY,
+            response TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS harvested (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (kind, key)
+        );
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @staticmethod
+    def default_path():
+        """The path of the default database, in the data folder."""
+        return Path(settings.data_folder) / "tabula.sqlite"
+
+    @classmethod
+    def local(cls):
+        """Return the default TabulaStore if it was harvested, otherwise None."""
+        path = cls.default_path()
+        return cls(path) if path.is_file() else None
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.executescript(self._SCHEMA)
+        return conn
+
+    def harvested(self, kind):
+        """Return the set of keys of `kind` ("buildings", "building_details" or
+        "systems") that were already harvested."""
+        with closing(self._connect()) as conn:
+            return {key for (key,) in conn.execute("SELECT key FROM harvested WHERE kind = ?", (kind,))}
+
+    def add(self, kind, responses):
+        """Normalize and store a dict of {key: json_response} in a single transaction.
+
+        Args:
+            kind (str): "buildings" (keys are country codes), "building_details"
+                (keys are whole building codes) or "systems" (keys are system
+                codes, e.g. "FR.SUH.01").
+            responses (dict): The TABULA JSON responses.
+        """
+        with closing(self._connect()) as conn, conn:
+            for key, response in responses.items():
+                if kind == "systems":
+                    conn.execute("INSERT OR REPLACE INTO systems VALUES (?, ?)", (key, json.dumps(response)))
+                else:
+                    records = response.get("data") or []
+                    conn.execute(f"DELETE FROM {kind} WHERE {self._key_column(kind)} = ?", (key,))
+                    conn.executemany(
+                        f"INSERT INTO {kind} VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (key, i, *self._typed_columns(kind, record), json.dumps(record))
+                            for i, record in enumerate(records)
+                        ],
+                    )
+            conn.executemany("INSERT OR IGNORE INTO harvested VALUES (?, ?)", [(kind, key) for key in responses])
+
+    @staticmethod
+    def _key_column(kind):
+        return {"buildings": "code_country", "building_details": "code_building"}[kind]
+
+    @staticmethod
+    def _typed_columns(kind, record):
+        if kind == "buildings":
+            return record.get("code_buildingtype_column1"), record.get("suffix_building_column1")
+        return record.get("label"), None if record.get("val") is None else str(record.get("val"))
+
+    def _records(self, kind, key):
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT record FROM {kind} WHERE {self._key_column(kind)} = ? ORDER BY position", (key,)
+            ).fetchall()
+        return [json.loads(record) for (record,) in rows]
+
+    def building_types(self, countries=None):
+        """Return the (code_buildingtype, suffix_building) of the harvested countries."""
+        query = "SELECT code_buildingtype, suffix_building FROM buildings WHERE code_buildingtype IS NOT NULL"
+        params = ()
+        if countries is not None:
+            countries = list(countries)
+            query += f" AND code_country IN ({','.join('?' * len(countries))})"
+            params = countries
+        with closing(self._connect()) as conn:
+            return conn.execute(query + " ORDER BY code_country, position", params).fetchall()
+
+    def available_buildings(self, code_country):
+        """Return the building types of a country, or None if not harvested."""
+        records = self._records("buildings", code_country)
+        return _tabula_records_frame({"data": records}) if records else None
+
+    def building_details(self, code_building):
+        """Return the detail sheet of a whole building code, or None if not harvested."""
+        records = self._records("building_details", code_building)
+        return _tabula_details_frame({"data": records}) if records else None
+
+    def system(self, code_system):
+        """Return the system of a system code (e.g. "FR.SUH.01"), or None if not harvested."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT response FROM systems WHERE code_system = ?", (code_system,)).fetchone()
+        return None if row is None else _tabula_system_frame(json.loads(row[0]))
+
+    def tabula_available_buildings(self, country_name="France"):
+        """Same as :func:`tabula_available_buildings`, served from this database."""
+        code_country = _resolve_codecountry(country_name)
+        df = self.available_buildings(code_country)
+        if df is None:
+            raise ValueError(f'No TABULA building types were harvested for country "{code_country}"')
+        return df
+
+    def tabula_building_details_sheet(
+        self,
+        code_building=None,
+        code_country="FR",
+        code_typologyregion="N",
+        code_buildingsizeclass="SFH",
+        code_construcionyearclass=1,
+        code_additional_parameter="Gen",
+        code_type="ReEx",
+        code_num=1,
+        code_variantnumber=1,
+    ):
+        """Same as :func:`tabula_building_details_sheet`, served from this database."""
+        data, _ = _tabula_building_query(
+            code_building,
+            code_country,
+            code_typologyregion,
+            code_buildingsizeclass,
+            code_construcionyearclass,
+            code_additional_parameter,
+            code_type,
+            code_num,
+            code_variantnumber,
+        )
+        df = self.building_details(_tabula_code_building(data))
+        if df is None:
+            raise ValueError(f'No TABULA detail sheet was harvested for "{_tabula_code_building(data)}"')
+        return df
+
+    def tabula_system(self, code_country, code_boundarycond="SUH", code_variantnumber=1):
+        """Same as :func:`tabula_system`, served from this database."""
+        if not isinstance(code_variantnumber, str):
+            code_variantnumber = str(code_variantnumber).zfill(2)
+        code_system = ".".join([_resolve_codecountry(code_country), code_boundarycond, code_variantnumber])
+        df = self.system(code_system)
+        if df is None:
+            raise ValueError(f'No TABULA system was harvested for "{code_system}"')
+        return df
+
+
+def harvest_tabula(
+    countries=TABULA_COUNTRIES,
+    variants=(1, 2, 3),
+    boundary_conditions=("SUH", "MUH"),
+    path=None,
+    max_workers=8,
+    chunk_size=200,
+):
+    """Harvest the complete TABULA typology into a local, indexed database.
+
+    The building types of each country are requested first, then the detail
+    sheet of every building type and variant, and finally the systems of each
+    country. Requests are made concurrently with :func:`fetch_many` and stored
+    chunk by chunk: queries already in the database are skipped, so an
+    interrupted harvest resumes where it stopped.
+
+    Args:
+        countries (list of str): Country names or codes. Defaults to all the
+            countries of the TABULA webtool.
+        variants (list of int): The energy performance levels to harvest.
+        boundary_conditions (list of str): The system boundary conditions ("SUH"
+            and/or "MUH").
+        path (str or Path, optional): The SQLite file. Defaults to
+            "tabula.sqlite" in the data folder, which is then used by
+            :func:`tabula_available_buildings`,
+            :func:`tabula_building_details_sheet` and :func:`tabula_system`.
+        max_workers (int): The maximum number of concurrent requests.
+        chunk_size (int): The number of responses stored per transaction.
+
+    Returns:
+        TabulaStore: The local typology database.
+    """
+    store = TabulaStore(path or TabulaStore.default_path())
+    countries = [_resolve_codecountry(country) for country in countries]
+
+    def harvest(kind, queries):
+        """Fetch the {key: url} queries not yet harvested and store them."""
+        done = store.harvested(kind)
+        todo = [(key, url) for key, url in queries.items() if key not in done]
+        log(f"Harvesting {len(todo)} TABULA {kind} ({len(queries) - len(todo)} already harvested)")
+        for i in range(0, len(todo), chunk_size):
+            chunk = todo[i : i + chunk_size]
+            responses = fetch_many([url for _, url in chunk], max_workers=max_workers)
+            # failed requests are not stored, so they are retried on the next harvest.
+            store.add(kind, {key: response for (key, _), response in zip(chunk, responses) if response is not None})
+
+    harvest(
+        "buildings",
+        {country: _tabula_url({"code_country": country}, table="all-country") for country in countries},
+    )
+
+    details = {}
+    for code_buildingtype, suffix_building in store.building_types(countries):
+        for variant in variants:
+            data = {
+                "buildingtype": code_buildingtype.split("."),
+                "suffix": suffix_building.split("."),
+                "variant": str(variant).zfill(3),
+            }
+            details[_tabula_code_building(data)] = _tabula_url(data, table="detail")
+    harvest("building_details", details)
+
+    systems = {}
+    for country in countries:
+        for code_boundarycond in boundary_conditions:
+            for variant in variants:
+                data = {"systype": [country, code_boundarycond, str(variant).zfill(2)]}
+                systems[".".join(data["systype"])] = _tabula_system_url(data)
+    harvest("systems", systems)
+    return store
+
+
 def _resolve_codecountry(code_country):
     """check country name against pycountry and return alpha_2 code
 
@@ -339,50 +709,214 @@ def _resolve_codecountry(code_country):
     return code_country
 
 
-def get_from_cache(url):
+class ResponseCache:
+    """A single-file SQLite store of compressed JSON server responses.
+
+    Responses are keyed by URL and stored zlib-compressed. Entries older than
+    `expire_after` are ignored, and the oldest entries are evicted once the total
+    size of the stored responses exceeds `max_size`.
+
+    Args:
+        path (str or Path): The path of the SQLite file.
+        expire_after (float, optional): Number of seconds after which a response
+            is considered stale. Defaults to None (never).
+        max_size (int, optional): Maximum size in bytes of the compressed
+            responses. Defaults to None (no limit).
+    """
+
+    def __init__(self, path, expire_after=None, max_size=None):
+        self.path = Path(path)
+        self.expire_after = expire_after
+        self.max_size = max_size
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, created REAL NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        return conn
+
+    def get_many(self, urls):
+        """Return a dict of {url: response_json} for the cached and fresh urls."""
+        urls = list(dict.fromkeys(str(url) for url in urls))
+        if not urls or not self.path.exists():
+            return {}
+        oldest = 0 if self.expire_after is None else time.time() - self.expire_after
+        found = {}
+        with closing(self._connect()) as conn:
+            # query in chunks to stay below the SQLite variable limit.
+            for i in range(0, len(urls), 500):
+                chunk = urls[i : i + 500]
+                rows = conn.execute(
+                    f"SELECT url, data FROM responses WHERE created >= ? AND url IN ({','.join('?' * len(chunk))})",
+                    (oldest, *chunk),
+                )
+                found.update((url, json.loads(zlib.decompress(data))) for url, data in rows)
+        return found
+
+    def get(self, url):
+        """Return the cached response of `url` or None."""
+        return self.get_many([url]).get(str(url))
+
+    def set_many(self, responses):
+        """Store a dict of {url: response_json} in a single transaction."""
+        rows = []
+        now = time.time()
+        for url, response_json in responses.items():
+            data = zlib.compress(json.dumps(response_json).encode("utf-8"))
+            rows.append((str(url), now, len(data), data))
+        if not rows:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", rows)
+            if self.max_size is not None:
+                self._evict(conn)
+
+    def set(self, url, response_json):
+        """Store the response of `url`."""
+        self.set_many({url: response_json})
+
+    def _evict(self, conn):
+        """Delete the oldest responses until the total size is below max_size."""
+        (total,) = conn.execute("SELECT IFNULL(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_size:
+            return
+        to_delete = []
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY created, rowid"):
+            to_delete.append((url,))
+            total -= size
+            if total <= self.max_size:
+                break
+        conn.executemany("DELETE FROM responses WHERE url = ?", to_delete)
+
+    def clear(self):
+        """Delete all the cached responses."""
+        if self.path.exists():
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM responses")
+
+
+def _response_cache():
+    """Return the ResponseCache configured by the package settings."""
+    return ResponseCache(
+        Path(settings.cache_folder) / "responses.sqlite",
+        expire_after=settings.cache_expire_after,
+        max_size=settings.cache_max_size,
+    )
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session(pool_size=16, retries=3, backoff_factor=0.5):
+    """Return the pooled requests.Session shared by the dataportal requests.
+
+    Failed connections and 429/5xx responses are retried with an exponential
+    backoff.
     """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def _http_get(url, timeout=60, **kwargs):
+    """GET `url` with the shared pooled session."""
+    return _get_session().get(url, timeout=timeout, **kwargs)
+
+
+def fetch_many(urls, max_workers=8, timeout=60):
+    """Fetch the JSON responses of many URLs with bounded concurrency.
+
+    Cached responses are read in a single query. The other URLs are requested
+    by at most `max_workers` threads sharing one pooled session (with retries
+    and backoff), and their responses are saved to the cache in a single
+    transaction.
+
     Args:
-        url:
+        urls (list of str): The prepared URLs to GET.
+        max_workers (int): The maximum number of concurrent requests.
+        timeout (float): The timeout of each request in seconds.
+
+    Returns:
+        list: The JSON responses in the order of `urls`. None for the requests
+            that failed or did not return JSON.
+    """
+    urls = [str(url) for url in urls]
+    found = _response_cache().get_many(urls) if settings.cache_responses else {}
+    missing = [url for url in dict.fromkeys(urls) if url not in found]
+
+    def fetch(url):
+        try:
+            response = _http_get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            log(f'Could not fetch "{url}": {e}', level=lg.ERROR)
+            return None
+
+    fetched = {}
+    if missing:
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for url, response_json in zip(missing, executor.map(fetch, missing)):
+                if response_json is not None:
+                    fetched[url] = response_json
+        log(f"Downloaded {len(fetched)}/{len(missing)} responses in {time.time() - start_time:,.2f} seconds")
+        if settings.cache_responses:
+            _response_cache().set_many(fetched)
+    found.update(fetched)
+    return [found.get(url) for url in urls]
+
+
+def get_from_cache(url):
+    """Return the cached JSON response of `url`, if the cache is enabled.
+
+    Args:
+        url (str): The prepared URL of the request.
     """
     # if the tool is configured to use the cache
     if settings.cache_responses:
-        # determine the filename by hashing the url
-        filename = hashlib.md5(str(url).encode("utf-8")).hexdigest()
-
-        cache_path_filename = settings.cache_folder / (filename + ".json")
-        # open the cache file for this url hash if it already exists, otherwise
-        # return None
-        if cache_path_filename.is_file():
-            with open(cache_path_filename, encoding="utf-8") as cache_file:
-                response_json = json.load(cache_file)
-            log(f'Retrieved response from cache file "{cache_path_filename}" for URL "{url!s}"')
-            return response_json
+        response_json = _response_cache().get(url)
+        if response_json is None:
+            # responses cached by earlier versions, one file per md5(url).
+            filename = hashlib.md5(str(url).encode("utf-8")).hexdigest()
+            cache_path_filename = Path(settings.cache_folder) / (filename + ".json")
+            if cache_path_filename.is_file():
+                with open(cache_path_filename, encoding="utf-8") as cache_file:
+                    response_json = json.load(cache_file)
+        if response_json is not None:
+            log(f'Retrieved response from cache for URL "{url!s}"')
+        return response_json
 
 
 def save_to_cache(url, response_json):
-    """
+    """Save the JSON response of `url` to the cache, if the cache is enabled.
+
     Args:
-        url:
-        response_json:
+        url (str): The prepared URL of the request.
+        response_json: The JSON response.
     """
     if settings.cache_responses:
         if response_json is None:
             log("Saved nothing to cache because response_json is None")
         else:
-            # create the folder on the disk if it doesn't already exist
-            if not os.path.exists(settings.cache_folder):
-                os.makedirs(settings.cache_folder)
-
-            # hash the url (to make filename shorter than the often extremely
-            # long url)
-            filename = hashlib.md5(str(url).encode("utf-8")).hexdigest()
-            cache_path_filename = os.path.join(settings.cache_folder, os.extsep.join([filename, "json"]))
-            # dump to json, and save to file
-            json_str = json.dumps(response_json)
-            with open(cache_path_filename, "w", encoding="utf-8") as cache_file:
-                cache_file.write(json_str)
-
-            log(f'Saved response to cache file "{cache_path_filename}"')
+            _response_cache().set(url, response_json)
+            log(f'Saved response to cache for URL "{url!s}"')
 
 
 def openei_api_request(
@@ -442,7 +976,7 @@ def nrel_api_cbr_request(data):
     else:
         start_time = time.time()
         log(f'Getting from {url}, "{data}"')
-        response = requests.get(prepared_url)
+        response = _http_get(prepared_url)
         # if this URL is not already in the cache, pause, then request it
         # get the response size and the domain, log result
         size_kb = len(response.content) / 1000.0
@@ -507,7 +1041,7 @@ def nrel_bcl_api_request(data):
     else:
         start_time = time.time()
         log(f'Getting from {url}, "{data}"')
-        response = requests.get(prepared_url)
+        response = _http_get(prepared_url)
 
         # check if an error has occurred
         response.raise_for_status()
@@ -576,7 +1110,7 @@ def stat_can_request(response_format, lang="E", dguid="2016A000011124", topic=0,
         # if this URL is not already in the cache, request it
         start_time = time.time()
         log(f"Getting from {prepared_url}")
-        response = requests.get(prepared_url)
+        response = _http_get(prepared_url)
         # if this URL is not already in the cache, pause, then request it
         # get the response size and the domain, log result
         size_kb = len(response.content) / 1000.0
@@ -647,7 +1181,7 @@ def stat_can_geo_request(response_format="json", lang="E", geos="PR", cpt="00"):
         # if this URL is not already in the cache, request it
         start_time = time.time()
         log(f"Getting from {prepared_url}")
-        response = requests.get(prepared_url)
+        response = _http_get(prepared_url)
         # if this URL is not already in the cache, pause, then request it
         # get the response size and the domain, log result
         size_kb = len(response.content) / 1000.0
@@ -769,7 +1303,7 @@ def download_bld_window(
             uids.append(component["component"]["uid"])
         url = "https://bcl.nrel.gov/api/component/download?uids={}".format(",".join(uids))
         # actual download with get()
-        d_response = requests.get(url)
+        d_response = _http_get(url)
 
         if d_response.ok:
             # loop through files and extract the ones that match the extension
@@ -1,5 +1,7 @@
 """EnergyPlus python interface."""
 
+import importlib
+
 __all__ = [
     "InvalidEnergyPlusVersion",
     "EnergyPlusProcessError",
@@ -15,19 +17,31 @@ __all__ = [
     "TransitionThread",
 ]
 
-from archetypal.eplus_interface.basement import BasementThread
-from archetypal.eplus_interface.energy_plus import (
-    EnergyPlusExe,
-    EnergyPlusProgram,
-    EnergyPlusThread,
-)
-from archetypal.eplus_interface.exceptions import (
-    EnergyPlusProcessError,
-    EnergyPlusVersionError,
-    EnergyPlusWeatherError,
-    InvalidEnergyPlusVersion,
-)
-from archetypal.eplus_interface.expand_objects import ExpandObjectsThread
-from archetypal.eplus_interface.slab import SlabThread
-from archetypal.eplus_interface.transition import TransitionThread
-from archetypal.eplus_interface.version import EnergyPlusVersion
+# Imported on first access (PEP 562): the program threads depend on pandas and
+# tqdm, which `import archetypal` should not load.
+_LAZY_ATTRIBUTES = {
+    "BasementThread": "archetypal.eplus_interface.basement",
+    "EnergyPlusExe": "archetypal.eplus_interface.energy_plus",
+    "EnergyPlusProgram": "archetypal.eplus_interface.energy_plus",
+    "EnergyPlusThread": "archetypal.eplus_interface.energy_plus",
+    "EnergyPlusProcessError": "archetypal.eplus_interface.exceptions",
+    "EnergyPlusVersionError": "archetypal.eplus_interface.exceptions",
+    "EnergyPlusWeatherError": "archetypal.eplus_interface.exceptions",
+    "InvalidEnergyPlusVersion": "archetypal.eplus_interface.exceptions",
+    "ExpandObjectsThread": "archetypal.eplus_interface.expand_objects",
+    "SlabThread": "archetypal.eplus_interface.slab",
+    "TransitionThread": "archetypal.eplus_interface.transition",
+    "EnergyPlusVersion": "archetypal.eplus_interface.version",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -4,14 +4,17 @@ import logging as lg
 import shutil
 import subprocess
 import time
-from io import StringIO
 from threading import Thread
 
 from packaging.version import Version
 from path import Path
 from tqdm.contrib.logging import tqdm_logging_redirect
 
+from .. import settings
 from ..eplus_interface.exceptions import EnergyPlusProcessError
+from ..eplus_interface.ground_heat_transfer import _ght_cache, ght_digest
+from ..eplus_interface.output import OutputConsumer, log_tail
+from ..eplus_interface.staging import stage_file
 from ..utils import log
 
 
@@ -36,6 +39,7 @@ class BasementThread(Thread):
         self.exception = None
         self.name = "RunBasement_" + self.idf.name
         self.include = None
+        self.digest = None
 
     @property
     def cmd(self):
@@ -46,22 +50,33 @@ class BasementThread(Thread):
     def run(self):
         """Wrapper around the Basement command line interface."""
 
+        if "BasementGHTIn.idf" not in [Path(file).basename() for file in self.idf.include]:
+            self.cleanup_callback()
+            return
+
+        # Identical calculations are read from the cache; the subprocess is skipped.
+        if settings.cache_ground_heat_transfer:
+            self.digest = ght_digest("Basement", self.idf.file_version, self.idf.include, self.idf.epw)
+            ep_objects = _ght_cache().get(self.digest)
+            if ep_objects is not None:
+                self.msg_callback("Basement results found in cache")
+                self.add_ep_objects(ep_objects)
+                self.cleanup_callback()
+                return
+
         # Move files into place
-        self.epw = self.idf.epw.copy(self.run_dir / "in.epw").expand()
+        self.epw = stage_file(self.idf.epw, self.run_dir / "in.epw")
         self.idfname = Path(self.idf.savecopy(self.run_dir / "in.idf")).expand()
-        self.idd = self.idf.iddname.copy(self.run_dir).expand()
+        self.idd = stage_file(self.idf.iddname, self.run_dir)
 
         # Get executable using shutil.which
         basement_exe = shutil.which("Basement", path=self.eplus_home)
-        self.basement_exe = Path(basement_exe).copy(self.run_dir)
-        self.basement_idd = (self.eplus_home / "BasementGHT.idd").copy(self.run_dir)
+        self.basement_exe = stage_file(basement_exe, self.run_dir)
+        self.basement_idd = stage_file(self.eplus_home / "BasementGHT.idd", self.run_dir)
         self.outfile = self.idf.name
 
         # The BasementGHTin.idf file is copied from the self.include list
-        self.include = [Path(file).copy(self.run_dir) for file in self.idf.include]
-        if "BasementGHTIn.idf" not in [p.basename() for p in self.include]:
-            self.cleanup_callback()
-            return
+        self.include = [stage_file(file, self.run_dir) for file in self.idf.include]
 
         # Run Basement Program
         self.p = subprocess.Popen(
@@ -74,13 +89,10 @@ class BasementThread(Thread):
         start_time = time.time()
         self.msg_callback("Begin Basement Temperature Calculation processing . . .")
 
-        # Read stdout line by line
+        # Read stdout in chunks
         loggers = [lg.getLogger("archetypal")]
         with tqdm_logging_redirect(desc=f"{basement_exe} {self.idf.name}", loggers=loggers) as pbar:
-            for line in iter(self.p.stdout.readline, b""):
-                decoded_line = line.decode("utf-8").strip()
-                self.msg_callback(decoded_line)
-                pbar.update()
+            OutputConsumer(self.p.stdout, self.run_dir / "Basement.stdout", self.msg_callback, progress=pbar).consume()
 
         # Process stderr after stdout is fully read
         stderr = self.p.stderr.read()
@@ -103,6 +115,7 @@ class BasementThread(Thread):
                     self.msg_callback(line, level=lg.ERROR)
             else:
                 self.msg_callback("Basement failed")
+                log_tail(self.run_dir / "Basement.stdout", self.msg_callback)
                 self.msg_callback("\n".join(stderr_lines), level=lg.ERROR)
                 self.failure_callback()
 
@@ -112,27 +125,20 @@ class BasementThread(Thread):
 
     def success_callback(self):
         """Parse surface temperature and append to IDF file."""
-        for ep_objects in self.run_dir.glob("EPObjects*"):
-            if ep_objects.exists():
-                with open(ep_objects) as f:
-                    basement_models = self.idf.__class__(
-                        StringIO(f.read()),
-                        file_version=self.idf.file_version,
-                        as_version=self.idf.as_version,
-                        prep_outputs=False,
-                    )
-                # Loop on all objects and using self.newidfobject
-                added_objects = []
-                for sequence in basement_models.idfobjects.values():
-                    for obj in sequence:
-                        data = obj.to_dict()
-                        key = data.pop("key")
-                        added_objects.append(self.idf.newidfobject(key=key.upper(), **data))
-                del basement_models  # remove loaded_string model
-            else:
-                self.msg_callback("No EPObjects file found", level=lg.WARNING)
+        ep_objects = [f.read_text() for f in sorted(self.run_dir.glob("EPObjects*"))]
+        if ep_objects:
+            ep_objects = "\n".join(ep_objects)
+            if self.digest is not None:
+                _ght_cache().set(self.digest, ep_objects)
+            self.add_ep_objects(ep_objects)
+        else:
+            self.msg_callback("No EPObjects file found", level=lg.WARNING)
         self.cleanup_callback()
 
+    def add_ep_objects(self, ep_objects):
+        """Append the objects of the EPObjects idf snippet to the IDF file."""
+        self.idf.addidfobjects_from_string(ep_objects)
+
     def cleanup_callback(self):
         """clean up temp files, directories and variables that need cleanup."""
 
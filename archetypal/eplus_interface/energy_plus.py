@@ -15,6 +15,8 @@ from archetypal.eplus_interface.exceptions import (
     EnergyPlusProcessError,
     EnergyPlusVersionError,
 )
+from archetypal.eplus_interface.output import OutputConsumer, log_tail
+from archetypal.eplus_interface.staging import publish_dir, stage_file
 from archetypal.eplus_interface.version import EnergyPlusVersion
 from archetypal.utils import log
 
@@ -150,6 +152,7 @@ class EnergyPlusThread(Thread):
         self.exception = None
         self.name = "EnergyPlus_" + self.idf.name
         self.tmp = tmp
+        self.progress = None
 
     def stop(self):
         self.msg_callback("Attempting to cancel simulation ...")
@@ -165,11 +168,11 @@ class EnergyPlusThread(Thread):
         # get version from IDF object or by parsing the IDF file for it
 
         tmp = self.tmp
-        self.epw = Path(self.idf.epw.copy(tmp)).expand()
+        self.epw = stage_file(self.idf.epw, tmp)
         self.idfname = Path(self.idf.savecopy(tmp / self.idf.name)).expand()
-        self.idd = Path(self.idf.iddname.copy(tmp)).expand()
+        self.idd = stage_file(self.idf.iddname, tmp)
         self.run_dir = Path(tmp).expand()
-        self.include = [Path(file).copy(tmp) for file in self.idf.include]
+        self.include = [stage_file(file, tmp) for file in self.idf.include]
 
         # build a list of command line arguments
         try:
@@ -214,11 +217,10 @@ class EnergyPlusThread(Thread):
             )
             start_time = time.time()
             self.msg_callback("Simulation started")
-            self.idf._energyplus_its = 0  # reset counter
-            for line in self.p.stdout:
-                self.msg_callback(line.decode("utf-8").strip("\n"))
-                self.idf._energyplus_its += 1
-                progress.update()
+            # the full output goes to a file; only summary lines are logged
+            stdout = self.run_dir / f"{self.idf.output_prefix}out.stdout"
+            self.progress = OutputConsumer(self.p.stdout, stdout, self.msg_callback, progress=progress).consume()
+            self.idf._energyplus_its = self.progress.lines
 
             # We explicitly close stdout
             self.p.stdout.close()
@@ -236,6 +238,7 @@ class EnergyPlusThread(Thread):
                     self.success_callback()
                 else:
                     self.msg_callback("Simulation failed")
+                    log_tail(stdout, self.msg_callback)
                     self.failure_callback()
 
     def msg_callback(self, *args, **kwargs):
@@ -248,8 +251,7 @@ class EnergyPlusThread(Thread):
         save_dir = self.idf.simulation_dir
         if self.idf.keep_data:
             try:
-                save_dir.rmtree_p()  # purge target dir
-                self.run_dir.copytree(save_dir)  # copy files
+                publish_dir(self.run_dir, save_dir)  # replace target dir
             except PermissionError:
                 pass
             else:
@@ -265,13 +267,11 @@ class EnergyPlusThread(Thread):
             with open(error_filename) as stderr:
                 stderr_r = stderr.read()
             if self.idf.keep_data_err:
-                failed_dir = self.idf.simulation_dir.mkdir_p()
+                failed_dir = self.idf.simulation_dir
                 try:
-                    failed_dir.rmtree_p()
+                    publish_dir(self.run_dir, failed_dir)
                 except PermissionError:
                     log(f"Could not remove {failed_dir}")
-                else:
-                    self.run_dir.copytree(failed_dir)  # no need to create folder before
             self.exception = EnergyPlusProcessError(cmd=self.cmd, stderr=stderr_r, idf=self.idf)
         except FileNotFoundError:
             self.exception = CalledProcessError(self.p.returncode, cmd=self.cmd, stderr=self.p.stderr)
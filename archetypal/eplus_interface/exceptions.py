@@ -1,5 +1,4 @@
 from packaging.version import InvalidVersion
-from tabulate import tabulate
 
 
 class EnergyPlusProcessError(Exception):
@@ -27,6 +26,8 @@ class EnergyPlusProcessError(Exception):
         return msg
 
     def write(self):
+        from tabulate import tabulate
+
         # create and add headers
         invalid = [{"Filename": self.idf, "Error": self.stderr}]
         return tabulate(invalid, headers="keys")
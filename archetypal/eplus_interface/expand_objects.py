@@ -4,7 +4,6 @@ import logging as lg
 import shutil
 import subprocess
 import time
-from io import StringIO
 from subprocess import CalledProcessError
 from threading import Thread
 
@@ -13,6 +12,8 @@ from path import Path
 from tqdm.contrib.logging import tqdm_logging_redirect
 
 from archetypal.eplus_interface.energy_plus import EnergyPlusProgram
+from archetypal.eplus_interface.output import OutputConsumer, log_tail
+from archetypal.eplus_interface.staging import stage_file
 from archetypal.utils import log
 
 
@@ -50,9 +51,9 @@ class ExpandObjectsThread(Thread):
         """Wrapper around the ExpandObject command line interface."""
 
         # Move files into place
-        self.epw = self.idf.epw.copy(self.run_dir / "in.epw").expand() if self.idf.epw else None
+        self.epw = stage_file(self.idf.epw, self.run_dir / "in.epw") if self.idf.epw else None
         self.idfname = Path(self.idf.savecopy(self.run_dir / "in.idf")).expand()
-        self.idd = self.idf.iddname.copy(self.run_dir / "Energy+.idd").expand()
+        self.idd = stage_file(self.idf.iddname, self.run_dir / "Energy+.idd")
 
         # Run ExpandObjects Program
         self.p = subprocess.Popen(
@@ -65,13 +66,12 @@ class ExpandObjectsThread(Thread):
         start_time = time.time()
         self.msg_callback("Begin ExpandObjects")
 
-        # Read stdout line by line
+        # Read stdout in chunks
         loggers = [lg.getLogger("archetypal")]
         with tqdm_logging_redirect(desc=f"{self.p.args} {self.idf.name}", loggers=loggers) as pbar:
-            for line in iter(self.p.stdout.readline, b""):
-                decoded_line = line.decode("utf-8").strip()
-                self.msg_callback(decoded_line)
-                pbar.update()
+            OutputConsumer(
+                self.p.stdout, self.run_dir / "ExpandObjects.stdout", self.msg_callback, progress=pbar
+            ).consume()
 
         # Process stderr after stdout is fully read
         stderr = self.p.stderr.read()
@@ -93,7 +93,8 @@ class ExpandObjectsThread(Thread):
                 for line in stderr_lines:
                     self.msg_callback(line, level=lg.ERROR)
             else:
-                self.msg_callback("Transition failed")
+                self.msg_callback("ExpandObjects failed")
+                log_tail(self.run_dir / "ExpandObjects.stdout", self.msg_callback)
                 self.msg_callback("\n".join(stderr_lines), level=lg.ERROR)
                 self.failure_callback()
 
@@ -102,16 +103,21 @@ class ExpandObjectsThread(Thread):
         log(*args, **kwargs)
 
     def success_callback(self):
-        """Replace idf with expanded.idf."""
+        """Update the idf to the objects of expanded.idf."""
         expanded_idf = self.run_dir / "expanded.idf"
         if expanded_idf.exists():
-            self.idf.idfname = StringIO(expanded_idf.read_text())
+            # Only the expanded template objects and the objects generated from
+            # them differ; the rest of the model is not parsed again.
+            removed, added = self.idf.update_from_idf_string(expanded_idf.read_text(encoding="latin-1"))
+            self.msg_callback(f"ExpandObjects replaced {len(removed)} objects with {len(added)} objects")
+            self.idf._sql = None
+            self.idf._htm = None
 
         for filename in ["GHTIn.idf", "BasementGHTIn.idf"]:
             file_path = self.run_dir / filename
             if file_path.exists():
                 dest_path = self.idf.output_directory.makedirs_p() / filename
-                self.idf.include.append(file_path.copy(dest_path))
+                self.idf.include.append(file_path.move(dest_path))
 
     def failure_callback(self):
         """Read stderr and pass to logger."""
@@ -0,0 +1,80 @@
+"""Content-addressed cache of the ground heat transfer preprocessors results.
+
+The Basement and Slab programs iterate a ground heat transfer solver that can
+run for minutes. Their result only depends on the GHTIn input file(s), the
+weather file and the version of the program, so parametric runs that vary
+internal loads or HVAC settings can reuse the EPObjects of a previous run.
+"""
+
+import hashlib
+import os
+import uuid
+
+from path import Path
+
+from archetypal import settings
+
+
+def ght_digest(program, version, include, epw) -> str:
+    """Return the digest identifying a ground heat transfer calculation.
+
+    Args:
+        program (str): The name of the preprocessor, "Basement" or "Slab".
+        version (EnergyPlusVersion): The version of the preprocessor.
+        include (list of Path): The GHTIn input file(s) read by the program.
+        epw (Path): The weather file.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest.
+    """
+    sha = hashlib.sha256()
+    sha.update(f"{program}\0{version}\0".encode())
+    for file in sorted(include, key=lambda p: Path(p).basename()):
+        sha.update(Path(file).basename().encode() + b"\0")
+        sha.update(Path(file).read_bytes())
+        sha.update(b"\0")
+    sha.update(Path(epw).read_bytes())
+    return sha.hexdigest()
+
+
+class GroundHeatTransferCache:
+    """Local on-disk cache of the EPObjects written by Basement and Slab.
+
+    Each result is stored as an idf snippet named after its :func:`ght_digest`.
+
+    Args:
+        path (str or Path): The directory holding the cached results.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def _filename(self, digest):
+        return self.path / f"{digest}.idf"
+
+    def get(self, digest):
+        """Return the cached EPObjects of `digest`, or None on a miss."""
+        filename = self._filename(digest)
+        try:
+            return filename.read_text()
+        except FileNotFoundError:
+            return None
+
+    def set(self, digest, ep_objects):
+        """Store the EPObjects text computed for `digest`."""
+        self.path.makedirs_p()
+        # Write to a temporary file first so that concurrent runs never read a
+        # partially written result.
+        tmp = self.path / f"{digest}.{uuid.uuid4().hex[:8]}.tmp"
+        tmp.write_text(ep_objects)
+        os.replace(tmp, self._filename(digest))
+
+    def clear(self):
+        """Delete all the cached results."""
+        for filename in self.path.glob("*.idf"):
+            filename.remove_p()
+
+
+def _ght_cache():
+    """Return the GroundHeatTransferCache configured by the package settings."""
+    return GroundHeatTransferCache(Path(settings.cache_folder) / "ground_heat_transfer")
@@ -0,0 +1,164 @@
+"""Buffered consumption of the standard output of the EnergyPlus programs.
+
+EnergyPlus prints a line for every warmup day and every simulated day. Reading
+it line by line, decoding each line and passing it to the logger keeps the
+python thread busy and floods the log handlers on long runs. The output is
+instead read in chunks and written as is to a file; only the lines marking a
+new phase of the run are parsed into a :class:`ProgressState` and logged.
+
+The other programs (Basement, Slab, ExpandObjects and Transition) print none of
+these markers; when one of them fails, :func:`log_tail` logs the end of its
+output, where the program reports the error.
+"""
+
+import logging as lg
+import re
+
+# lines passed to the logger, e.g. the start of an environment or the end of the run.
+SUMMARY_PREFIXES = (
+    b"EnergyPlus Starting",
+    b"Initializing New Environment Parameters",
+    b"Performing Zone Sizing Simulation",
+    b"Calculating System sizing",
+    b"Starting Simulation at ",
+    b"Writing final SQL reports",
+    b"EnergyPlus Run Time",
+    b"EnergyPlus Completed",
+    b"EnergyPlus Terminated",
+    b"**FATAL",
+)
+
+# a single pass of the regex engine finds the few summary lines of a chunk.
+_SUMMARY = re.compile(rb"^[ \t]*((?:" + b"|".join(map(re.escape, SUMMARY_PREFIXES)) + rb")[^\r\n]*)", re.MULTILINE)
+
+CHUNK_SIZE = 2**16
+
+# lines of the output logged by log_tail when a program fails.
+TAIL_LINES = 20
+
+
+class ProgressState:
+    """The progress of a run, as parsed from its standard output.
+
+    Attributes:
+        lines (int): The number of lines printed so far.
+        environment (str): The environment being simulated, e.g. "RUN PERIOD 1".
+        warmup_days (int): The number of warmup days of the current environment.
+        date (str): The last date reported, e.g. "02/01".
+        completed (bool): True once the program reported its successful end.
+        fatal (bool): True if the program reported a fatal error.
+    """
+
+    def __init__(self):
+        self.lines = 0
+        self.environment = None
+        self.warmup_days = 0
+        self.date = None
+        self.completed = False
+        self.fatal = False
+
+    def update(self, line):
+        """Update the state from a progress or summary line.
+
+        Args:
+            line (str): The decoded line, without its line ending.
+        """
+        if line.startswith("Warming up"):
+            self.warmup_days += 1
+        elif line.startswith("Initializing New Environment Parameters"):
+            self.warmup_days = 0
+        elif line.startswith(("Starting Simulation at ", "Continuing Simulation at ")):
+            at, _, environment = line.partition(" at ")[2].partition(" for ")
+            self.date = at
+            self.environment = environment
+        elif line.startswith("EnergyPlus Completed"):
+            self.completed = True
+        elif line.startswith(("EnergyPlus Terminated", "**FATAL")):
+            self.fatal = True
+
+    def __repr__(self):
+        return f"ProgressState(environment={self.environment!r}, date={self.date!r}, lines={self.lines})"
+
+
+class OutputConsumer:
+    """Copy the standard output of a program to a file and track its progress.
+
+    Args:
+        stream (io.BufferedReader): The stdout of the subprocess.
+        filename (Path): The file receiving the full output.
+        msg_callback (callable): Called with each summary line and a level keyword.
+        progress (tqdm, optional): A progress bar updated with the number of lines.
+    """
+
+    def __init__(self, stream, filename, msg_callback, progress=None):
+        self.stream = stream
+        self.filename = filename
+        self.msg_callback = msg_callback
+        self.progress = progress
+        self.state = ProgressState()
+
+    def consume(self) -> ProgressState:
+        """Read the stream until it is closed by the program.
+
+        Returns:
+            ProgressState: The state at the end of the output.
+        """
+        read = getattr(self.stream, "read1", self.stream.read)
+        remainder = b""
+        with open(self.filename, "wb") as f:
+            for chunk in iter(lambda: read(CHUNK_SIZE), b""):
+                f.write(chunk)
+                # lines split between two chunks are parsed with the next one.
+                text, newline, remainder = (remainder + chunk).rpartition(b"\n")
+                if newline:
+                    self._parse(text + newline)
+            if remainder:
+                self._parse(remainder)
+        self.msg_callback(f"Standard output written to {self.filename}", level=lg.DEBUG)
+        return self.state
+
+    def _parse(self, text):
+        start = 0
+        for match in _SUMMARY.finditer(text):
+            self._parse_progress(text, start, match.start())
+            line = match.group(1)
+            decoded = line.decode("utf-8", errors="replace").strip()
+            self.state.update(decoded)
+            level = lg.ERROR if line.startswith((b"**FATAL", b"EnergyPlus Terminated")) else lg.INFO
+            self.msg_callback(decoded, level=level)
+            start = match.end()
+        self._parse_progress(text, start, len(text))
+        lines = text.count(b"\n") + (not text.endswith(b"\n"))
+        self.state.lines += lines
+        if self.progress is not None:
+            self.progress.update(lines)
+
+    def _parse_progress(self, text, start, end):
+        """Update the state from the progress lines of text[start:end], without splitting it."""
+        self.state.warmup_days += text.count(b"Warming up", start, end)
+        last = text.rfind(b"Continuing Simulation at ", start, end)
+        if last >= 0:
+            line_end = text.find(b"\n", last, end)
+            line = text[last : line_end if line_end >= 0 else end]
+            self.state.update(line.decode("utf-8", errors="replace").strip())
+
+
+def log_tail(filename, msg_callback, lines=TAIL_LINES):
+    """Log the last lines written by a program, e.g. after it returned an error.
+
+    Args:
+        filename (Path): The file written by :meth:`OutputConsumer.consume`.
+        msg_callback (callable): Called with the lines and a level keyword.
+        lines (int): The number of lines to log.
+    """
+    try:
+        with open(filename, "rb") as f:
+            # the error is at the end of the output; skip the days already simulated.
+            f.seek(0, 2)
+            f.seek(max(f.tell() - CHUNK_SIZE, 0))
+            tail = f.read().splitlines()[-lines:]
+    except OSError:
+        return
+    if tail:
+        text = b"\n".join(tail).decode("utf-8", errors="replace")
+        msg_callback(f"Last lines of {filename}:\n{text}", level=lg.ERROR)
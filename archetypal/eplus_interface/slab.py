@@ -4,14 +4,17 @@ import logging as lg
 import shutil
 import subprocess
 import time
-from io import StringIO
 from threading import Thread
 
 from packaging.version import Version
 from path import Path
 from tqdm.contrib.logging import tqdm_logging_redirect
 
+from archetypal import settings
 from archetypal.eplus_interface.exceptions import EnergyPlusProcessError
+from archetypal.eplus_interface.ground_heat_transfer import _ght_cache, ght_digest
+from archetypal.eplus_interface.output import OutputConsumer, log_tail
+from archetypal.eplus_interface.staging import stage_file
 from archetypal.utils import log
 
 
@@ -36,6 +39,7 @@ class SlabThread(Thread):
         self.exception = None
         self.name = "RunSlab_" + self.idf.name
         self.include = None
+        self.digest = None
 
     @property
     def cmd(self):
@@ -46,22 +50,33 @@ class SlabThread(Thread):
     def run(self):
         """Wrapper around the Slab command line interface."""
 
+        if not self.idf.include:
+            self.cleanup_callback()
+            return
+
+        # Identical calculations are read from the cache; the subprocess is skipped.
+        if settings.cache_ground_heat_transfer:
+            self.digest = ght_digest("Slab", self.idf.file_version, self.idf.include, self.idf.epw)
+            ep_objects = _ght_cache().get(self.digest)
+            if ep_objects is not None:
+                self.msg_callback("Slab results found in cache")
+                self.add_ep_objects(ep_objects)
+                self.cleanup_callback()
+                return
+
         # Move files into place
-        self.epw = self.idf.epw.copy(self.run_dir / "in.epw").expand()
+        self.epw = stage_file(self.idf.epw, self.run_dir / "in.epw")
         self.idfname = Path(self.idf.savecopy(self.run_dir / "in.idf")).expand()
-        self.idd = self.idf.iddname.copy(self.run_dir).expand()
+        self.idd = stage_file(self.idf.iddname, self.run_dir)
 
         # Get executable using shutil.which
         slab_exe = shutil.which("Slab", path=self.eplus_home)
-        self.slabexe = Path(slab_exe).copy(self.run_dir)
-        self.slabidd = (self.eplus_home / "SlabGHT.idd").copy(self.run_dir)
+        self.slabexe = stage_file(slab_exe, self.run_dir)
+        self.slabidd = stage_file(self.eplus_home / "SlabGHT.idd", self.run_dir)
         self.outfile = self.idf.name
 
         # The GHTin.idf file is copied from the self.include list
-        self.include = [Path(file).copy(self.run_dir) for file in self.idf.include]
-        if not self.include:
-            self.cleanup_callback()
-            return
+        self.include = [stage_file(file, self.run_dir) for file in self.idf.include]
 
         # Run Slab Program
         self.p = subprocess.Popen(
@@ -74,13 +89,10 @@ class SlabThread(Thread):
         start_time = time.time()
         self.msg_callback("Begin Slab Temperature Calculation processing . . .")
 
-        # Read stdout line by line
+        # Read stdout in chunks
         loggers = [lg.getLogger("archetypal")]
         with tqdm_logging_redirect(desc=f"RunSlab-{self.idf.name}", loggers=loggers) as pbar:
-            for line in iter(self.p.stdout.readline, b""):
-                decoded_line = line.decode("utf-8").strip()
-                self.msg_callback(decoded_line)
-                pbar.update()
+            OutputConsumer(self.p.stdout, self.run_dir / "Slab.stdout", self.msg_callback, progress=pbar).consume()
 
         # Process stderr after stdout is fully read
         stderr = self.p.stderr.read()
@@ -103,6 +115,7 @@ class SlabThread(Thread):
                     self.msg_callback(line)
             else:
                 self.msg_callback("Slab failed", level=lg.ERROR)
+                log_tail(self.run_dir / "Slab.stdout", self.msg_callback)
                 self.msg_callback("\n".join(stderr_lines), level=lg.ERROR)
                 self.failure_callback()
 
@@ -112,28 +125,20 @@ class SlabThread(Thread):
 
     def success_callback(self):
         """Parse surface temperature and append to IDF file."""
-        for temp_schedule in self.run_dir.glob("SLABSurfaceTemps*"):
-            if temp_schedule.exists():
-                with open(temp_schedule) as f:
-                    slab_models = self.idf.__class__(
-                        StringIO(f.read()),
-                        file_version=self.idf.file_version,
-                        as_version=self.idf.as_version,
-                        prep_outputs=False,
-                    )
-                # Loop on all objects and using self.newidfobject
-                added_objects = []
-                for sequence in slab_models.idfobjects.values():
-                    if sequence:
-                        for obj in sequence:
-                            data = obj.to_dict()
-                            key = data.pop("key")
-                            added_objects.append(self.idf.newidfobject(key=key.upper(), **data))
-                del slab_models  # remove loaded_string model
-            else:
-                self.msg_callback("No SLABSurfaceTemps.txt file found.", level=lg.ERROR)
+        ep_objects = [f.read_text() for f in sorted(self.run_dir.glob("SLABSurfaceTemps*"))]
+        if ep_objects:
+            ep_objects = "\n".join(ep_objects)
+            if self.digest is not None:
+                _ght_cache().set(self.digest, ep_objects)
+            self.add_ep_objects(ep_objects)
+        else:
+            self.msg_callback("No SLABSurfaceTemps.txt file found.", level=lg.ERROR)
         self.cleanup_callback()
 
+    def add_ep_objects(self, ep_objects):
+        """Append the objects of the SLABSurfaceTemps idf snippet to the IDF file."""
+        self.idf.addidfobjects_from_string(ep_objects)
+
     def cleanup_callback(self):
         """clean up temp files, directories and variables that need cleanup."""
 
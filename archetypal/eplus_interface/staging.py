@@ -0,0 +1,135 @@
+"""Staging of the run directories of the EnergyPlus programs.
+
+The weather file, the IDD, the include files and the executables are only read
+by the programs. They are linked into the run directory instead of copied
+whenever the file system allows it: a reflink (copy-on-write clone) first,
+then a hardlink and only then a plain copy. The results are moved into the
+simulation directory instead of being copied back.
+"""
+
+import errno
+import os
+import shutil
+import uuid
+
+from path import Path
+
+from archetypal import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request cloning a whole file on Linux (btrfs, xfs, ...).
+FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    """Clone `src` to `dst` sharing the same data blocks. Raise OSError if unsupported."""
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "reflinks are not supported on this platform")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def stage_file(src, dst):
+    """Place the read-only input `src` at `dst` with the cheapest available method.
+
+    Args:
+        src (str or Path): The input file.
+        dst (str or Path): The destination file or directory.
+
+    Returns:
+        Path: The staged file.
+    """
+    src = Path(src)
+    dst = Path(dst)
+    if dst.is_dir():
+        dst = dst / src.basename()
+    if dst.exists():
+        dst.remove()
+    for link in (_reflink, os.link):
+        try:
+            link(src, dst)
+        except OSError:
+            continue
+        return dst.expand()
+    return Path(shutil.copy2(src, dst)).expand()
+
+
+def stage_tree(src, dst):
+    """Stage all the files of the directory `src` into the directory `dst`.
+
+    Args:
+        src (str or Path): The directory to stage.
+        dst (str or Path): The destination directory, created if needed.
+
+    Returns:
+        Path: The destination directory.
+    """
+    return Path(shutil.copytree(src, dst, copy_function=stage_file, dirs_exist_ok=True))
+
+
+def publish_dir(run_dir, dst):
+    """Move the run directory to `dst`, replacing the previous content of `dst`.
+
+    The directory is renamed in one operation when both are on the same file
+    system. Otherwise, it is copied next to `dst` first and then renamed, so
+    `dst` never holds a partial result.
+
+    Args:
+        run_dir (str or Path): The directory holding the results of a program.
+        dst (str or Path): The simulation directory.
+
+    Returns:
+        Path: The simulation directory.
+    """
+    run_dir = Path(run_dir)
+    dst = Path(dst)
+    dst.parent.makedirs_p()
+    suffix = uuid.uuid4().hex[:8]
+    old = None
+    if dst.exists():
+        old = dst.parent / f".{dst.name}.{suffix}.old"
+        os.replace(dst, old)
+    try:
+        try:
+            os.replace(run_dir, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            tmp = dst.parent / f".{dst.name}.{suffix}.tmp"
+            shutil.copytree(run_dir, tmp)
+            os.replace(tmp, dst)
+            shutil.rmtree(run_dir, ignore_errors=True)
+    except OSError:
+        if old is not None:
+            os.replace(old, dst)
+        raise
+    if old is not None:
+        shutil.rmtree(old, ignore_errors=True)
+    return dst
+
+
+def make_run_dir(output_directory, prefix):
+    """Create a unique run directory for a program.
+
+    The directory is created in :attr:`settings.run_folder` when it is set (e.g.
+    a tmpfs mount on a batch farm), and in `output_directory` otherwise.
+
+    Args:
+        output_directory (Path): The output directory of the model.
+        prefix (str): The prefix of the directory name, e.g. "eplus_run_".
+
+    Returns:
+        Path: The new, empty, directory.
+    """
+    parent = Path(settings.run_folder or output_directory).expand().makedirs_p()
+    return (parent / prefix + uuid.uuid4().hex[:8]).mkdir()
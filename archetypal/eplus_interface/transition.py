@@ -1,7 +1,6 @@
 """Transition module."""
 
 import logging as lg
-import os
 import platform
 import re
 import shutil
@@ -21,6 +20,8 @@ from archetypal.eplus_interface.exceptions import (
     EnergyPlusProcessError,
     EnergyPlusVersionError,
 )
+from archetypal.eplus_interface.output import OutputConsumer, log_tail
+from archetypal.eplus_interface.staging import stage_file, stage_tree
 from archetypal.eplus_interface.version import EnergyPlusVersion
 from archetypal.utils import log
 
@@ -87,21 +88,12 @@ class TransitionExe(EnergyPlusProgram):
     def trans_exec(self) -> dict:
         """Return dict of {EnergyPlusVersion: executable} for each transition."""
 
-        def copytree(src, dst, symlinks=False, ignore=None):
-            for item in os.listdir(src):
-                s = os.path.join(src, item)
-                d = os.path.join(dst, item)
-                try:
-                    if os.path.isdir(s):
-                        shutil.copytree(s, d, symlinks, ignore)
-                    else:
-                        shutil.copy2(s, d)
-                except FileNotFoundError as e:
-                    time.sleep(60)
-                    log(f"{e}")
-
         if self._trans_exec is None:
-            copytree(self.idf.idfversionupdater_dir, self.running_directory)
+            try:
+                stage_tree(self.idf.idfversionupdater_dir, self.running_directory)
+            except (FileNotFoundError, shutil.Error) as e:
+                time.sleep(60)
+                log(f"{e}")
             self._trans_exec = {
                 EnergyPlusVersion(re.search(r"to-V(([\d]*?)-([\d]*?)-([\d]))", execution).group(1)): execution
                 for execution in self.running_directory.files("Transition-V*")
@@ -162,7 +154,7 @@ class TransitionThread(Thread):
 
         # Move files into place
         self.idfname = Path(self.idf.savecopy(self.run_dir / "in.idf")).expand()
-        self.idd = self.idf.iddname.copy(self.run_dir).expand()
+        self.idd = stage_file(self.idf.iddname, self.run_dir)
 
         generator = TransitionExe(self.idf, tmp_dir=self.run_dir)
         try:
@@ -196,13 +188,11 @@ class TransitionThread(Thread):
             )
             start_time = time.time()
 
-            # Read stdout line by line
+            # Read stdout in chunks
             loggers = [lg.getLogger("archetypal")]
             with tqdm_logging_redirect(desc=f"To v{transition.trans}-{self.idf.name}", loggers=loggers) as pbar:
-                for line in iter(self.p.stdout.readline, b""):
-                    decoded_line = line.decode("utf-8").strip()
-                    self.msg_callback(decoded_line)
-                    pbar.update()
+                stdout = self.run_dir / f"Transition-{transition.trans.dash}.stdout"
+                OutputConsumer(self.p.stdout, stdout, self.msg_callback, progress=pbar).consume()
 
             # We explicitly close stdout
             self.p.stdout.close()
@@ -226,6 +216,7 @@ class TransitionThread(Thread):
                     # transition to.
                     self.idf.as_version = last_successful_transition
                     self.msg_callback("Transition failed")
+                    log_tail(stdout, self.msg_callback)
                     self.failure_callback()
 
     def stop(self):
@@ -537,47 +537,90 @@ class EndUseBalance:
             index=system.index,
         )
 
-    def separate_gains_and_losses(self, component, level="Key_Name") -> EnergyDataFrame:
+    def separate_gains_and_losses(self, component, level="Key_Name", freq=None) -> EnergyDataFrame:
         """Separate gains from losses when cooling and heating occurs for the component.
 
+        The component is processed as a single (time x column) float array: each
+        period mask is applied in place to one working buffer and the gains and
+        losses are clipped straight into a preallocated output array, so memory
+        stays proportional to the component itself rather than to the
+        intermediate pandas frames.
+
         Args:
-            component (str):
-            level (str or list):
+            component (str): Name of the EndUseBalance attribute to separate
+                (e.g. "opaque_flow").
+            level (str or list): The column level of the component matching the
+                zone names of the heating and cooling period masks.
+            freq (str, optional): If "M" (monthly) or "Y" (annual), timesteps
+                are summed over each month or year with :func:`numpy.add.reduceat`
+                before being returned. Defaults to None (no aggregation).
 
         Returns:
-
+            EnergyDataFrame: The component with two additional column levels,
+                "Period" (Cooling Periods, Heating Periods) and "Gain/Loss" (Heat
+                Gain, Heat Loss), sorted on the column axis.
         """
         assert component in self.__dict__, f"{component} is not a valid attribute of EndUseBalance."
         component_df = getattr(self, component)
         assert not component_df.empty, "Expected a component that is not empty."
-        print(component)
-
-        c_df = getattr(self, component)
+        if isinstance(level, (list, tuple)):
+            (level,) = level
+
+        # sort the columns once so the output needs no reordering.
+        order = component_df.columns.argsort()
+        columns = component_df.columns[order]
+        keys = columns.get_level_values(level)
+        n_steps, n_columns = component_df.shape
+
+        index, bounds = self._aggregation_bounds(component_df.index, freq)
+        periods = {"Cooling Periods": self.is_cooling, "Heating Periods": self.is_heating}
+        out = np.empty((len(index), n_columns, len(periods), 2))
+        buffer = np.empty((n_steps, n_columns))
+        clipped = np.empty_like(buffer) if bounds is not None else None
+        values = component_df.to_numpy(dtype=float)
+        for i, mask in enumerate(periods.values()):
+            np.take(values, order, axis=1, out=buffer)
+            mask = mask.reindex(index=component_df.index, columns=keys, fill_value=False)
+            np.multiply(buffer, mask.to_numpy(dtype=bool), out=buffer)
+            for j, (a_min, a_max) in enumerate(((0, None), (None, 0))):  # Heat Gain, Heat Loss
+                if bounds is None:
+                    np.clip(buffer, a_min, a_max, out=out[:, :, i, j])
+                else:
+                    np.clip(buffer, a_min, a_max, out=clipped)
+                    np.add.reduceat(clipped, bounds, axis=0, out=out[:, :, i, j])
 
-        # concatenate the Periods
-        inter = pd.concat(
-            [
-                c_df.mul(self.is_cooling.rename_axis(level, axis=1), level=level),
-                c_df.mul(self.is_heating.rename_axis(level, axis=1), level=level),
-            ],
-            keys=["Cooling Periods", "Heating Periods"],
-            names=["Period"],
+        frame = columns.to_frame(index=False).iloc[np.repeat(np.arange(n_columns), 2 * len(periods))]
+        frame["Period"] = np.tile(np.repeat(list(periods), 2), n_columns)
+        frame["Gain/Loss"] = np.tile(["Heat Gain", "Heat Loss"], len(periods) * n_columns)
+        return EnergyDataFrame(
+            out.reshape(len(index), -1),
+            columns=pd.MultiIndex.from_frame(frame),
+            index=index,
+            units=getattr(component_df, "units", None),
         )
 
-        # mask when values are positive (gain)
-        positive_mask = inter >= 0
+    @staticmethod
+    def _aggregation_bounds(index, freq=None):
+        """Return the aggregated index and the start position of each group.
 
-        # concatenate the Gain/Loss
-        final = pd.concat(
-            [
-                inter[positive_mask].reindex(inter.index),
-                inter[~positive_mask].reindex(inter.index),
-            ],
-            keys=["Heat Gain", "Heat Loss"],
-            names=["Gain/Loss"],
-        ).unstack(["Period", "Gain/Loss"])
-        final.sort_index(axis=1, inplace=True)
-        return final
+        Args:
+            index (pd.DatetimeIndex): The timesteps of a component.
+            freq (str, optional): "M" (monthly), "Y" (annual) or None.
+
+        Returns:
+            tuple: The index of the returned data and the start positions to pass
+                to :func:`numpy.add.reduceat`, or None if no aggregation occurs.
+        """
+        if freq is None:
+            return index, None
+        if freq.upper() == "M":
+            codes = np.asarray(index.year * 12 + index.month)
+        elif freq.upper() in ("Y", "A"):
+            codes = np.asarray(index.year)
+        else:
+            raise ValueError(f"freq='{freq}': expected one of 'M', 'Y' or None.")
+        bounds = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        return index[bounds], bounds
 
     def to_df(self, separate_gains_and_losses=False, level="KeyValue"):
         """Summarize components into a DataFrame."""
@@ -654,44 +697,23 @@ class EndUseBalance:
 
     def component_summary(self) -> EnergyDataFrame:
         """Return a DataFrame of components summarized annually."""
-        sum_opaque_flow = (
-            self.separate_gains_and_losses("opaque_flow", "Zone_Name")
-            .sum()
-            .groupby(level=["Period", "Gain/Loss"])
-            .sum()
-        )
-        sum_window_flow = (
-            self.separate_gains_and_losses("window_flow", "Zone_Name")
-            .sum()
-            .groupby(level=["Period", "Gain/Loss"])
-            .sum()
-        )
-        sum_solar_gain = self.separate_gains_and_losses("solar_gain").sum().groupby(level=["Period", "Gain/Loss"]).sum()
-        sum_lighting = self.separate_gains_and_losses("lighting").sum().groupby(level=["Period", "Gain/Loss"]).sum()
-        sum_infiltration = (
-            self.separate_gains_and_losses("infiltration").sum().groupby(level=["Period", "Gain/Loss"]).sum()
-        )
-        sum_people_gain = (
-            self.separate_gains_and_losses("people_gain").sum().groupby(level=["Period", "Gain/Loss"]).sum()
-        )
-
+        components = {
+            "Opaque Conduction": ("opaque_flow", "Zone_Name"),
+            "Window Conduction": ("window_flow", "KeyValue"),
+            "Window Solar Gains": ("solar_gain", "KeyValue"),
+            "Lighting": ("lighting", "KeyValue"),
+            "Infiltration": ("infiltration", "KeyValue"),
+            "Occupants (Sensible + Latent)": ("people_gain", "KeyValue"),
+        }
         df = pd.concat(
             [
-                sum_opaque_flow,
-                sum_window_flow,
-                sum_solar_gain,
-                sum_lighting,
-                sum_infiltration,
-                sum_people_gain,
-            ],
-            keys=[
-                "Opaque Conduction",
-                "Window Conduction",
-                "Window Solar Gains",
-                "Lighting",
-                "Infiltration",
-                "Occupants (Sensible + Latent)",
+                self.separate_gains_and_losses(component, level, freq="Y")
+                .sum()
+                .groupby(level=["Period", "Gain/Loss"])
+                .sum()
+                for component, level in components.values()
             ],
+            keys=list(components),
         )
 
         return df.unstack(level=["Period", "Gain/Loss"])
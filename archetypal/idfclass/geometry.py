@@ -0,0 +1,220 @@
+"""Vectorized surface geometry for IDF models."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+import numpy as np
+
+CARDINAL_ANGLES = (0, 90, 180, 270)
+
+# Surface type implied by the key of surface objects that have no `Surface_Type`
+# field, e.g. WALL:DETAILED.
+_IMPLIED_SURFACE_TYPES = {
+    "WALL:DETAILED": "wall",
+    "ROOFCEILING:DETAILED": "roof",
+    "FLOOR:DETAILED": "floor",
+}
+
+
+class SurfaceGeometry:
+    """Geometry table of the detailed surfaces and subsurfaces of an IDF model.
+
+    The vertices of every surface and subsurface are packed once into a padded
+    array of shape (n, max_vertices, 3). Normals, areas, tilts and azimuths are
+    then computed in bulk, following the conventions of
+    :mod:`eppy.geometry.surface`: the tilt is the angle of the outward normal
+    from the zenith and the azimuth is measured clockwise from north.
+
+    Only objects with a vertex list (e.g. BUILDINGSURFACE:DETAILED,
+    FENESTRATIONSURFACE:DETAILED) are part of the table. Subsurfaces take the
+    zone, and hence the zone multiplier, of their parent surface.
+    """
+
+    def __init__(
+        self,
+        objects,
+        vertices,
+        n_vertices,
+        is_subsurface,
+        parent,
+        surface_type,
+        boundary_condition,
+        zone,
+        multiplier,
+    ):
+        """Initialize a SurfaceGeometry table.
+
+        Args:
+            objects (list of EpBunch): The surface and subsurface objects.
+            vertices (np.ndarray): Vertices of shape (n, max_vertices, 3), padded
+                with zeros.
+            n_vertices (np.ndarray): Number of vertices of each object.
+            is_subsurface (np.ndarray): True for subsurfaces.
+            parent (np.ndarray): Row of the parent surface of each subsurface; -1
+                for surfaces and orphaned subsurfaces.
+            surface_type (np.ndarray): Lower-case surface types.
+            boundary_condition (np.ndarray): Lower-case outside boundary
+                conditions. Empty for subsurfaces.
+            zone (np.ndarray): Upper-case zone names; empty if the zone does
+                not exist in the model.
+            multiplier (np.ndarray): Zone multipliers.
+        """
+        self.objects = objects
+        self.vertices = vertices
+        self.n_vertices = n_vertices
+        self.is_subsurface = is_subsurface
+        self.parent = parent
+        self.surface_type = surface_type
+        self.boundary_condition = boundary_condition
+        self.zone = zone
+        self.multiplier = multiplier
+
+        self.normal, self.area = _newell(vertices, n_vertices)
+        degenerate = self.area == 0
+        with np.errstate(invalid="ignore"):
+            tilt = np.degrees(np.arccos(np.clip(self.normal[:, 2], -1, 1)))
+            azimuth = np.degrees(np.arctan2(self.normal[:, 0], self.normal[:, 1])) % 360
+        # Horizontal surfaces face north by convention.
+        azimuth[np.hypot(self.normal[:, 0], self.normal[:, 1]) < 1e-9] = 0.0
+        self.tilt = np.where(degenerate, np.nan, tilt)
+        self.azimuth = np.where(degenerate, np.nan, azimuth)
+
+    def __len__(self):
+        """Number of surfaces and subsurfaces in the table."""
+        return len(self.objects)
+
+    @classmethod
+    def from_idf(cls, idf):
+        """Create a SurfaceGeometry table from an IDF model.
+
+        Args:
+            idf (IDF): The IDF model.
+
+        Returns:
+            SurfaceGeometry: The geometry table.
+        """
+        ref2names = idf.idd_index["ref2names"]
+        surface_keys = {key.upper() for key in ref2names["SurfaceNames"]}
+        subsurface_keys = {key.upper() for key in ref2names["SubSurfNames"]}
+
+        multipliers = {
+            zone.Name.upper(): float(zone.Multiplier if zone.Multiplier != "" else 1) for zone in idf.idfobjects["ZONE"]
+        }
+
+        objects, coords, is_subsurface = [], [], []
+        surface_type, boundary, reference = [], [], []
+        # Iterate in IDD order so that rows come out in the same order as
+        # `IDF.getsurfaces()` and `IDF.getsubsurfaces()`.
+        for key in idf.idfobjects:
+            subsurface = key in subsurface_keys
+            if not (subsurface or key in surface_keys) or not idf.idfobjects[key]:
+                continue
+            fieldnames = idf.idfobjects[key][0].objls
+            if "Number_of_Vertices" not in fieldnames:
+                continue
+            first_vertex = fieldnames.index("Number_of_Vertices") + 1
+            reference_field = "Building_Surface_Name" if subsurface else "Zone_Name"
+            has_type = "Surface_Type" in fieldnames
+            for obj in idf.idfobjects[key]:
+                values = [float(value) for value in obj.obj[first_vertex:] if value != ""]
+                coords.append(values[: len(values) // 3 * 3])
+                objects.append(obj)
+                is_subsurface.append(subsurface)
+                surface_type.append(obj.Surface_Type.lower() if has_type else _IMPLIED_SURFACE_TYPES.get(key, ""))
+                boundary.append("" if subsurface else obj.Outside_Boundary_Condition.lower())
+                reference.append(obj[reference_field].upper())
+
+        n_vertices = np.array([len(values) // 3 for values in coords], dtype=int)
+        vertices = np.zeros((len(coords), n_vertices.max(initial=0), 3))
+        for row, values in enumerate(coords):
+            vertices[row, : n_vertices[row]] = np.reshape(values, (-1, 3))
+
+        is_subsurface = np.array(is_subsurface, dtype=bool)
+        rows = {obj.Name.upper(): row for row, obj in enumerate(objects) if not is_subsurface[row]}
+        parent = np.array(
+            [rows.get(name, -1) if sub else -1 for name, sub in zip(reference, is_subsurface)],
+            dtype=int,
+        )
+        zone = np.array(
+            [
+                (reference[parent[row]] if parent[row] >= 0 else "") if sub else reference[row]
+                for row, sub in enumerate(is_subsurface)
+            ],
+            dtype=object,
+        )
+        zone = np.where([name in multipliers for name in zone], zone, "")
+        multiplier = np.array([multipliers.get(name, 1.0) for name in zone], dtype=float)
+
+        return cls(
+            objects,
+            vertices,
+            n_vertices,
+            is_subsurface,
+            parent,
+            np.array(surface_type, dtype=object),
+            np.array(boundary, dtype=object),
+            zone,
+            multiplier,
+        )
+
+    @property
+    def weighted_area(self):
+        """Areas multiplied by their zone multiplier [m2]."""
+        return self.area * self.multiplier
+
+    @property
+    def cardinal_angle(self):
+        """Closest cardinal angle (0, 90, 180 or 270) of each azimuth."""
+        quadrant = np.rint(np.nan_to_num(self.azimuth) / 90.0).astype(int) % len(CARDINAL_ANGLES)
+        return np.take(CARDINAL_ANGLES, quadrant)
+
+    @property
+    def subsurfaces(self):
+        """Mapping of each surface row to the rows of its subsurfaces."""
+        mapping = defaultdict(list)
+        for row in np.flatnonzero(self.parent >= 0):
+            mapping[int(self.parent[row])].append(int(row))
+        return mapping
+
+    def rows_of(self, objects):
+        """Return the table rows of the given surfaces or subsurfaces.
+
+        Objects that are not part of the table are ignored.
+
+        Args:
+            objects (Iterable of EpBunch): The surface objects.
+
+        Returns:
+            np.ndarray: The row indices.
+        """
+        rows = {(obj.key.upper(), obj.Name.upper()): row for row, obj in enumerate(self.objects)}
+        return np.array(
+            [rows[key] for key in ((obj.key.upper(), obj.Name.upper()) for obj in objects) if key in rows],
+            dtype=int,
+        )
+
+
+def _newell(vertices, n_vertices):
+    """Return unit normals and areas of padded polygons using Newell's method.
+
+    Args:
+        vertices (np.ndarray): Vertices of shape (n, max_vertices, 3).
+        n_vertices (np.ndarray): Number of valid vertices of each polygon.
+
+    Returns:
+        tuple: Unit normals of shape (n, 3) and areas of shape (n,).
+    """
+    # Translate each polygon to its first vertex to limit round-off errors on
+    # models far from the origin.
+    vertices = vertices - vertices[:, :1]
+    position = np.arange(vertices.shape[1])
+    valid = position < n_vertices[:, None]
+    following = (position + 1) % np.maximum(n_vertices, 1)[:, None]
+    following_vertices = np.take_along_axis(vertices, following[..., None], axis=1)
+    cross = np.cross(vertices, following_vertices) * valid[..., None]
+    total = cross.sum(axis=1)
+    magnitude = np.linalg.norm(total, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normal = np.where(magnitude[:, None] > 0, total / magnitude[:, None], 0.0)
+    return normal, magnitude / 2
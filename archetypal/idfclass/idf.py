@@ -24,7 +24,6 @@ from collections import defaultdict
 from collections.abc import Iterable
 from io import IOBase, StringIO
 from itertools import chain
-from math import isclose
 from typing import IO, ClassVar, Literal
 
 import eppy
@@ -32,8 +31,9 @@ import numpy as np
 import pandas as pd
 from energy_pandas import EnergySeries
 from eppy.bunch_subclass import BadEPFieldError
-from eppy.EPlusInterfaceFunctions.eplusdata import Eplusdata
+from eppy.EPlusInterfaceFunctions.eplusdata import Eplusdata, removecomment
 from eppy.idf_msequence import Idf_MSequence
+from eppy.idfreader import convertfields
 from eppy.modeleditor import IDDNotSetError, namebunch, newrawobject
 from pandas import DataFrame, Series
 from pandas.errors import ParserError
@@ -51,18 +51,21 @@ from archetypal.eplus_interface.exceptions import (
 )
 from archetypal.eplus_interface.expand_objects import ExpandObjectsThread
 from archetypal.eplus_interface.slab import SlabThread
+from archetypal.eplus_interface.staging import make_run_dir
 from archetypal.eplus_interface.transition import TransitionThread
 from archetypal.eplus_interface.version import EnergyPlusVersion
+from archetypal.idfclass.geometry import SurfaceGeometry
 from archetypal.idfclass.meters import Meters
 from archetypal.idfclass.outputs import Outputs
 from archetypal.idfclass.reports import get_report
 from archetypal.idfclass.util import get_idf_version, hash_model
 from archetypal.idfclass.variables import Variables
 from archetypal.reportdata import ReportData
+from archetypal.tracing import span, traced
 from archetypal.utils import log, settings
 from geomeppy import IDF as GeomIDF
 from geomeppy.geom.polygons import Polygon3D
-from geomeppy.patches import EpBunch, idfreader1, obj2bunch
+from geomeppy.patches import EpBunch, idfreader1, makeabunch, obj2bunch
 from geomeppy.recipes import _is_window, window_vertices_given_wall
 
 ReportingFrequency = Literal["Annual", "Monthly", "Daily", "Hourly", "Timestep"]
@@ -656,6 +659,14 @@ class IDF(GeomIDF):
         else:
             self._epw = None
 
+    @property
+    def weather(self):
+        """Weather: The parsed weather file, shared with the other models using it."""
+        if self.epw is not None:
+            from archetypal.weather import read_epw
+
+            return read_epw(self.epw)
+
     @property
     def verbose(self):
         """bool: If True, print outputs to logging module.
@@ -1287,6 +1298,54 @@ class IDF(GeomIDF):
                 self._variables = Variables(self)
         return self._variables
 
+    def request_outputs(self, variables=(), meters=(), reporting_frequency="Hourly") -> list[EpBunch]:
+        """Plan the output variables and meters needed ahead of retrieving them.
+
+        :meth:`Variable.values` and :meth:`Meter.values` simulate the model again
+        each time the requested output is missing from the model. Requesting all
+        the outputs of a script first adds the missing ones in one go and
+        simulates the model at most once.
+
+        Example:
+            >>> idf.request_outputs(
+            >>>     variables=["Zone Mean Air Temperature", "Zone Air Relative Humidity"],
+            >>>     meters=["Electricity:Facility", "NaturalGas:Facility"],
+            >>> )
+            >>> idf.meters.OutputMeter.Electricity__Facility.values()
+
+        Args:
+            variables (list of str): Names of the Output:Variable objects, which
+                are reported for all keys ("*").
+            meters (list of str): Names of the Output:Meter objects.
+            reporting_frequency (str): Timestep, Hourly, Daily, Monthly,
+                RunPeriod, Environment, Annual or Detailed. Default "Hourly".
+
+        Returns:
+            list of EpBunch: The output objects that were added to the model.
+        """
+        reporting_frequency = reporting_frequency.lower()
+        outputs = [
+            self.anidfobject("OUTPUT:VARIABLE", Variable_Name=name, Reporting_Frequency=reporting_frequency)
+            for name in variables
+        ]
+        outputs.extend(
+            self.anidfobject("OUTPUT:METER", Key_Name=name, Reporting_Frequency=reporting_frequency) for name in meters
+        )
+        return self._add_missing_outputs(outputs)
+
+    def _add_missing_outputs(self, outputs) -> list[EpBunch]:
+        """Add the output objects missing from the model and simulate it once."""
+        missing = []
+        for output in outputs:
+            if output not in self.idfobjects[output.key.upper()] and output not in missing:
+                missing.append(output)
+        if missing:
+            log(f"simulating {self.name} again for {len(missing)} new outputs")
+            self.addidfobjects(missing)
+            self.simulate()
+        return missing
+
+    @traced
     def simulate(self, force=False, **kwargs):
         """Execute EnergyPlus.
 
@@ -1395,82 +1454,86 @@ class IDF(GeomIDF):
 
         # Todo: Add EpMacro Thread -> if exist in.imf "%program_path%EPMacro"
         # Run the expandobjects program if necessary
-        tmp = (self.output_directory.makedirs_p() / "expandobjects_run_" + str(uuid.uuid1())[0:8]).mkdir()
+        tmp = make_run_dir(self.output_directory, "expandobjects_run_")
         # Run the ExpandObjects preprocessor program
         expandobjects_thread = ExpandObjectsThread(self, tmp)
-        try:
-            expandobjects_thread.start()
-            expandobjects_thread.join()
-            # Give time to the subprocess to finish completely
-            while expandobjects_thread.is_alive():
-                time.sleep(1)
-        except (KeyboardInterrupt, SystemExit):
-            expandobjects_thread.stop()
-        finally:
-            tmp.rmtree(ignore_errors=True)
-            e = expandobjects_thread.exception
-            if e is not None:
-                raise e
-            elif expandobjects_thread.cancelled:
-                return self
+        with span("ExpandObjects", idf=self.name):
+            try:
+                expandobjects_thread.start()
+                expandobjects_thread.join()
+                # Give time to the subprocess to finish completely
+                while expandobjects_thread.is_alive():
+                    time.sleep(1)
+            except (KeyboardInterrupt, SystemExit):
+                expandobjects_thread.stop()
+            finally:
+                tmp.rmtree(ignore_errors=True)
+                e = expandobjects_thread.exception
+                if e is not None:
+                    raise e
+                elif expandobjects_thread.cancelled:
+                    return self
 
         # Run the Basement preprocessor program if necessary
-        tmp = (self.output_directory.makedirs_p() / "runBasement_run_" + str(uuid.uuid1())[0:8]).mkdir()
+        tmp = make_run_dir(self.output_directory, "runBasement_run_")
         basement_thread = BasementThread(self, tmp)
-        try:
-            basement_thread.start()
-            basement_thread.join()
-            # Give time to the subprocess to finish completely
-            while basement_thread.is_alive():
-                time.sleep(1)
-        except KeyboardInterrupt:
-            basement_thread.stop()
-        finally:
-            tmp.rmtree(ignore_errors=True)
-            e = basement_thread.exception
-            if e is not None:
-                raise e
-            elif basement_thread.cancelled:
-                return self
+        with span("Basement", idf=self.name):
+            try:
+                basement_thread.start()
+                basement_thread.join()
+                # Give time to the subprocess to finish completely
+                while basement_thread.is_alive():
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                basement_thread.stop()
+            finally:
+                tmp.rmtree(ignore_errors=True)
+                e = basement_thread.exception
+                if e is not None:
+                    raise e
+                elif basement_thread.cancelled:
+                    return self
 
         # Run the Slab preprocessor program if necessary
-        tmp = (self.output_directory.makedirs_p() / "runSlab_run_" + str(uuid.uuid1())[0:8]).mkdir()
+        tmp = make_run_dir(self.output_directory, "runSlab_run_")
         slab_thread = SlabThread(self, tmp)
-        try:
-            slab_thread.start()
-            slab_thread.join()
-            # Give time to the subprocess to finish completely
-            while slab_thread.is_alive():
-                time.sleep(1)
-        except KeyboardInterrupt:
-            slab_thread.stop()
-        finally:
-            if not self.keep_data_err:
-                tmp.rmtree(ignore_errors=True)
-            e = slab_thread.exception
-            if e is not None:
-                raise e
-            elif slab_thread.cancelled:
-                return self
+        with span("Slab", idf=self.name):
+            try:
+                slab_thread.start()
+                slab_thread.join()
+                # Give time to the subprocess to finish completely
+                while slab_thread.is_alive():
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                slab_thread.stop()
+            finally:
+                if not self.keep_data_err:
+                    tmp.rmtree(ignore_errors=True)
+                e = slab_thread.exception
+                if e is not None:
+                    raise e
+                elif slab_thread.cancelled:
+                    return self
 
         # Run the energyplus program
-        tmp = (self.output_directory.makedirs_p() / "eplus_run_" + str(uuid.uuid1())[0:8]).mkdir()
+        tmp = make_run_dir(self.output_directory, "eplus_run_")
         running_simulation_thread = EnergyPlusThread(self, tmp)
-        try:
-            running_simulation_thread.start()
-            running_simulation_thread.join()
-            # Give time to the subprocess to finish completely
-            while running_simulation_thread.is_alive():
-                time.sleep(1)
-        except KeyboardInterrupt:
-            running_simulation_thread.stop()
-        finally:
-            tmp.rmtree(ignore_errors=True)
-            e = running_simulation_thread.exception
-            if e is not None:
-                raise e
-            elif running_simulation_thread.cancelled:
-                return self
+        with span("EnergyPlus", idf=self.name):
+            try:
+                running_simulation_thread.start()
+                running_simulation_thread.join()
+                # Give time to the subprocess to finish completely
+                while running_simulation_thread.is_alive():
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                running_simulation_thread.stop()
+            finally:
+                tmp.rmtree(ignore_errors=True)
+                e = running_simulation_thread.exception
+                if e is not None:
+                    raise e
+                elif running_simulation_thread.cancelled:
+                    return self
         return self
 
     def savecopy(self, filename, lineendings="default", encoding="latin-1"):
@@ -1614,24 +1677,7 @@ class IDF(GeomIDF):
         Args:
             idf_string (str): A text string fully describing an EnergyPlus object.
         """
-        # Load the idf_string as a new model.
-        loaded_string = IDF(
-            StringIO(idf_string),
-            file_version=self.file_version,
-            as_version=self.as_version,
-            prep_outputs=False,
-        )
-
-        # Loop on all objects and using self.newidfobject
-        added_objects = []
-        for sequence in loaded_string.idfobjects.values():
-            if sequence:
-                for obj in sequence:
-                    data = obj.to_dict()
-                    key = data.pop("key")
-                    added_objects.append(self.newidfobject(key=key.upper(), **data))
-        del loaded_string  # remove loaded_string model
-        return added_objects
+        return self.addidfobjects_from_string(idf_string)
 
     def upgrade(self, to_version=None, overwrite=False):
         """`EnergyPlus` idf version updater using local transition program.
@@ -1673,7 +1719,7 @@ class IDF(GeomIDF):
         else:
             self.as_version = to_version  # set version number
             # execute transitions
-            tmp = (self.output_directory / "Transition_run_" + str(uuid.uuid1())[0:8]).makedirs_p()
+            tmp = make_run_dir(self.output_directory, "Transition_run_")
             transition_thread = TransitionThread(self, tmp, overwrite=overwrite)
             try:
                 transition_thread.start()
@@ -1720,26 +1766,28 @@ class IDF(GeomIDF):
             else:
                 return x
 
-        total_surface_area = defaultdict(int)
-        total_window_area = defaultdict(int)
-
-        zones = self.idfobjects["ZONE"]
-        zone: EpBunch
-        for zone in zones:
-            multiplier = float(zone.Multiplier if zone.Multiplier != "" else 1)
-            for surface in [
-                surf for surf in zone.zonesurfaces if surf.key.upper() not in ["INTERNALMASS", "WINDOWSHADINGCONTROL"]
-            ]:
-                if isclose(surface.tilt, 90, abs_tol=10) and surface.Outside_Boundary_Condition.lower() == "outdoors":
-                    surf_azim = roundto(surface.azimuth, to=azimuth_threshold)
-                    total_surface_area[surf_azim] += surface.area * multiplier
-                for subsurface in surface.subsurfaces:
-                    if hasattr(subsurface, "tilt"):
-                        if isclose(subsurface.tilt, 90, abs_tol=10) and subsurface.Surface_Type.lower() == "window":
-                            surf_azim = roundto(subsurface.azimuth, to=azimuth_threshold)
-                            total_window_area[surf_azim] += subsurface.area * multiplier
-                        if isclose(subsurface.tilt, 180, abs_tol=80):
-                            total_window_area["sky"] += subsurface.area * multiplier
+        geometry = SurfaceGeometry.from_idf(self)
+        area = geometry.weighted_area
+        vertical = np.isclose(geometry.tilt, 90, rtol=0, atol=10)
+        in_zone = ~geometry.is_subsurface & (geometry.zone != "")
+        on_zone_surface = geometry.is_subsurface & (geometry.parent >= 0)
+        on_zone_surface[on_zone_surface] = in_zone[geometry.parent[on_zone_surface]]
+
+        walls = in_zone & vertical & (geometry.boundary_condition == "outdoors")
+        windows = on_zone_surface & vertical & (geometry.surface_type == "window")
+        skylights = on_zone_surface & np.isclose(geometry.tilt, 180, rtol=0, atol=80)
+
+        def grouped_area(mask):
+            """Sum the areas of the masked rows by rounded azimuth."""
+            azimuth = geometry.azimuth[mask]
+            if azimuth_threshold:
+                azimuth = np.rint(azimuth / azimuth_threshold).astype(int) * azimuth_threshold
+            return defaultdict(int, pd.Series(area[mask]).groupby(azimuth).sum().to_dict())
+
+        total_surface_area = grouped_area(walls)
+        total_window_area = grouped_area(windows)
+        if skylights.any():
+            total_window_area["sky"] = area[skylights].sum()
         # Fix azimuth = 360 which is the same as azimuth 0
         total_surface_area[0] += total_surface_area.pop(360, 0)
         total_window_area[0] += total_window_area.pop(360, 0)
@@ -1985,6 +2033,124 @@ class IDF(GeomIDF):
         self._reset_dependant_vars("idfobjects")
         return new_objects
 
+    def addidfobjects_from_string(self, idf_string) -> list[EpBunch]:
+        """Parse IDF objects from a text string and add them to the model at once.
+
+        The objects are parsed with the IDD already loaded for this model
+        instead of being read as a new IDF and added one by one with
+        :meth:`newidfobject`. As with :meth:`newidfobject`, an object equal to
+        an object of the model is not added again and the existing object is
+        kept in place; otherwise, an object replaces the existing object of the
+        same type and name, and the existing instance of a 'unique-object'.
+        Objects are compared as in :meth:`update_from_idf_string`.
+
+        Args:
+            idf_string (str): IDF objects, e.g. the EPObjects written by the
+                Basement preprocessor.
+
+        Returns:
+            list of EpBunch: The objects of `idf_string` in the model, either
+                added or already existing.
+        """
+        key_indices = {}
+        existing_objs = {}  # key -> {signature: object} of the objects of the model
+        objects = {}
+        for key, key_i, obj in self._parse_idf_string(idf_string):
+            key_indices[key] = key_i
+            if key not in existing_objs:
+                existing_objs[key] = {_object_signature(x.obj): x for x in reversed(self.idfobjects[key])}
+            signature = _object_signature(obj)
+            abunch = existing_objs[key].get(signature)
+            if abunch is None:
+                abunch = self._make_bunch(key_i, obj)
+            if "Name" in abunch.fieldnames:
+                # Later objects replace earlier objects of the same name.
+                objects[(key, abunch.Name.upper())] = abunch
+            elif "unique-object" in self.idd_info[key_i][0]:
+                objects[(key, None)] = abunch
+            else:
+                # Equal unnamed objects are only added once.
+                objects[(key, signature)] = abunch
+
+        # Find the new objects and the existing objects they replace.
+        existing_ids = {id(obj) for existing in existing_objs.values() for obj in existing.values()}
+        new_objects = [obj for obj in objects.values() if id(obj) not in existing_ids]
+        in_model = {id(obj) for obj in objects.values()}
+        to_remove = []
+        for key, key_i in key_indices.items():
+            existing = self.idfobjects[key]
+            if "unique-object" in self.idd_info[key_i][0]:
+                to_remove.extend(obj for obj in existing if id(obj) not in in_model)
+            elif existing and "Name" in existing[0].fieldnames:
+                to_remove.extend(
+                    obj for obj in existing if (key, obj.Name.upper()) in objects and id(obj) not in in_model
+                )
+        if to_remove:
+            self.removeidfobjects(to_remove)
+        if new_objects:
+            self.addidfobjects(new_objects)
+        return list(objects.values())
+
+    def update_from_idf_string(self, idf_string) -> tuple[list[EpBunch], list[EpBunch]]:
+        """Update the model in place to the objects of an IDF text string.
+
+        Only the objects that differ are touched: objects of the model that are
+        not in `idf_string` are removed and objects of `idf_string` that are not
+        in the model are added. Objects are compared field by field, ignoring
+        case, number formatting and trailing blank fields. This is much cheaper
+        than re-reading the whole model when only a few objects changed, e.g.
+        after ExpandObjects expanded the HVACTemplate objects.
+
+        Args:
+            idf_string (str): The full content of the updated IDF file.
+
+        Returns:
+            tuple: The removed and the added objects.
+        """
+        existing_objs = defaultdict(list)
+        for key, sequence in self.idfobjects.items():
+            for obj in sequence:
+                existing_objs[(key, _object_signature(obj.obj))].append(obj)
+
+        new_objects = []
+        for key, key_i, obj in self._parse_idf_string(idf_string):
+            kept = existing_objs.get((key, _object_signature(obj)))
+            if kept:
+                kept.pop(0)
+            else:
+                new_objects.append(self._make_bunch(key_i, obj))
+
+        removed_objects = list(chain.from_iterable(existing_objs.values()))
+        if removed_objects:
+            self.removeidfobjects(removed_objects)
+        if new_objects:
+            self.addidfobjects(new_objects)
+        return removed_objects, new_objects
+
+    def _parse_idf_string(self, idf_string):
+        """Yield the key, IDD index and raw fields of the objects of an IDF string."""
+        dtls = self.model.dtls
+        key_indices = {}
+        for record in removecomment(idf_string, "!").split(";"):
+            obj = [field.strip() for field in record.split(",")]
+            key = obj[0].upper()
+            if not key:
+                continue
+            if key not in key_indices:
+                try:
+                    key_indices[key] = dtls.index(key)
+                except ValueError:
+                    key_indices[key] = None
+                    log(f"object '{obj[0]}' is not in the IDD of {self.name}. Skipping.", lg.WARNING)
+            if key_indices[key] is not None:
+                yield key, key_indices[key], obj
+
+    def _make_bunch(self, key_i, obj) -> EpBunch:
+        """Make an EpBunch of this model from the raw fields of an object."""
+        abunch = makeabunch(self.idd_info, convertfields(self.idd_info[key_i], obj), key_i)
+        abunch.theidf = self
+        return abunch
+
     def removeidfobject(self, idfobject):
         """Remove an IDF object from the model.
 
@@ -2252,17 +2418,21 @@ class IDF(GeomIDF):
 
         wwr_map = wwr_map or {0: wwr, 90: wwr, 180: wwr, 270: wwr}
 
+        geometry = SurfaceGeometry.from_idf(self)
+        if surfaces is None:
+            walls = np.flatnonzero(~geometry.is_subsurface & (geometry.surface_type == "wall"))
+        else:
+            walls = geometry.rows_of(surfaces)
+        walls = walls[geometry.boundary_condition[walls] == "outdoors"]
+        cardinal_angle = geometry.cardinal_angle
+        subsurfaces = geometry.subsurfaces
+
         # check orientation
         for degrees, wwr in wwr_map.items():
-            external_walls = filter(
-                lambda x: x.Outside_Boundary_Condition.lower() == "outdoors",
-                surfaces or self.getsurfaces("wall"),
-            )
-            external_walls = filter(lambda x: closest_cardinal_angle(x.azimuth) == degrees, external_walls)
-            subsurfaces = self.getsubsurfaces()
-            for wall in external_walls:
+            for row in walls[cardinal_angle[walls] == degrees]:
+                wall = geometry.objects[row]
                 # get any subsurfaces on the wall
-                wall_subsurfaces = list(filter(lambda x: x.Building_Surface_Name == wall.Name, subsurfaces))
+                wall_subsurfaces = [geometry.objects[sub] for sub in subsurfaces[row]]
 
                 if wall_subsurfaces and not construction:
                     constructions = list({wss.Construction_Name for wss in wall_subsurfaces if _is_window(wss)})
@@ -2576,24 +2746,13 @@ class IDF(GeomIDF):
             the heat exchange with the exterior.
 
         """
-        total_area = 0
-        area = 0
-        zones = self.idfobjects["ZONE"]
-        zone: EpBunch
-        for zone in zones:
-            for surface in zone.zonesurfaces:
-                if hasattr(surface, "tilt") and surface.tilt == 180.0:
-                    multiplier = float(zone.Multiplier if zone.Multiplier != "" else 1)
-
-                    area += surface.area * multiplier
-        self._area_total = area
-        for surface in self.getsurfaces():
-            if surface.Outside_Boundary_Condition.lower() in ["adiabatic", "surface"]:
-                continue
-            zone = surface.get_referenced_object("Zone_Name")
-            multiplier = float(zone.Multiplier if zone.Multiplier != "" else 1)
-            total_area += surface.area * multiplier
-        return total_area
+        geometry = SurfaceGeometry.from_idf(self)
+        area = geometry.weighted_area
+        surfaces = ~geometry.is_subsurface
+        floors = surfaces & (geometry.zone != "") & np.isclose(geometry.tilt, 180.0)
+        self._area_total = float(area[floors].sum())
+        envelope = surfaces & ~np.isin(geometry.boundary_condition, ["adiabatic", "surface"])
+        return float(area[envelope].sum())
 
 
 def _process_csv(file, working_dir, simulname):
@@ -2623,5 +2782,22 @@ def _process_csv(file, working_dir, simulname):
 def closest_cardinal_angle(azimuth):
     """Returns the closest bearing angle to the given azimuth angle."""
     dirs = [0, 90, 180, 270]
-    ix = int(round(azimuth / (360.0 / len(dirs))))
+    ix = int(np.rint(azimuth / (360.0 / len(dirs))))
     return dirs[ix % len(dirs)]
+
+
+def _object_signature(fields):
+    """Return a hashable signature of the fields of an IDF object.
+
+    Numbers compare by value and text ignores case; trailing blank fields are
+    dropped.
+    """
+    signature = []
+    for value in fields:
+        try:
+            signature.append(float(value))
+        except (TypeError, ValueError):
+            signature.append(str(value).strip().upper())
+    while signature and signature[-1] == "":
+        signature.pop()
+    return tuple(signature)
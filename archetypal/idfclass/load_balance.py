@@ -39,71 +39,56 @@ class LoadBalance:
     def from_idf(cls, idf):
         assert idf.sql_file.exists()
 
-        # get all of the results relevant for gains and losses
-        cooling = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.COOLING, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        heating = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.HEATING, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        lighting = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.LIGHTING, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        people_gain = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.PEOPLE_GAIN, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        solar_gain = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.SOLAR_GAIN, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        infil_gain = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.INFIL_GAIN, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        infil_loss = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.INFIL_LOSS, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        vent_loss = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.VENT_LOSS, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        vent_gain = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.VENT_GAIN, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        nat_vent_gain = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.NAT_VENT_GAIN,
-            reporting_frequency=idf.outputs.reporting_frequency,
-        )
-        nat_vent_loss = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.NAT_VENT_LOSS,
-            reporting_frequency=idf.outputs.reporting_frequency,
-        )
+        # get all of the results relevant for gains and losses in one read of the
+        # sql file
+        outputs = idf.outputs
+        frames = idf.variables.OutputVariable.collect_groups(
+            {
+                "cooling": outputs.COOLING,
+                "heating": outputs.HEATING,
+                "lighting": outputs.LIGHTING,
+                "people_gain": outputs.PEOPLE_GAIN,
+                "solar_gain": outputs.SOLAR_GAIN,
+                "infil_gain": outputs.INFIL_GAIN,
+                "infil_loss": outputs.INFIL_LOSS,
+                "vent_loss": outputs.VENT_LOSS,
+                "vent_gain": outputs.VENT_GAIN,
+                "nat_vent_gain": outputs.NAT_VENT_GAIN,
+                "nat_vent_loss": outputs.NAT_VENT_LOSS,
+                "electric_equip_gain": outputs.ELECTRIC_EQUIP[1],
+                "electric_equip": outputs.ELECTRIC_EQUIP,
+                "gas_equip_gain": outputs.GAS_EQUIP[1],
+                "gas_equip": outputs.GAS_EQUIP,
+                "hot_water_gain": outputs.HOT_WATER[1],
+                "hot_water": outputs.HOT_WATER,
+                "opaque_flow": outputs.OPAQUE_ENERGY_FLOW,
+                "window_loss": outputs.WINDOW_LOSS,
+                "window_gain": outputs.WINDOW_GAIN,
+            },
+            reporting_frequency=outputs.reporting_frequency,
+        )
+        cooling = frames["cooling"]
+        heating = frames["heating"]
+        lighting = frames["lighting"]
+        people_gain = frames["people_gain"]
+        solar_gain = frames["solar_gain"]
+        infil_gain = frames["infil_gain"]
+        infil_loss = frames["infil_loss"]
+        vent_loss = frames["vent_loss"]
+        vent_gain = frames["vent_gain"]
+        nat_vent_gain = frames["nat_vent_gain"]
+        nat_vent_loss = frames["nat_vent_loss"]
 
         # handle the case that both total elect/gas energy and zone gain are requested
-        electric_equip = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.ELECTRIC_EQUIP[1],
-            reporting_frequency=idf.outputs.reporting_frequency,
-        )
+        electric_equip = frames["electric_equip_gain"]
         if len(electric_equip) == 0:
-            electric_equip = idf.variables.OutputVariable.collect_by_output_name(
-                idf.outputs.ELECTRIC_EQUIP,
-                reporting_frequency=idf.outputs.reporting_frequency,
-            )
-        gas_equip = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.GAS_EQUIP[1],
-            reporting_frequency=idf.outputs.reporting_frequency,
-        )
+            electric_equip = frames["electric_equip"]
+        gas_equip = frames["gas_equip_gain"]
         if len(gas_equip) == 0:
-            gas_equip = idf.variables.OutputVariable.collect_by_output_name(
-                idf.outputs.GAS_EQUIP,
-                reporting_frequency=idf.outputs.reporting_frequency,
-            )
-        hot_water = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.HOT_WATER[1],
-            reporting_frequency=idf.outputs.reporting_frequency,
-        )
+            gas_equip = frames["gas_equip"]
+        hot_water = frames["hot_water_gain"]
         if len(hot_water) == 0:
-            hot_water = idf.variables.OutputVariable.collect_by_output_name(
-                idf.outputs.HOT_WATER,
-                reporting_frequency=idf.outputs.reporting_frequency,
-            )
+            hot_water = frames["hot_water"]
 
         # subtract losses from gains
         infiltration = None
@@ -128,16 +113,9 @@ class LoadBalance:
             nat_vent = cls.subtract_loss_from_gain(nat_vent_gain, nat_vent_loss)
 
         # get the surface energy flow
-        opaque_flow = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.OPAQUE_ENERGY_FLOW,
-            reporting_frequency=idf.outputs.reporting_frequency,
-        )
-        window_loss = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.WINDOW_LOSS, reporting_frequency=idf.outputs.reporting_frequency
-        )
-        window_gain = idf.variables.OutputVariable.collect_by_output_name(
-            idf.outputs.WINDOW_GAIN, reporting_frequency=idf.outputs.reporting_frequency
-        )
+        opaque_flow = frames["opaque_flow"]
+        window_loss = frames["window_loss"]
+        window_gain = frames["window_gain"]
         window_flow = []
         if window_gain.shape == window_loss.shape:
             window_flow = cls.subtract_loss_from_gain(window_gain, window_loss)
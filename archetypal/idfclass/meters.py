@@ -82,9 +82,7 @@ class Meter:
             "'Detailed'"
         )
         self._epobject.Reporting_Frequency = reporting_frequency.lower()
-        if self._epobject not in self._idf.idfobjects[self._epobject.key]:
-            self._idf.addidfobject(self._epobject)
-            self._idf.simulate()
+        self._idf._add_missing_outputs([self._epobject])
         try:
             key_name = self._epobject.Key_Name
         except BadEPFieldError:
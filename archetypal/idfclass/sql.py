@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Sequence
 from contextlib import contextmanager
-from datetime import timedelta
 from sqlite3 import connect
 from typing import Literal
 
@@ -15,6 +15,7 @@ from energy_pandas import EnergyDataFrame
 from pandas import to_datetime
 from path import Path
 
+from archetypal.tracing import traced
 from archetypal.utils import log
 
 _REPORTING_FREQUENCIES = Literal[
@@ -37,6 +38,215 @@ def closing_connection(file_path: str):
         con.close()
 
 
+# EnergyPlus Time.IntervalType of each ReportDataDictionary.ReportingFrequency.
+_INTERVAL_TYPES = {
+    "HVAC System Timestep": -1,
+    "Zone Timestep": 0,
+    "Hourly": 1,
+    "Daily": 2,
+    "Monthly": 3,
+    "Run Period": 4,
+    "Annual": 5,
+}
+
+
+class TimeIndex:
+    """The time axis shared by all the outputs of an EnergyPlus SQLite file.
+
+    The Time table is read once per file (and cached until the file changes) and
+    its DatetimeIndex is computed with vectorized arithmetic. Extractors map the
+    ``TimeIndex`` of ReportData rows to integer positions in this table instead
+    of joining and pivoting on the date columns.
+
+    Args:
+        time_table (pd.DataFrame): The Time table joined with the EnvironmentType
+            of its environment period, sorted by TimeIndex.
+    """
+
+    def __init__(self, time_table: pd.DataFrame):
+        self.time_table = time_table
+        time_index = time_table["TimeIndex"].to_numpy()
+        # lookup array from a TimeIndex to its position in the time table.
+        self._lookup = np.full(time_index.max() + 1 if len(time_index) else 0, -1, dtype=np.intp)
+        self._lookup[time_index] = np.arange(len(time_index))
+        self._datetimes = None
+        self._axes = {}
+
+    @classmethod
+    def from_sqlite(cls, file_path) -> TimeIndex:
+        """Get the cached TimeIndex of an SQLite file.
+
+        The cache is invalidated when the file is modified, e.g. by a new
+        simulation.
+        """
+        return _read_time_index(*_file_key(file_path))
+
+    @property
+    def datetimes(self) -> pd.DatetimeIndex:
+        """The timestamp of each row of the Time table, at the start of the interval."""
+        if self._datetimes is None:
+            t = self.time_table
+            dates = to_datetime({"year": 2018, "month": t["Month"], "day": t["Day"]})
+            minutes = t["Hour"] * 60 + t["Minute"] - t["Interval"]
+            self._datetimes = pd.DatetimeIndex(dates + pd.to_timedelta(minutes, unit="min"))
+        return self._datetimes
+
+    def positions(self, time_index) -> np.ndarray:
+        """Return the positions in the Time table of an array of TimeIndex values."""
+        return self._lookup[np.asarray(time_index, dtype=np.intp)]
+
+    def axis(self, environment_type: int, reporting_frequencies: Sequence[str], warmup_flag: int = 0):
+        """Return the positions and DatetimeIndex of an environment and frequencies.
+
+        Args:
+            environment_type (int): The environment type (1 = Design Day, 2 = Design
+                Run Period, 3 = Weather Run Period).
+            reporting_frequencies (Sequence[str]): ReportingFrequency values of the
+                outputs, e.g. ("Hourly",).
+            warmup_flag (int): 1 during warmup, 0 otherwise. Defaults to 0.
+
+        Returns:
+            tuple: The sorted positions in the Time table and the corresponding
+                DatetimeIndex, with an inferred frequency.
+        """
+        key = (environment_type, tuple(sorted(set(reporting_frequencies))), warmup_flag)
+        if key not in self._axes:
+            t = self.time_table
+            mask = (t["EnvironmentType"] == environment_type) & (t["WarmupFlag"].fillna(0) == warmup_flag)
+            interval_types = [_INTERVAL_TYPES[f] for f in key[1] if f in _INTERVAL_TYPES]
+            if len(interval_types) == len(key[1]):
+                mask &= t["IntervalType"].isin(interval_types)
+            positions = np.flatnonzero(mask.to_numpy())
+            self._axes[key] = (positions, pd.DatetimeIndex(self.datetimes[positions], freq="infer"))
+        return self._axes[key]
+
+
+@functools.lru_cache(maxsize=8)
+@traced
+def _read_time_index(file_path: str, mtime_ns: int, size: int) -> TimeIndex:
+    """Read the Time table of an SQLite file. Cached by path, mtime and size."""
+    with closing_connection(file_path) as conn:
+        time_table = pd.read_sql(
+            """SELECT t.*, p.EnvironmentType
+            FROM Time AS t
+                    LEFT JOIN EnvironmentPeriods AS p ON t.EnvironmentPeriodIndex = p.EnvironmentPeriodIndex
+            ORDER BY t.TimeIndex;""",
+            conn,
+        )
+    return TimeIndex(time_table)
+
+
+def zone_summary(file_path) -> pd.DataFrame:
+    """Get the geometry and nominal attributes of every zone of an SQLite file.
+
+    The Zone Summary and the nominal occupants are read in one pass and cached
+    until the file is modified, e.g. by a new simulation. As for
+    :func:`nominal_loads`, the cached object is shared by all the callers and must
+    not be modified: copy it first.
+
+    Args:
+        file_path (str): Path to the SQLite file generated by EnergyPlus.
+
+    Returns:
+        pd.DataFrame: Indexed by the zone name (upper case) with columns "area",
+            "volume", "occupants", "is_part_of_conditioned_floor_area",
+            "is_part_of_total_floor_area" and "multiplier".
+    """
+    return _read_zone_summary(*_file_key(file_path))
+
+
+@functools.lru_cache(maxsize=8)
+@traced
+def _read_zone_summary(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Read the zone summary of an SQLite file. Cached by path, mtime and size."""
+    with closing_connection(file_path) as conn:
+        zone_summary = conn.execute(
+            """SELECT RowName, ColumnName, Value FROM TabularDataWithStrings
+            WHERE TableName='Zone Summary'
+            AND ColumnName IN ('Area', 'Volume', 'Conditioned (Y/N)', 'Part of Total Floor Area (Y/N)', 'Multipliers')
+            ORDER BY TabularDataIndex;"""
+        ).fetchall()
+        occupants = conn.execute(
+            """SELECT RowName, CAST(Value AS float) FROM TabularDataWithStrings
+            WHERE TableName='Average Outdoor Air During Occupied Hours'
+            AND ColumnName='Nominal Number of Occupants'
+            ORDER BY TabularDataIndex;"""
+        ).fetchall()
+    # keep the first value of each (zone, column), like a single-row query would.
+    values = {}
+    for row_name, column_name, value in zone_summary:
+        values.setdefault(row_name, {}).setdefault(column_name, value)
+    zone_occupants = {}
+    for row_name, value in occupants:
+        zone_occupants.setdefault(row_name, value)
+    columns = ["Area", "Volume", "Conditioned (Y/N)", "Part of Total Floor Area (Y/N)", "Multipliers"]
+    data = pd.DataFrame.from_dict(values, orient="index", columns=columns)
+    return pd.DataFrame(
+        {
+            "area": data["Area"].astype(float),
+            "volume": data["Volume"].astype(float),
+            "occupants": pd.Series(zone_occupants, dtype=float).reindex(data.index).fillna(0),
+            "is_part_of_conditioned_floor_area": data["Conditioned (Y/N)"] == "Yes",
+            "is_part_of_total_floor_area": data["Part of Total Floor Area (Y/N)"] == "Yes",
+            "multiplier": data["Multipliers"].astype(float).astype(int),
+        },
+        index=data.index.rename("ZoneName"),
+    )
+
+
+# Nominal load tables and the column of their schedule index.
+_NOMINAL_LOAD_SCHEDULES = {
+    "NominalElectricEquipment": "ScheduleIndex",
+    "NominalGasEquipment": "ScheduleIndex",
+    "NominalLighting": "ScheduleIndex",
+    "NominalPeople": "NumberOfPeopleScheduleIndex",
+}
+
+
+def nominal_loads(file_path) -> dict[str, dict[str, pd.DataFrame]]:
+    """Get the nominal loads of every zone of an SQLite file, with their schedule names.
+
+    Each Nominal* table is joined with the Zones and Schedules tables in a single
+    query and split by zone once. The result is cached until the file is
+    modified, e.g. by a new simulation. As for :func:`zone_summary`, the cached
+    object is shared by all the callers and must not be modified: copy it first.
+
+    Args:
+        file_path (str): Path to the SQLite file generated by EnergyPlus.
+
+    Returns:
+        dict: {table_name: {zone_name (upper case): DataFrame}} for the tables
+            NominalElectricEquipment, NominalGasEquipment, NominalLighting and
+            NominalPeople. Each DataFrame holds the rows of the table for the zone
+            and a "ScheduleName" column. Zones without rows are omitted.
+    """
+    return _read_nominal_loads(*_file_key(file_path))
+
+
+@functools.lru_cache(maxsize=8)
+@traced
+def _read_nominal_loads(file_path: str, mtime_ns: int, size: int) -> dict[str, dict[str, pd.DataFrame]]:
+    """Read the nominal loads of an SQLite file. Cached by path, mtime and size."""
+    loads = {}
+    with closing_connection(file_path) as conn:
+        for table, schedule_index in _NOMINAL_LOAD_SCHEDULES.items():
+            data = pd.read_sql(
+                f"""SELECT z.ZoneName, n.*, s.ScheduleName
+                FROM {table} AS n
+                        INNER JOIN Zones AS z ON n.ZoneIndex = z.ZoneIndex
+                        LEFT JOIN Schedules AS s ON n.{schedule_index} = s.ScheduleIndex;""",
+                conn,
+            )
+            loads[table] = {zone_name.upper(): rows for zone_name, rows in data.groupby("ZoneName", sort=False)}
+    return loads
+
+
+def _file_key(file_path) -> tuple[str, int, int]:
+    """Return the (absolute path, mtime, size) key of the per-file caches."""
+    stat = Path(file_path).stat()
+    return str(Path(file_path).absolute()), stat.st_mtime_ns, stat.st_size
+
+
 class SqlOutput:
     """Represents a single output from the Sql file."""
 
@@ -82,7 +292,9 @@ class SqlOutput:
             header_rows.set_index("ReportDataDictionaryIndex", inplace=True)
             # extract all data of the relevant type from ReportData
             rel_indices = tuple(header_rows.index.to_list())
-            data = _extract_timeseries(conn, environment_type, header_rows, rel_indices)
+            data = _extract_timeseries(
+                conn, environment_type, header_rows, rel_indices, TimeIndex.from_sqlite(self._file_path)
+            )
 
             if units is not None:
                 data = data.to_units(units)
@@ -118,6 +330,8 @@ class Sql:
         * available_outputs
         * zone_info
         * environment_periods
+        * time_index
+        * zone_summary
     """
 
     _reporting_frequencies = (
@@ -198,6 +412,20 @@ class Sql:
             self._constructions_table = self._extract_constructions_table()
         return self._constructions_table
 
+    @property
+    def zone_summary(self) -> pd.DataFrame:
+        """Get the geometry and nominal attributes of every zone, keyed by zone name.
+
+        The DataFrame is shared with the other readers of the file: copy it
+        before modifying it.
+        """
+        return zone_summary(self.file_path)
+
+    @property
+    def time_index(self) -> TimeIndex:
+        """Get the time axis shared by all the outputs of the file."""
+        return TimeIndex.from_sqlite(self.file_path)
+
     @property
     def environment_periods(self):
         """Get a list of environment periods for the simulation run periods.
@@ -238,6 +466,7 @@ class Sql:
 
         return all_df
 
+    @traced
     def timeseries_by_name(
         self,
         variable_or_meter: str | Sequence,
@@ -331,7 +560,7 @@ class Sql:
 
             # extract all data of the relevant type from ReportData
             rel_indices = tuple(header_rows.index.to_list())
-            data = _extract_timeseries(conn, environment_type, header_rows, rel_indices)
+            data = _extract_timeseries(conn, environment_type, header_rows, rel_indices, self.time_index)
         log(f"collected data for {variable_or_meter}")
         return data
 
@@ -419,80 +648,39 @@ class Sql:
         return df
 
 
-def _extract_timeseries(conn, environment_type, header_rows, rel_indices) -> EnergyDataFrame:
-    """Extract time series given indices."""
-    if len(rel_indices) == 1:
-        data = pd.read_sql(
-            """SELECT rd.Value,
-                      rd.ReportDataDictionaryIndex,
-                      t.Month,
-                      t.Day,
-                      t.Hour,
-                      t.Minute,
-                      t.Interval
-            FROM ReportData as rd
-                    LEFT JOIN Time As t ON rd.TimeIndex = t.TimeIndex
-                    LEFT JOIN EnvironmentPeriods as p ON t.EnvironmentPeriodIndex = p.EnvironmentPeriodIndex
-            WHERE ReportDataDictionaryIndex=@rel_indices
-            AND (IFNULL(t.WarmupFlag, 0) = @warmup_flag)
-            AND p.EnvironmentType = @environment_type
-            ORDER BY t.TimeIndex;""",
-            conn,
-            params={
-                "rel_indices": rel_indices[0],
-                "warmup_flag": 0,
-                "environment_type": environment_type,
-            },
-        )
-    else:
-        data = pd.read_sql(
-            f"""SELECT rd.Value,
-                          rd.ReportDataDictionaryIndex,
-                          t.Month,
-                          t.Day,
-                          t.Hour,
-                          t.Minute,
-                          t.Interval
-                FROM ReportData as rd
-                        LEFT JOIN Time As t ON rd.TimeIndex = t.TimeIndex
-                        LEFT JOIN EnvironmentPeriods as p ON t.EnvironmentPeriodIndex = p.EnvironmentPeriodIndex
-                WHERE ReportDataDictionaryIndex IN {tuple(rel_indices)}
-                AND (IFNULL(t.WarmupFlag, 0) = @warmup_flag)
-                AND p.EnvironmentType = @environment_type
-                ORDER BY rd.ReportDataDictionaryIndex, t.TimeIndex;""",
-            conn,
-            params={"warmup_flag": 0, "environment_type": environment_type},
-        )
-    # Join the header_rows on ReportDataDictionaryIndex
-    data = data.join(
-        header_rows[["IndexGroup", "KeyValue", "Name"]],
-        on="ReportDataDictionaryIndex",
-    )
-    # Pivot the data so that ["Name", "KeyValue"] becomes the column MultiIndex.
-    data = data.pivot(
-        index=["Month", "Day", "Hour", "Minute", "Interval"],
-        columns=["IndexGroup", "KeyValue", "Name"],
-        values="Value",
+def _extract_timeseries(conn, environment_type, header_rows, rel_indices, time_index: TimeIndex) -> EnergyDataFrame:
+    """Extract time series given indices.
+
+    Values are placed by integer position on the axis of the shared ``time_index``
+    instead of being pivoted on the date columns of the Time table.
+    """
+    data = pd.read_sql(
+        f"""SELECT ReportDataDictionaryIndex, TimeIndex, Value
+        FROM ReportData
+        WHERE ReportDataDictionaryIndex IN ({", ".join(map(str, rel_indices))});""",
+        conn,
     )
-    # reset the index to prepare the DatetimeIndex
-    date_time_names = data.index.names
-    data.reset_index(inplace=True)
-    index = to_datetime(
-        {
-            "year": 2018,
-            "month": data.Month,
-            "day": data.Day,
-            "hour": data.Hour,
-            "minute": data.Minute,
-        }
+    positions, index = time_index.axis(environment_type, header_rows["ReportingFrequency"].unique())
+
+    # rows: position on the time axis; -1 if the timestep is not part of the axis.
+    data_positions = time_index.positions(data["TimeIndex"])
+    rows = np.searchsorted(positions, data_positions).clip(max=max(len(positions) - 1, 0))
+    valid = (positions[rows] == data_positions) if len(positions) else np.zeros(len(data), dtype=bool)
+
+    # columns: one per output, sorted like the columns of a pivot.
+    header_rows = header_rows.sort_values(["IndexGroup", "KeyValue", "Name"], kind="stable")
+    cols = header_rows.index.get_indexer(data["ReportDataDictionaryIndex"])
+
+    values = np.full((len(index), len(header_rows)), np.nan)
+    values[rows[valid], cols[valid]] = data["Value"].to_numpy()[valid]
+    # like a pivot, only keep the outputs that have values in this environment.
+    reported = np.bincount(cols[valid], minlength=len(header_rows)) > 0
+    if not reported.all():
+        values, header_rows = values[:, reported], header_rows[reported]
+    data = EnergyDataFrame(
+        values,
+        index=index,
+        columns=pd.MultiIndex.from_frame(header_rows[["IndexGroup", "KeyValue", "Name"]]),
     )
-    # Adjust timeindex by timedelta
-    index -= data["Interval"].apply(lambda x: timedelta(minutes=x))
-    index = pd.DatetimeIndex(index, freq="infer")
-    # get data
-    data = data.drop(columns=date_time_names, level="IndexGroup")
-    data.index = index
-    # Create the EnergyDataFrame and set the units using dict
-    data = EnergyDataFrame(data)
     data.units = header_rows.set_index(["IndexGroup", "KeyValue", "Name"])["Units"].to_dict()
     return data
@@ -3,10 +3,12 @@
 import logging
 from collections.abc import Iterable
 
+import numpy as np
 import pandas as pd
 from energy_pandas import EnergyDataFrame
 
 from archetypal.idfclass.extensions import bunch2db
+from archetypal.idfclass.sql import TimeIndex, closing_connection
 from archetypal.reportdata import ReportData
 from archetypal.utils import log
 from geomeppy.patches import EpBunch
@@ -65,21 +67,9 @@ class Variable:
             EnergyDataFrame: The time-series object.
         """
         self._epobject.Reporting_Frequency = reporting_frequency.lower()
-        if self._epobject not in self._idf.idfobjects[self._epobject.key]:
-            self._idf.addidfobject(self._epobject)
-            self._idf.simulate()
+        self._idf._add_missing_outputs([self._epobject])
         if environment_type is None:
-            if self._idf.design_day:
-                environment_type = 1
-            elif self._idf.annual:
-                environment_type = 3
-            else:
-                # the environment_type is specified by the simulationcontrol.
-                try:
-                    for ctrl in self._idf.idfobjects["SIMULATIONCONTROL"]:
-                        environment_type = 3 if ctrl.Run_Simulation_for_Weather_File_Run_Periods.lower() == "yes" else 1
-                except (KeyError, IndexError, AttributeError):
-                    reporting_frequency = 3
+            environment_type = _environment_type(self._idf)
         report = ReportData.from_sqlite(
             sqlite_file=self._idf.sql_file,
             table_name=self._epobject.Variable_Name,
@@ -102,6 +92,99 @@ class Variable:
         )
 
 
+def _environment_type(idf):
+    """Return the environment type of the results of a simulated idf.
+
+    Returns:
+        int: 1 for design days, 3 for weather file run periods, or None if it
+        cannot be determined.
+    """
+    if idf.design_day:
+        return 1
+    elif idf.annual:
+        return 3
+    # the environment_type is specified by the simulationcontrol.
+    environment_type = None
+    try:
+        for ctrl in idf.idfobjects["SIMULATIONCONTROL"]:
+            environment_type = 3 if ctrl.Run_Simulation_for_Weather_File_Run_Periods.lower() == "yes" else 1
+    except (KeyError, IndexError, AttributeError):
+        pass
+    return environment_type
+
+
+def _read_variables(sqlite_file, names, reporting_frequency, environment_type, warmup_flag=0):
+    """Read the time series of several output variables in a single pass.
+
+    Only the dictionary index, time index and value of the ReportData rows are
+    read; the timestamps come from the shared :class:`TimeIndex` of the file.
+
+    Args:
+        sqlite_file (str): The path of the sqlite3 file.
+        names (set of str): The names of the output variables.
+        reporting_frequency (str or list of str): The ReportingFrequency of the
+            outputs, e.g. "Hourly".
+        environment_type (int or list of int, optional): The environment type(s)
+            to keep (1 = Design Day, 2 = Design Run Period, 3 = Weather Run Period).
+            All environments are kept if None.
+        warmup_flag (int): 1 during warmup, 0 otherwise. Defaults to 0.
+
+    Returns:
+        dict: The DataFrame (one column per KeyValue, sorted) and the units of
+        each variable with data, by variable name.
+    """
+    names = sorted(names)
+    frequencies = [reporting_frequency] if isinstance(reporting_frequency, str) else list(reporting_frequency)
+    with closing_connection(str(sqlite_file)) as conn:
+        dictionary = pd.read_sql(
+            f"""SELECT ReportDataDictionaryIndex, KeyValue, Name, Units
+            FROM ReportDataDictionary
+            WHERE Name IN ({", ".join("?" * len(names))})
+            AND ReportingFrequency IN ({", ".join("?" * len(frequencies))});""",
+            conn,
+            params=[*names, *frequencies],
+        )
+        rows = conn.execute(
+            f"""SELECT ReportDataDictionaryIndex, TimeIndex, Value
+            FROM ReportData
+            WHERE ReportDataDictionaryIndex IN ({", ".join("?" * len(dictionary))});""",
+            dictionary["ReportDataDictionaryIndex"].tolist(),
+        ).fetchall()
+    rows = np.array(rows, dtype=float).reshape(-1, 3)
+
+    # keep the rows of the requested environments, outside of the warmup days.
+    time_index = TimeIndex.from_sqlite(sqlite_file)
+    time = time_index.time_table
+    positions = time_index.positions(rows[:, 1])
+    mask = positions >= 0
+    positions = np.where(mask, positions, 0)
+    mask &= (time["WarmupFlag"].fillna(0) == warmup_flag).to_numpy()[positions]
+    if environment_type:
+        if not isinstance(environment_type, (list, tuple)):
+            environment_type = [environment_type]
+        mask &= time["EnvironmentType"].isin(environment_type).to_numpy()[positions]
+    series_index = rows[mask, 0].astype(np.intp)
+    positions = positions[mask]
+    values = rows[mask, 2]
+
+    series = {}
+    for name, entries in dictionary.groupby("Name", sort=False):
+        in_variable = np.isin(series_index, entries["ReportDataDictionaryIndex"].to_numpy())
+        if not in_variable.any():
+            continue
+        units = set(entries["Units"])
+        if len(units) > 1:
+            raise ValueError(f"The DataFrame contains mixed units: {units}")
+        key_values = entries.set_index("ReportDataDictionaryIndex")["KeyValue"]
+        columns = pd.Index(sorted(set(key_values)), name="KeyValue")
+        rows_positions, row = np.unique(positions[in_variable], return_inverse=True)
+        column = columns.get_indexer(key_values.loc[series_index[in_variable]])
+        data = np.full((len(rows_positions), len(columns)), np.nan)
+        data[row, column] = values[in_variable]
+        series[name] = (pd.DataFrame(data, index=time_index.datetimes[rows_positions], columns=columns), units.pop())
+    return series
+
+
 class VariableGroup:
     """A class for sub variable groups (Output:Variable)."""
 
@@ -155,6 +238,17 @@ class VariableGroup:
                 out = EnergyDataFrame([])
             return out
         elif isinstance(output_name, Iterable):
+            # Add all the missing outputs first so that the model is simulated once.
+            output_name = list(output_name)
+            variables = [
+                self._properties[name]
+                for name in map(self.normalize_output_name, output_name)
+                if name in self._properties
+            ]
+            for variable in variables:
+                variable._epobject.Reporting_Frequency = reporting_frequency.lower()
+            self._idf._add_missing_outputs([variable._epobject for variable in variables])
+
             output_values = {}
             for an_output_name in output_name:
                 try:
@@ -174,6 +268,91 @@ class VariableGroup:
             else:
                 return pd.concat(output_values, axis=1, names=["OutputVariable", "Key_Name"])
 
+    def collect_groups(
+        self,
+        groups,
+        reporting_frequency="Hourly",
+        units=None,
+        environment_type=None,
+        normalize=False,
+        sort_values=False,
+    ):
+        """Collect several groups of outputs with a single read of the SQLite file.
+
+        Returns the same data as calling :meth:`collect_by_output_name` for each
+        group, but all the variables are read in one query and split in memory.
+        Missing outputs are added to the model at once, which is then simulated at
+        most once.
+
+        Examples:
+            >>> idf.variables.OutputVariable.collect_groups(
+            >>>     {"cooling": idf.outputs.COOLING, "heating": idf.outputs.HEATING}
+            >>> )
+
+        Args:
+            groups (dict): The output name, or the list of output names, of each
+                group.
+            reporting_frequency (str): Timestep, Hourly, Daily, Monthly,
+                RunPeriod, Environment, Annual or Detailed. Default "Hourly".
+            units (str): Convert original values to another unit.
+            environment_type (int): The environment type (1 = Design Day, 2 = Design
+                Run Period, 3 = Weather Run Period).
+            normalize (bool): Normalize between 0 and 1.
+            sort_values (bool): If True, values are sorted (default ascending=True).
+
+        Returns:
+            dict: The EnergyDataFrame of each group.
+        """
+        variables = {}
+        for output_names in groups.values():
+            for output_name in [output_names] if isinstance(output_names, str) else output_names:
+                variable = self._properties.get(self.normalize_output_name(output_name))
+                if variable is None:
+                    log(f"{output_name} not available as an output for this model.")
+                else:
+                    variables[output_name] = variable
+        for variable in variables.values():
+            variable._epobject.Reporting_Frequency = reporting_frequency.lower()
+        self._idf._add_missing_outputs([variable._epobject for variable in variables.values()])
+
+        frames = {}
+        if variables:
+            if environment_type is None:
+                environment_type = _environment_type(self._idf)
+            names = {variable._epobject.Variable_Name for variable in variables.values()}
+            series = _read_variables(self._idf.sql_file, names, bunch2db[reporting_frequency], environment_type)
+            for output_name, variable in variables.items():
+                name = variable._epobject.Variable_Name
+                if name not in series:
+                    log(
+                        f"The variable is empty for environment_type `{environment_type}`. "
+                        f"Try another environment_type (1, 2 or 3) or specify IDF.annual=True "
+                        f"and rerun the simulation.",
+                        level=logging.WARNING,
+                    )
+                    continue
+                data, data_units = series[name]
+                edf = EnergyDataFrame(data, units=data_units, index=data.index, name=name)
+                if units:
+                    edf.to_units(to_units=units, inplace=True)
+                if normalize:
+                    edf.normalize(inplace=True)
+                if sort_values:
+                    edf.sort_values(sort_values, inplace=True)
+                frames[output_name] = edf
+
+        collected = {}
+        for group, output_names in groups.items():
+            if isinstance(output_names, str):
+                collected[group] = frames.get(output_names, EnergyDataFrame([]))
+                continue
+            output_values = {name: frames[name] for name in output_names if name in frames}
+            if not output_values:
+                collected[group] = EnergyDataFrame([])
+            else:
+                collected[group] = pd.concat(output_values, axis=1, names=["OutputVariable", "Key_Name"])
+        return collected
+
 
 class Variables:
     """Lists available variables in the IDF model.
@@ -6,13 +6,86 @@ import functools
 import time
 
 import numpy as np
-from pandas import DataFrame, read_sql_query, to_numeric
+from pandas import DataFrame, Index, concat, factorize, read_sql_query, to_numeric
 from path import Path
 
+from archetypal.tracing import traced
 from archetypal.utils import log
 
 
-class ReportData(DataFrame):
+class ColumnIndex:
+    """Positions of the rows holding each distinct value of a column.
+
+    The column is factorized once into integer codes; the row positions are
+    then grouped by code so that looking up a value only touches its rows.
+
+    Args:
+        column (pandas.Series): The column to index.
+    """
+
+    def __init__(self, column):
+        codes, uniques = factorize(column)
+        self.uniques = Index(uniques)
+        self.order = np.argsort(codes, kind="stable")
+        # rows with a missing value (code -1) sort first and are never matched.
+        self.bounds = np.searchsorted(codes[self.order], np.arange(len(uniques) + 1))
+
+    def positions(self, values):
+        """Return the sorted positions of the rows equal to any of `values`."""
+        codes = self.uniques.get_indexer(list(values))
+        slices = [self.order[self.bounds[code] : self.bounds[code + 1]] for code in codes if code >= 0]
+        if not slices:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(slices))
+
+
+class IndexedFilterMixin:
+    """Filter a DataFrame by keywords with cached :class:`ColumnIndex` lookups.
+
+    The index of a column is built on its first query and reused by the next
+    ones until the column is assigned again or its values are changed in place,
+    e.g. with ``.loc``, ``.iloc`` or ``.at``.
+    """
+
+    def _column_index(self, column):
+        indexes = self.__dict__.setdefault("_column_indexes", {})
+        if column not in indexes:
+            indexes[column] = ColumnIndex(self[column])
+        return indexes[column]
+
+    def _filter_positions(self, criteria):
+        """Return the positions of the rows matching all the criteria.
+
+        Args:
+            criteria (dict): A value, or a tuple of values combined with a
+                logical or, by column name. Falsy criteria are ignored.
+
+        Returns:
+            numpy.ndarray: The sorted row positions.
+        """
+        positions = None
+        for column, values in criteria.items():
+            if not values:
+                continue
+            if not isinstance(values, tuple):
+                values = (values,)
+            matches = self._column_index(column).positions(values)
+            positions = matches if positions is None else np.intersect1d(positions, matches, assume_unique=True)
+        if positions is None:
+            return np.arange(len(self))
+        return positions
+
+    def _clear_item_cache(self):
+        # called by pandas on every write: column assignment, .loc, .iloc, .at, .iat.
+        self.__dict__.pop("_column_indexes", None)
+        super()._clear_item_cache()
+
+    def _update_inplace(self, result, **kwargs):
+        self.__dict__.pop("_column_indexes", None)
+        return super()._update_inplace(result, **kwargs)
+
+
+class ReportData(IndexedFilterMixin, DataFrame):
     """Handles Report Variable Data and Report Meter Data"""
 
     ARCHETYPE = "Archetype"
@@ -30,6 +103,35 @@ class ReportData(DataFrame):
     SCHEDULENAME = "ScheduleName"
     UNITS = "Units"
 
+    _COLUMNS = (
+        "ReportDataIndex",
+        "TimeIndex",
+        "ReportDataDictionaryIndex",
+        "ReportExtendedDataIndex",
+        "Month",
+        "Day",
+        "Hour",
+        "Minute",
+        "Dst",
+        "Interval",
+        "IntervalType",
+        "SimulationDays",
+        "DayType",
+        "EnvironmentPeriodIndex",
+        "WarmupFlag",
+        "EnvironmentType",
+        "Value",
+        "IsMeter",
+        "Type",
+        "IndexGroup",
+        "TimestepType",
+        "KeyValue",
+        "Name",
+        "ReportingFrequency",
+        "ScheduleName",
+        "Units",
+    )
+
     @classmethod
     def from_sql_dict(cls, sql_dict):
         """Create from dictionary."""
@@ -41,6 +143,7 @@ class ReportData(DataFrame):
         return cls(report_data.reset_index().join(report_data_dict, on=["ReportDataDictionaryIndex"]))
 
     @classmethod
+    @traced
     def from_sqlite(
         cls,
         sqlite_file,
@@ -79,27 +182,17 @@ class ReportData(DataFrame):
 
         import sqlite3
 
+        from archetypal.idfclass.sql import TimeIndex
+
         # create database connection with sqlite3
         with sqlite3.connect(sqlite_file) as conn:
-            # empty dict to hold all DataFrames
-            # Iterate over all tables in the report_tables list
+            # the Time columns are taken from the shared time index of the file
+            # instead of being joined for every row.
             sql_query = """
             SELECT rd.ReportDataIndex,
                    rd.TimeIndex,
                    rd.ReportDataDictionaryIndex,
                    red.ReportExtendedDataIndex,
-                   t.Month,
-                   t.Day,
-                   t.Hour,
-                   t.Minute,
-                   t.Dst,
-                   t.Interval,
-                   t.IntervalType,
-                   t.SimulationDays,
-                   t.DayType,
-                   t.EnvironmentPeriodIndex,
-                   t.WarmupFlag,
-                   p.EnvironmentType,
                    rd.Value,
                    rdd.IsMeter,
                    rdd.Type,
@@ -113,19 +206,21 @@ class ReportData(DataFrame):
             FROM ReportData As rd
                     INNER JOIN ReportDataDictionary As rdd ON rd.ReportDataDictionaryIndex = rdd.ReportDataDictionaryIndex
                     LEFT OUTER JOIN ReportExtendedData As red ON rd.ReportDataIndex = red.ReportDataIndex
-                    INNER JOIN Time As t ON rd.TimeIndex = t.TimeIndex
-                    JOIN EnvironmentPeriods as p ON t.EnvironmentPeriodIndex = p.EnvironmentPeriodIndex
-            WHERE (IFNULL(t.WarmupFlag, 0) = @warmup_flag);
+            WHERE rd.TimeIndex IN (
+                SELECT t.TimeIndex
+                FROM Time As t
+                        JOIN EnvironmentPeriods As p ON t.EnvironmentPeriodIndex = p.EnvironmentPeriodIndex
+                WHERE (IFNULL(t.WarmupFlag, 0) = @warmup_flag));
             """
             params = {"warmup_flag": warmup_flag}
+            if environment_type:
+                conditions, env_name = cls.multiple_conditions("env_name", environment_type, "p.EnvironmentType")
+                sql_query = sql_query.replace("));", f""") AND ({conditions}));""")
+                params.update(env_name)
             if table_name:
                 conditions, table_name = cls.multiple_conditions("table_name", table_name, "Name")
                 sql_query = sql_query.replace(";", f""" AND ({conditions});""")
                 params.update(table_name)
-            if environment_type:
-                conditions, env_name = cls.multiple_conditions("env_name", environment_type, "EnvironmentType")
-                sql_query = sql_query.replace(";", f""" AND ({conditions});""")
-                params.update(env_name)
             if reporting_frequency:
                 conditions, reporting_frequency = cls.multiple_conditions(
                     "reporting_frequency", reporting_frequency, "ReportingFrequency"
@@ -133,7 +228,12 @@ class ReportData(DataFrame):
                 sql_query = sql_query.replace(";", f""" AND ({conditions});""")
                 params.update(reporting_frequency)
             df = cls.execute(conn, sql_query, params)
-            return cls(df)
+
+        time_index = TimeIndex.from_sqlite(sqlite_file)
+        positions = time_index.positions(df[cls.TIMEINDEX])
+        time = time_index.time_table.iloc[positions].reset_index(drop=True)
+        df = concat([df.drop(columns=[cls.TIMEINDEX]), time], axis=1)[positions >= 0]
+        return cls(df[list(cls._COLUMNS)].reset_index(drop=True))
 
     @staticmethod
     def multiple_conditions(basename, cond_names, var_name):
@@ -214,147 +314,26 @@ class ReportData(DataFrame):
             pandas.DataFrame
         """
         start_time = time.time()
-        c_n = []
-
-        if archetype:
-            c_1 = (
-                conjunction(
-                    *[self[self.ARCHETYPE] == archetype for archetype in archetype],
-                    logical=np.logical_or,
-                )
-                if isinstance(archetype, tuple)
-                else self[self.ARCHETYPE] == archetype
-            )
-            c_n.append(c_1)
-        if reportdataindex:
-            c_2 = (
-                conjunction(
-                    *[self[self.REPORTDATAINDEX] == reportdataindex for reportdataindex in reportdataindex],
-                    logical=np.logical_or,
-                )
-                if isinstance(reportdataindex, tuple)
-                else self[self.REPORTDATAINDEX] == reportdataindex
-            )
-            c_n.append(c_2)
-        if timeindex:
-            c_3 = (
-                conjunction(
-                    *[self[self.TIMEINDEX] == timeindex for timeindex in timeindex],
-                    logical=np.logical_or,
-                )
-                if isinstance(timeindex, tuple)
-                else self[self.TIMEINDEX] == timeindex
-            )
-            c_n.append(c_3)
-        if reportdatadictionaryindex:
-            c_4 = (
-                conjunction(
-                    *[
-                        self[self.REPORTDATADICTIONARYINDEX] == reportdatadictionaryindex
-                        for reportdatadictionaryindex in reportdatadictionaryindex
-                    ],
-                    logical=np.logical_or,
-                )
-                if isinstance(reportdatadictionaryindex, tuple)
-                else self[self.REPORTDATADICTIONARYINDEX] == reportdatadictionaryindex
-            )
-            c_n.append(c_4)
-        if value:
-            c_5 = (
-                conjunction(
-                    *[self[self.VALUE] == value for value in value],
-                    logical=np.logical_or,
-                )
-                if isinstance(value, tuple)
-                else self[self.VALUE] == value
-            )
-            c_n.append(c_5)
-        if ismeter:
-            c_6 = (
-                conjunction(
-                    *[self[self.ISMETER] == ismeter for ismeter in ismeter],
-                    logical=np.logical_or,
-                )
-                if isinstance(ismeter, tuple)
-                else self[self.ISMETER] == ismeter
-            )
-            c_n.append(c_6)
-        if report_type:
-            c_7 = (
-                conjunction(*[self[self.TYPE] == t for t in report_type], logical=np.logical_or)
-                if isinstance(report_type, tuple)
-                else self[self.TYPE] == report_type
-            )
-            c_n.append(c_7)
-        if indexgroup:
-            c_8 = (
-                conjunction(
-                    *[self[self.INDEXGROUP] == indexgroup for indexgroup in indexgroup],
-                    logical=np.logical_or,
-                )
-                if isinstance(indexgroup, tuple)
-                else self[self.INDEXGROUP] == indexgroup
-            )
-            c_n.append(c_8)
-        if timesteptype:
-            c_9 = (
-                conjunction(
-                    *[self[self.TIMESTEPTYPE] == timesteptype for timesteptype in timesteptype],
-                    logical=np.logical_or,
-                )
-                if isinstance(timesteptype, tuple)
-                else self[self.TIMESTEPTYPE] == timesteptype
-            )
-            c_n.append(c_9)
-        if keyvalue:
-            c_10 = (
-                conjunction(
-                    *[self[self.KEYVALUE] == keyvalue for keyvalue in keyvalue],
-                    logical=np.logical_or,
-                )
-                if isinstance(keyvalue, tuple)
-                else self[self.KEYVALUE] == keyvalue
-            )
-            c_n.append(c_10)
-        if name:
-            c_11 = (
-                conjunction(*[self[self.NAME] == name for name in name], logical=np.logical_or)
-                if isinstance(name, tuple)
-                else self[self.NAME] == name
-            )
-            c_n.append(c_11)
-        if reportingfrequency:
-            c_12 = (
-                conjunction(
-                    *[self[self.REPORTINGFREQUENCY] == reportingfrequency for reportingfrequency in reportingfrequency],
-                    logical=np.logical_or,
-                )
-                if isinstance(reportingfrequency, tuple)
-                else self[self.REPORTINGFREQUENCY] == reportingfrequency
-            )
-            c_n.append(c_12)
-        if schedulename:
-            c_13 = (
-                conjunction(
-                    *[self[self.SCHEDULENAME] == schedulename for schedulename in schedulename],
-                    logical=np.logical_or,
-                )
-                if isinstance(schedulename, tuple)
-                else self[self.SCHEDULENAME] == schedulename
-            )
-            c_n.append(c_13)
-        if units:
-            c_14 = (
-                conjunction(
-                    *[self[self.UNITS] == units for units in units],
-                    logical=np.logical_or,
-                )
-                if isinstance(units, tuple)
-                else self[self.UNITS] == units
-            )
-            c_n.append(c_14)
+        positions = self._filter_positions(
+            {
+                self.ARCHETYPE: archetype,
+                self.REPORTDATAINDEX: reportdataindex,
+                self.TIMEINDEX: timeindex,
+                self.REPORTDATADICTIONARYINDEX: reportdatadictionaryindex,
+                self.VALUE: value,
+                self.ISMETER: ismeter,
+                self.TYPE: report_type,
+                self.INDEXGROUP: indexgroup,
+                self.TIMESTEPTYPE: timesteptype,
+                self.KEYVALUE: keyvalue,
+                self.NAME: name,
+                self.REPORTINGFREQUENCY: reportingfrequency,
+                self.SCHEDULENAME: schedulename,
+                self.UNITS: units,
+            }
+        )
 
-        filtered_df = self.loc[conjunction(*c_n, logical=np.logical_and)]
+        filtered_df = self.iloc[positions]
         log(f"filtered ReportData in {time.time() - start_time:,.2f} seconds")
         if inplace:
             return filtered_df._update_inplace(filtered_df)
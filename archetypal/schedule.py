@@ -7,7 +7,6 @@ import functools
 import io
 import logging as lg
 from datetime import datetime, timedelta
-from itertools import groupby
 from typing import Literal
 
 import matplotlib.pyplot as plt
@@ -17,8 +16,14 @@ from energy_pandas import EnergySeries
 from eppy.bunch_subclass import BadEPFieldError
 from validator_collection import checkers, validators
 
+from archetypal import settings
+from archetypal.tracing import traced
 from archetypal.utils import log
 
+# Schedule series are in the archetypal units (e.g. Fraction), which are defined
+# when the energy_pandas registry is first loaded.
+unit_registry = settings.unit_registry
+
 
 class ScheduleTypeLimits:
     """ScheduleTypeLimits class."""
@@ -1002,6 +1007,12 @@ class _ScheduleParser:
             return lambda x: x.index == date
 
 
+def _month_and_day(dates):
+    """Return the months and days of the month of an array of datetime64[D]."""
+    months = dates.astype("datetime64[M]")
+    return (months.astype(int) % 12 + 1).tolist(), ((dates - months).astype(int) + 1).tolist()
+
+
 class Schedule:
     """Class handling any EnergyPlus schedule object."""
 
@@ -1100,6 +1111,7 @@ class Schedule:
         return cls(Name=Name, Values=Values, Type=Type, **kwargs)
 
     @classmethod
+    @traced
     def from_epbunch(cls, epbunch, strict=False, Type=None, **kwargs):
         """Create a Schedule from an epbunch.
 
@@ -1300,97 +1312,120 @@ class Schedule:
               objects
             - **daily** (*list of Schedule*):The list of daily schedule objects
         """
-        from archetypal.template.schedule import (
-            DaySchedule,
-            WeekSchedule,
-            YearSchedule,
-            YearSchedulePart,
-        )
+        from archetypal.template.schedule import DaySchedule
 
-        full_year = np.array(self.all_values)  # array of shape (8760,)
+        # unique days of the (365, 24) values, sorted by value
+        unique_days, day_index = np.unique(np.asarray(self.all_values).reshape(-1, 24), axis=0, return_inverse=True)
+        ep_days = [
+            DaySchedule(Name=f"d_{self.Name}_{count_day:02d}", Type=self.Type, Values=unique_day.tolist())
+            for count_day, unique_day in enumerate(unique_days)
+        ]
+        ep_year, ep_weeks = self._year_week_from_days(day_index.reshape(-1), ep_days)
+        return ep_year, ep_weeks, ep_days
 
-        # reshape to (365, 24)
-        Values = full_year.reshape(-1, 24)  # shape (365, 24)
+    @classmethod
+    def to_year_week_day_many(cls, schedules):
+        """Convert many schedules at once, sharing their identical day profiles.
 
-        # create unique days
-        unique_days, nds = np.unique(Values, axis=0, return_inverse=True)
+        The days of all the schedules are deduplicated together: schedules of the
+        same Type that contain the same day profile reference the same
+        DaySchedule object, named after the first schedule that uses it.
+        Otherwise, the result is the same as calling :meth:`to_year_week_day` on
+        each schedule.
 
-        ep_days = []
-        dict_day = {}
-        for count_day, unique_day in enumerate(unique_days):
-            name = f"d_{self.Name}_{count_day:02d}"
-            dict_day[name] = unique_day
+        Args:
+            schedules (list of Schedule): The schedules to convert.
 
-            # Create idf_objects for schedule:day:hourly
-            ep_day = DaySchedule(Name=name, Type=self.Type, Values=[unique_day[i] for i in range(24)])
-            ep_days.append(ep_day)
+        Returns:
+            list of tuple: The (yearly, weekly, daily) tuple of each schedule.
+        """
+        from archetypal.template.schedule import DaySchedule
+
+        schedules = list(schedules)
+        if not schedules:
+            return []
+        values = [np.asarray(schedule.all_values).reshape(-1, 24) for schedule in schedules]
+        unique_days, day_index = np.unique(np.concatenate(values), axis=0, return_inverse=True)
+        bounds = np.cumsum([0] + [len(days) for days in values])
+
+        shared_days = {}
+        results = []
+        for schedule, start, stop in zip(schedules, bounds[:-1], bounds[1:]):
+            used_days, local_index = np.unique(day_index.reshape(-1)[start:stop], return_inverse=True)
+            type_key = getattr(schedule.Type, "Name", schedule.Type)
+            ep_days = []
+            for count_day, i in enumerate(used_days.tolist()):
+                if (type_key, i) not in shared_days:
+                    shared_days[type_key, i] = DaySchedule(
+                        Name=f"d_{schedule.Name}_{count_day:02d}",
+                        Type=schedule.Type,
+                        Values=unique_days[i].tolist(),
+                    )
+                ep_days.append(shared_days[type_key, i])
+            # the days of the schedule are in value order, as in to_year_week_day
+            ep_year, ep_weeks = schedule._year_week_from_days(local_index, ep_days)
+            results.append((ep_year, ep_weeks, ep_days))
+        return results
+
+    def _year_week_from_days(self, day_index, ep_days):
+        """Create the week and year schedules of a sequence of days.
+
+        Weeks are deduplicated on the indices of their days and the year is
+        run-length encoded into one part per run of identical weeks.
 
-        # create unique weeks from unique days
-        try:
-            unique_weeks, nwsi, nws, count = np.unique(
-                full_year[: 364 * 24, ...].reshape(-1, 168),
-                return_index=True,
-                axis=0,
-                return_inverse=True,
-                return_counts=True,
-            )
-        except ValueError as e:
-            raise ValueError("Looks like the idf model needs to be rerun with 'annual=True'") from e
+        Args:
+            day_index (np.ndarray): The index in `ep_days` of each day of the year.
+            ep_days (list of DaySchedule): The unique days, sorted by value.
 
-        # We use the calendar module to set the week days order
-        import calendar
+        Returns:
+            tuple: The YearSchedule and the list of its unique WeekSchedules.
+        """
+        from archetypal.template.schedule import (
+            WeekSchedule,
+            YearSchedule,
+            YearSchedulePart,
+        )
 
-        # initialize the calendar object
-        c = calendar.Calendar(firstweekday=self.startDayOfTheWeek)
-
-        # Appending unique weeks in dictionary with name and values of weeks as
-        # keys
-        # {'name_week': {'dayName':[]}}
-        dict_week = {}
-        for count_week, unique_week in enumerate(unique_weeks):
-            week_id = f"w_{self.Name}_{count_week:02d}"
-            dict_week[week_id] = {}
-            for i, day in zip(list(range(0, 7)), list(c.iterweekdays())):
-                day_of_week = unique_week[..., i * 24 : (i + 1) * 24]
-                for key, ep_day in zip(dict_day, ep_days):
-                    if (day_of_week == dict_day[key]).all():
-                        dict_week[week_id][f"day_{day}"] = ep_day
-
-        # Create idf_objects for schedule:week:daily
-
-        # Create ep_weeks list and iterate over dict_week
-        ep_weeks = {}
-        for week_id in dict_week:
-            ep_week = WeekSchedule(
-                Name=week_id,
-                Days=[dict_week[week_id][f"day_{day_num}"] for day_num in c.iterweekdays()],
-            )
-            ep_weeks[week_id] = ep_week
-
-        blocks = {}
-        from_date = datetime(self.year, 1, 1)
-        bincount = [sum(1 for _ in group) for key, group in groupby(nws + 1) if key]
-        week_order = dict(enumerate(np.array([key for key, group in groupby(nws + 1) if key]) - 1))
-        for i, (_, count) in enumerate(zip(week_order, bincount)):
-            week_id = list(dict_week)[week_order[i]]
-            to_date = from_date + timedelta(days=int(count * 7), hours=-1)
-            blocks[i] = YearSchedulePart(
-                FromDay=from_date.day,
-                FromMonth=from_date.month,
-                ToDay=to_date.day,
-                ToMonth=to_date.month,
-                Schedule=ep_weeks[week_id],
+        # create unique weeks from unique days. Since days are sorted by value,
+        # weeks come out in the same order as if they were sorted by value.
+        weeks = day_index[:364]
+        if len(weeks) % 7:
+            raise ValueError("Looks like the idf model needs to be rerun with 'annual=True'")
+        unique_weeks, week_index = np.unique(weeks.reshape(-1, 7), axis=0, return_inverse=True)
+        week_index = week_index.reshape(-1)
+        ep_weeks = [
+            WeekSchedule(
+                Name=f"w_{self.Name}_{count_week:02d}",
+                Days=[ep_days[i] for i in unique_week],
             )
-            from_date = to_date + timedelta(hours=1)
-
-            # If this is the last block, force end of year
-            if i == len(bincount) - 1:
-                blocks[i].ToDay = 31
-                blocks[i].ToMonth = 12
+            for count_week, unique_week in enumerate(unique_weeks.tolist())
+        ]
 
-        ep_year = YearSchedule(self.Name, Type=self.Type, Parts=list(blocks.values()))
+        # run-length encode the sequence of weeks
+        starts = np.flatnonzero(np.diff(week_index, prepend=-1))
+        stops = np.append(starts[1:], len(week_index))
+        jan_1 = np.datetime64(f"{self.year}-01-01", "D")
+        from_dates = jan_1 + 7 * starts
+        to_dates = jan_1 + 7 * stops - 1
+        parts = [
+            YearSchedulePart(
+                FromDay=from_day,
+                FromMonth=from_month,
+                ToDay=to_day,
+                ToMonth=to_month,
+                Schedule=ep_weeks[week],
+            )
+            for from_month, from_day, to_month, to_day, week in zip(
+                *_month_and_day(from_dates), *_month_and_day(to_dates), week_index[starts].tolist()
+            )
+        ]
+        # force end of year on the last part
+        if parts:
+            parts[-1].ToDay = 31
+            parts[-1].ToMonth = 12
 
-        return ep_year, list(ep_weeks.values()), ep_days
+        ep_year = YearSchedule(self.Name, Type=self.Type, Parts=parts)
+        return ep_year, ep_weeks
 
     def __len__(self):
         """Get the length of all values of the schedule."""
@@ -4,10 +4,12 @@ import time
 import numpy as np
 import pandas as pd
 
+from archetypal.reportdata import IndexedFilterMixin
+from archetypal.tracing import traced
 from archetypal.utils import log
 
 
-class TabularData(pd.DataFrame):
+class TabularData(IndexedFilterMixin, pd.DataFrame):
     """This class serves as a subclass of a pandas DataFrame allowing to add
     additional functionnality
     """
@@ -23,6 +25,7 @@ class TabularData(pd.DataFrame):
     UNITS = "Units"
 
     @classmethod
+    @traced
     def from_sql(cls, sql_dict):
         """Returns a DataFrame from the 'TabularDataWithStrings' table
 
@@ -81,86 +84,21 @@ class TabularData(pd.DataFrame):
             pandas.DataFrame
         """
         start_time = time.time()
-        c_n = []
-
-        if archetype:
-            c_1 = (
-                conjunction(*[self[self.ARCHETYPE] == archetype for archetype in archetype], logical=np.logical_or)
-                if isinstance(archetype, tuple)
-                else self[self.ARCHETYPE] == archetype
-            )
-            c_n.append(c_1)
-        if tabulardataindex:
-            c_2 = (
-                conjunction(
-                    *[self[self.TABULARDATAINDEX] == tabulardataindex for tabulardataindex in tabulardataindex],
-                    logical=np.logical_or,
-                )
-                if isinstance(tabulardataindex, tuple)
-                else self[self.TABULARDATAINDEX] == tabulardataindex
-            )
-            c_n.append(c_2)
-        if value:
-            c_3 = (
-                conjunction(*[self[self.VALUE] == value for value in value], logical=np.logical_or)
-                if isinstance(value, tuple)
-                else self[self.VALUE] == value
-            )
-            c_n.append(c_3)
-        if reportname:
-            c_4 = (
-                conjunction(*[self[self.REPORTNAME] == reportname for reportname in reportname], logical=np.logical_or)
-                if isinstance(reportname, tuple)
-                else self[self.REPORTNAME] == reportname
-            )
-            c_n.append(c_4)
-        if value:
-            c_5 = (
-                conjunction(*[self[self.VALUE] == value for value in value], logical=np.logical_or)
-                if isinstance(value, tuple)
-                else self[self.VALUE] == value
-            )
-            c_n.append(c_5)
-        if reportforstring:
-            c_6 = (
-                conjunction(
-                    *[self[self.REPORTFORSTRING] == reportforstring for reportforstring in reportforstring],
-                    logical=np.logical_or,
-                )
-                if isinstance(reportforstring, tuple)
-                else self[self.REPORTFORSTRING] == reportforstring
-            )
-            c_n.append(c_6)
-        if tablename:
-            c_7 = (
-                conjunction(*[self[self.TABLENAME] == tablename for tablename in tablename], logical=np.logical_or)
-                if isinstance(tablename, tuple)
-                else self[self.TABLENAME] == tablename
-            )
-            c_n.append(c_7)
-        if rowname:
-            c_8 = (
-                conjunction(*[self[self.ROWNAME] == rowname for rowname in rowname], logical=np.logical_or)
-                if isinstance(rowname, tuple)
-                else self[self.ROWNAME] == rowname
-            )
-            c_n.append(c_8)
-        if columnname:
-            c_9 = (
-                conjunction(*[self[self.COLUMNNAME] == columnname for columnname in columnname], logical=np.logical_or)
-                if isinstance(columnname, tuple)
-                else self[self.COLUMNNAME] == columnname
-            )
-            c_n.append(c_9)
-        if units:
-            c_14 = (
-                conjunction(*[self[self.UNITS] == units for units in units], logical=np.logical_or)
-                if isinstance(units, tuple)
-                else self[self.UNITS] == units
-            )
-            c_n.append(c_14)
-
-        filtered_df = self.loc[conjunction(*c_n, logical=np.logical_and)]
+        positions = self._filter_positions(
+            {
+                self.ARCHETYPE: archetype,
+                self.TABULARDATAINDEX: tabulardataindex,
+                self.VALUE: value,
+                self.REPORTNAME: reportname,
+                self.REPORTFORSTRING: reportforstring,
+                self.TABLENAME: tablename,
+                self.ROWNAME: rowname,
+                self.COLUMNNAME: columnname,
+                self.UNITS: units,
+            }
+        )
+
+        filtered_df = self.iloc[positions]
         log(f"filtered TabularData in {time.time() - start_time:,.2f} seconds")
         if inplace:
             return filtered_df._update_inplace(filtered_df)
@@ -6,9 +6,13 @@
 ################################################################################
 
 import collections
+import contextlib
+import inspect
+import io
 import logging as lg
+import multiprocessing
 import time
-from itertools import chain, repeat
+from concurrent.futures import ProcessPoolExecutor
 from typing import ClassVar
 
 import networkx
@@ -21,10 +25,12 @@ from archetypal.template.dhw import DomesticHotWaterSetting
 from archetypal.template.materials.material_layer import MaterialLayer
 from archetypal.template.schedule import YearSchedulePart
 from archetypal.template.structure import MassRatio, StructureInformation
+from archetypal.template.translation_cache import translation_cache
 from archetypal.template.umi_base import UmiBase
 from archetypal.template.window_setting import WindowSetting
 from archetypal.template.zonedefinition import ZoneDefinition
-from archetypal.utils import log, reduce
+from archetypal.tracing import traced
+from archetypal.utils import log, parallel_process
 
 
 class BuildingTemplate(UmiBase):
@@ -335,21 +341,31 @@ class BuildingTemplate(UmiBase):
         )
 
     @classmethod
-    def from_idf(cls, idf, **kwargs):
+    @traced
+    def from_idf(cls, idf, processors=1, **kwargs):
         """Create a BuildingTemplate from an IDF object.
 
+        Zones are independent once the simulation results exist, so their
+        :class:`ZoneDefinition` can be created by a pool of worker processes. The
+        first zone is always created serially so that model-level work it
+        triggers (e.g. adding missing meters and re-simulating, parsing the
+        schedules) is done before the workers start. Each worker then reads the
+        model once and translates the zones it is sent with a single translation
+        cache. Zones are merged back in the model order, which gives the same
+        result as the serial path, except that components are only shared
+        between the zones of a same worker.
+
         Args:
-            idf (IDF):
-            **kwargs:
+            idf (IDF): The IDF model.
+            processors (int): The number of worker processes used to create the
+                zones. If -1, one per cpu. Defaults to 1 (serial).
+            **kwargs: keywords passed to the ZoneDefinition and BuildingTemplate
+                constructors.
         """
         # initialize empty BuildingTemplate
         name = kwargs.pop("Name", Path(idf.name).stem)
 
-        epbunch_zones = idf.idfobjects["ZONE"]
-        zones = [
-            ZoneDefinition.from_epbunch(ep_zone, allow_duplicates=True, **kwargs)
-            for ep_zone in tqdm(epbunch_zones, desc=f"Creating UMI objects for {name}")
-        ]
+        zones = _zones_from_idf(idf, name, processors=processors, **kwargs)
         # do core and Perim zone reduction
         bt = cls.reduced_model(name, zones, **kwargs)
 
@@ -373,6 +389,7 @@ class BuildingTemplate(UmiBase):
         return bt
 
     @classmethod
+    @traced
     def reduced_model(cls, name, zones, **kwargs):
         """Create reduced BuildingTemplate from list of ZoneDefinitions.
 
@@ -391,35 +408,20 @@ class BuildingTemplate(UmiBase):
         log("Initiating complexity reduction...")
         start_time = time.time()
 
-        cores = list(
-            chain.from_iterable([list(repeat(zone.duplicate(), zone.multiplier)) for zone in zones if zone.is_core])
-        )
-        perimeters = list(
-            chain.from_iterable([list(repeat(zone.duplicate(), zone.multiplier)) for zone in zones if not zone.is_core])
-        )
+        # zone multipliers become weights instead of repeating zones
+        cores = [zone for zone in zones if zone.is_core]
+        perimeters = [zone for zone in zones if not zone.is_core]
         assert len(perimeters) >= 1, "Building complexity reduction must have at least one perimeter zone."
 
         Core = None
         # reduce list of core zones
         if cores:
-            Core = reduce(
-                ZoneDefinition.combine,
-                tqdm(
-                    cores,
-                    desc=f"Reducing core zones in {name}",
-                ),
-            )
+            Core = ZoneDefinition.combine_many(cores, weights=[zone.multiplier for zone in cores])
             Core.Name = f"{name}_ZoneDefinition_Core"  # set name
 
         Perimeter = None
         if perimeters:
-            Perimeter = reduce(
-                ZoneDefinition.combine,
-                tqdm(
-                    zones,
-                    desc=f"Reducing perimeter zones in {name}",
-                ),
-            )
+            Perimeter = ZoneDefinition.combine_many(perimeters, weights=[zone.multiplier for zone in perimeters])
             Perimeter.Name = f"{name}_ZoneDefinition_Perimeter"
 
         # If all perimeter zones, assign self.Perimeter to core.
@@ -622,3 +624,89 @@ class BuildingTemplate(UmiBase):
     @property
     def children(self):
         return self.Core, self.Perimeter, self.Structure, self.Windows
+
+
+def _zones_from_idf(idf, name, processors=1, **kwargs):
+    """Create the ZoneDefinition of each zone of `idf`, in the model order.
+
+    Args:
+        idf (IDF): The IDF model.
+        name (str): The name of the template, shown in the progress bar.
+        processors (int): The number of worker processes. If -1, one per cpu.
+        **kwargs: keywords passed to :meth:`ZoneDefinition.from_epbunch`.
+
+    Returns:
+        list of ZoneDefinition: The zones.
+    """
+    epbunch_zones = list(idf.idfobjects["ZONE"])
+    if processors == -1:
+        processors = min(len(epbunch_zones) - 1, multiprocessing.cpu_count())
+    # Surfaces share a handful of constructions: translate each one only once.
+    with translation_cache(idf):
+        if processors <= 1 or len(epbunch_zones) < 2:
+            return [
+                ZoneDefinition.from_epbunch(ep_zone, allow_duplicates=True, **kwargs)
+                for ep_zone in tqdm(epbunch_zones, desc=f"Creating UMI objects for {name}")
+            ]
+        first, *others = epbunch_zones
+        zones = [ZoneDefinition.from_epbunch(first, allow_duplicates=True, **kwargs)]
+
+    # Each worker process reads the model once, as in IDF.saveas, and is sent zone names.
+    parameters = inspect.signature(type(idf).__init__).parameters
+    arguments = {key: getattr(idf, key) for key in parameters if key not in ("self", "idfname", "kwargs")}
+    # the outputs were already added to the model.
+    arguments["prep_outputs"] = False
+    results = parallel_process(
+        {i: dict(zone_name=ep_zone.Name, **kwargs) for i, ep_zone in enumerate(others)},
+        _zone_from_name,
+        processors=processors,
+        use_kwargs=True,
+        debug=True,
+        executor=ProcessPoolExecutor,
+        initializer=_load_worker_model,
+        initargs=(type(idf), idf.idfstr(), arguments),
+    )
+    zones.extend(_adopt_components(results[i]) for i in range(len(others)))
+    return zones
+
+
+# The model read by a worker process of _zones_from_idf and its translation cache.
+_worker_model = None
+_worker_cache = contextlib.ExitStack()
+
+
+def _load_worker_model(model_class, idf_string, arguments):
+    """Read the model in a worker process and keep its translation cache open.
+
+    The cache lives as long as the worker, so the zones it creates share their
+    components, as in the serial path.
+    """
+    global _worker_model
+    _worker_cache.close()
+    _worker_model = model_class(io.StringIO(idf_string), **arguments)
+    _worker_cache.enter_context(translation_cache(_worker_model))
+
+
+def _zone_from_name(zone_name, **kwargs):
+    """Create the ZoneDefinition of a zone of the model read by the worker."""
+    ep_zone = _worker_model.getobject("ZONE", zone_name)
+    return ZoneDefinition.from_epbunch(ep_zone, allow_duplicates=True, **kwargs)
+
+
+def _adopt_components(zone):
+    """Make the components of a zone received from a worker process objects of this process.
+
+    Unpickled objects skip their constructor: each one gets a new id and unit
+    number and is added to the created objects of its class.
+    """
+    from archetypal.umi_template import parent_key_child_traversal
+
+    components = {id(zone): zone}
+    components.update((id(child), child) for _, _, child in parent_key_child_traversal(zone))
+    for component in components.values():
+        component.id = None
+        component.unit_number = next(UmiBase._ids)
+        created_objects = getattr(type(component), "_CREATED_OBJECTS", None)
+        if created_objects is not None:
+            created_objects.append(component)
+    return zone
@@ -1294,6 +1294,63 @@ class ZoneConditioning(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None):
+        """Combine many ZoneConditioning objects together.
+
+        Args:
+            objects (list of ZoneConditioning): The ZoneConditioning objects to
+                combine.
+            weights (list-like, optional): A multiplier for each object (e.g. the
+                zone multiplier). The area of each object is multiplied by it to
+                weight the averages. If None, 1 is used.
+
+        Returns:
+            (ZoneConditioning): the combined ZoneConditioning object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        first = objects[0]
+        if all(obj == first for obj in objects[1:]):
+            return first
+
+        areas = weights * [obj.area for obj in objects]
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+
+        new_attr = {
+            "CoolingLimitType": max(obj.CoolingLimitType for obj in objects),
+            "EconomizerType": max(obj.EconomizerType for obj in objects),
+            "HeatRecoveryType": max(obj.HeatRecoveryType for obj in objects),
+            "HeatingLimitType": max(obj.HeatingLimitType for obj in objects),
+            "IsCoolingOn": any(obj.IsCoolingOn for obj in objects),
+            "IsHeatingOn": any(obj.IsHeatingOn for obj in objects),
+            "IsMechVentOn": any(obj.IsMechVentOn for obj in objects),
+            "HeatingSchedule": UmiSchedule.combine_many([obj.HeatingSchedule for obj in objects], areas),
+            "CoolingSchedule": UmiSchedule.combine_many([obj.CoolingSchedule for obj in objects], areas),
+            "MechVentSchedule": UmiSchedule.combine_many([obj.MechVentSchedule for obj in objects], areas),
+            "area": 1 if all(obj.area == 1 for obj in objects) else float(areas.sum()),
+        }
+        for attr in (
+            "CoolingCoeffOfPerf",
+            "CoolingSetpoint",
+            "HeatRecoveryEfficiencyLatent",
+            "HeatRecoveryEfficiencySensible",
+            "HeatingCoeffOfPerf",
+            "HeatingSetpoint",
+            "MaxCoolFlow",
+            "MaxCoolingCapacity",
+            "MaxHeatFlow",
+            "MaxHeatingCapacity",
+            "MinFreshAirPerArea",
+            "MinFreshAirPerPerson",
+        ):
+            new_attr[attr] = cls.float_mean_many(objects, attr, areas)
+        # create a new object with the combined attributes
+        new_obj = cls(**meta, **new_attr, allow_duplicates=first.allow_duplicates)
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def validate(self):
         """Validate object and fill in missing values."""
         if self.HeatingSchedule is None:
@@ -4,6 +4,7 @@ from operator import add
 from validator_collection import validators
 
 from archetypal.template.constructions.opaque_construction import OpaqueConstruction
+from archetypal.template.translation_cache import translate
 
 
 class InternalMass:
@@ -69,7 +70,9 @@ class InternalMass:
         # one.
         for int_obj in internal_mass_objs:
             if int_obj.key.upper() == "INTERNALMASS":
-                mass_opaque_constructions.append(OpaqueConstruction.from_epbunch(int_obj, Category="Internal Mass"))
+                mass_opaque_constructions.append(
+                    translate(int_obj, OpaqueConstruction.from_epbunch, Category="Internal Mass")
+                )
                 area += float(int_obj.Surface_Area)
 
         # If one or more constructions, combine them into one.
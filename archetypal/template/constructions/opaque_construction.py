@@ -11,6 +11,7 @@ from validator_collection import validators
 from archetypal.template.constructions.base_construction import LayeredConstruction
 from archetypal.template.materials.material_layer import MaterialLayer
 from archetypal.template.materials.opaque_material import OpaqueMaterial
+from archetypal.template.translation_cache import translate
 
 
 class OpaqueConstruction(LayeredConstruction):
@@ -215,6 +216,35 @@ class OpaqueConstruction(LayeredConstruction):
         new_obj.area = sum(weights)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None, method="dominant_wall"):
+        """Combine many OpaqueConstruction objects together.
+
+        Args:
+            objects (list of OpaqueConstruction): The constructions to combine.
+            weights (list-like, optional): One weight per construction, e.g. its
+                area. Only used by the 'constant_ufactor' method, where they
+                replace the area of each construction. If None, the areas are used.
+            method (str): Equivalent wall assembly method. See :meth:`combine`.
+
+        Returns:
+            (OpaqueConstruction): the combined OpaqueConstruction object.
+        """
+        if method == "dominant_wall":
+            objects, weights = cls._combinable(objects, weights)
+            # Same as the pairwise reduction: the first construction dominates.
+            return next(iter(objects), None)
+        if weights is not None:
+            objects, weights = cls._combinable(objects, weights)
+            weighted = []
+            for obj, weight in zip(objects, weights):
+                # a copy carries the weight, so the constructions keep their area.
+                obj = obj.__class__(**obj.mapping(validate=False))
+                obj.area = weight
+                weighted.append(obj)
+            objects = weighted
+        return super().combine_many(objects, method=method)
+
     def dominant_wall(self, other, weights):
         """Return dominant wall construction between self and other.
 
@@ -426,7 +456,7 @@ class OpaqueConstruction(LayeredConstruction):
             # Iterate over the construction's layers
             material = epbunch.get_referenced_object(layer)
             if material:
-                o = OpaqueMaterial.from_epbunch(material, allow_duplicates=False)
+                o = translate(material, OpaqueMaterial.from_epbunch, allow_duplicates=False)
                 try:
                     thickness = material.Thickness
                 except BadEPFieldError:
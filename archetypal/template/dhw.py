@@ -385,6 +385,49 @@ class DomesticHotWaterSetting(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None, **kwargs):
+        """Combine many DomesticHotWaterSetting objects together.
+
+        Like :meth:`combine`, the WaterSchedule is averaged via the final quantity,
+        the peak flow rate [m3/hr/m2] * area [m2], so that the total water volume
+        is kept.
+
+        Args:
+            objects (list of DomesticHotWaterSetting): The objects to combine.
+            weights (list-like, optional): A multiplier for each object (e.g. the
+                zone multiplier). The area of each object is multiplied by it to
+                weight the averages. If None, 1 is used.
+            **kwargs: keywords passed to the constructor.
+
+        Returns:
+            (DomesticHotWaterSetting): a new combined object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        first = objects[0]
+        if all(obj == first for obj in objects[1:]):
+            return first
+
+        areas = weights * [obj.area for obj in objects]
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+        new_obj = cls(
+            WaterSchedule=UmiSchedule.combine_many(
+                [obj.WaterSchedule for obj in objects],
+                weights=areas * [obj.FlowRatePerFloorArea for obj in objects],
+            ),
+            IsOn=any(obj.IsOn for obj in objects),
+            FlowRatePerFloorArea=cls.float_mean_many(objects, "FlowRatePerFloorArea", areas),
+            WaterSupplyTemperature=cls.float_mean_many(objects, "WaterSupplyTemperature", areas),
+            WaterTemperatureInlet=cls.float_mean_many(objects, "WaterTemperatureInlet", areas),
+            area=float(areas.sum()),
+            **meta,
+            **kwargs,
+        )
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def validate(self):
         """Validate object and fill in missing values."""
         return self
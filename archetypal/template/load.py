@@ -3,16 +3,15 @@
 import collections
 import logging as lg
 import math
-import sqlite3
 from enum import Enum
 from typing import ClassVar
 
 import numpy as np
-import pandas as pd
 from sigfig import round
 from validator_collection import checkers, validators
 
 from archetypal import settings
+from archetypal.idfclass.sql import nominal_loads
 from archetypal.template.schedule import UmiSchedule
 from archetypal.template.umi_base import UmiBase
 from archetypal.utils import log, reduce, timeit
@@ -361,111 +360,66 @@ class ZoneLoad(UmiBase):
         if not zone._is_part_of_total_floor_area:
             return None
 
-        # Get schedule index for different loads and create ZoneLoad arguments
-        # Verify if Equipment in zone
-
-        # create database connection with sqlite3
-        with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-            sql_query = "select ifnull(ZoneIndex, null) from Zones where ZoneName=?"
-            t = (zone.Name.upper(),)
-            c = conn.cursor()
-            c.execute(sql_query, t)
-            (zone_index,) = c.fetchone()
-
-            sql_query = "select t.* from NominalElectricEquipment t where ZoneIndex=?"
-            nominal_elec = pd.read_sql(sql_query, conn, params=(zone_index,))
-
-            sql_query = "select t.* from NominalGasEquipment t where ZoneIndex=?"
-            nominal_gas = pd.read_sql(sql_query, conn, params=(zone_index,))
-
-            def get_schedule(series):
-                """Compute the schedule with quantity for nominal equipment series."""
-                sched = series["ScheduleIndex"]
-                sql_query = "select t.ScheduleName, t.ScheduleType as M from Schedules t where ScheduleIndex=?"
-                sched_name, sched_type = c.execute(sql_query, (int(sched),)).fetchone()
-                level_ = float(series["DesignLevel"])
-                if level_ > 0:
-                    return UmiSchedule.from_epbunch(
-                        zone_ep.theidf.schedules_dict[sched_name.upper()],
-                        quantity=level_,
-                    )
+        # Nominal loads and their schedule names of all zones, read once per sql file.
+        loads = nominal_loads(zone_ep.theidf.sql_file)
 
+        def get_schedules(table, quantity_column, positive_only=True):
+            """Compute the schedules with quantity of the zone's nominal load rows."""
+            nominal = loads[table].get(zone.Name.upper())
+            if nominal is None:
+                return []
             schedules = []
-            if not nominal_elec.empty:
-                # compute schedules series
-                elec_scds = nominal_elec.apply(get_schedule, axis=1).to_list()
-                elec_scds = list(filter(None, elec_scds))
-                schedules.extend(elec_scds)
-
-            if not nominal_gas.empty:
-                # compute schedules series
-                gas_scds = nominal_gas.apply(get_schedule, axis=1).to_list()
-                gas_scds = list(filter(None, gas_scds))
-                schedules.extend(gas_scds)
-
-            if schedules:
-                EquipmentAvailabilitySchedule = reduce(
-                    UmiSchedule.combine,
-                    schedules,
-                    quantity=True,
-                )
-                EquipmentPowerDensity = EquipmentAvailabilitySchedule.quantity / zone.area
-            else:
-                EquipmentAvailabilitySchedule = None
-                EquipmentPowerDensity = np.nan
-
-            # Verifies if Lights in zone
-            sql_query = "select t.* from NominalLighting t where ZoneIndex=?"
-            nominal_lighting = pd.read_sql(sql_query, conn, params=(zone_index,))
-
-            lighting_schedules = []
-            if not nominal_lighting.empty:
-                # compute schedules series
-                light_scds = nominal_lighting.apply(get_schedule, axis=1)
-                lighting_schedules.extend(light_scds)
-
-            if lighting_schedules:
-                LightsAvailabilitySchedule = reduce(
-                    UmiSchedule.combine,
-                    lighting_schedules,
-                    quantity=True,
-                )
-                LightingPowerDensity = LightsAvailabilitySchedule.quantity / zone.area
-            else:
-                LightsAvailabilitySchedule = None
-                LightingPowerDensity = np.nan
-
-            # Verifies if People in zone
-
-            def get_schedule(series):
-                """Compute schedule with quantity for nominal equipment series."""
-                sched = series["NumberOfPeopleScheduleIndex"]
-                sql_query = "select t.ScheduleName, t.ScheduleType as M from Schedules t where ScheduleIndex=?"
-                sched_name, sched_type = c.execute(sql_query, (int(sched),)).fetchone()
-                return UmiSchedule.from_epbunch(
-                    zone_ep.theidf.schedules_dict[sched_name.upper()],
-                    quantity=series["NumberOfPeople"],
-                )
-
-            sql_query = "select t.* from NominalPeople t where ZoneIndex=?"
-            nominal_people = pd.read_sql(sql_query, conn, params=(zone_index,))
-
-            occupancy_schedules = []
-            if not nominal_people.empty:
-                # compute schedules series
-                occ_scds = nominal_people.apply(get_schedule, axis=1)
-                occupancy_schedules.extend(occ_scds)
+            for sched_name, quantity in zip(nominal["ScheduleName"], nominal[quantity_column]):
+                quantity = float(quantity)
+                if quantity > 0 or not positive_only:
+                    schedules.append(
+                        UmiSchedule.from_epbunch(
+                            zone_ep.theidf.schedules_dict[sched_name.upper()],
+                            quantity=quantity,
+                        )
+                    )
+            return schedules
 
-            if occupancy_schedules:
-                OccupancySchedule = reduce(
-                    UmiSchedule.combine,
-                    occupancy_schedules,
-                    quantity=lambda x: sum(obj.quantity for obj in x),
-                )
-                PeopleDensity = OccupancySchedule.quantity / zone.area
-            else:
-                OccupancySchedule = None
-                PeopleDensity = np.nan
+        # Verify if Equipment in zone
+        schedules = get_schedules("NominalElectricEquipment", "DesignLevel") + get_schedules(
+            "NominalGasEquipment", "DesignLevel"
+        )
+        if schedules:
+            EquipmentAvailabilitySchedule = reduce(
+                UmiSchedule.combine,
+                schedules,
+                quantity=True,
+            )
+            EquipmentPowerDensity = EquipmentAvailabilitySchedule.quantity / zone.area
+        else:
+            EquipmentAvailabilitySchedule = None
+            EquipmentPowerDensity = np.nan
+
+        # Verifies if Lights in zone
+        lighting_schedules = get_schedules("NominalLighting", "DesignLevel")
+        if lighting_schedules:
+            LightsAvailabilitySchedule = reduce(
+                UmiSchedule.combine,
+                lighting_schedules,
+                quantity=True,
+            )
+            LightingPowerDensity = LightsAvailabilitySchedule.quantity / zone.area
+        else:
+            LightsAvailabilitySchedule = None
+            LightingPowerDensity = np.nan
+
+        # Verifies if People in zone
+        occupancy_schedules = get_schedules("NominalPeople", "NumberOfPeople", positive_only=False)
+        if occupancy_schedules:
+            OccupancySchedule = reduce(
+                UmiSchedule.combine,
+                occupancy_schedules,
+                quantity=lambda x: sum(obj.quantity for obj in x),
+            )
+            PeopleDensity = OccupancySchedule.quantity / zone.area
+        else:
+            OccupancySchedule = None
+            PeopleDensity = np.nan
 
         name = zone.Name + "_ZoneLoad"
         z_load = cls(
@@ -566,6 +520,64 @@ class ZoneLoad(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None):
+        """Combine many ZoneLoad objects together. Returns a new object.
+
+        Args:
+            objects (list of ZoneLoad): The ZoneLoad objects to combine.
+            weights (list-like, optional): A multiplier for each object (e.g. the
+                zone multiplier). The `settings.zone_weight` of each object is
+                multiplied by it to weight the averages. If None, 1 is used.
+
+        Returns:
+            (ZoneLoad): the combined ZoneLoad object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        first = objects[0]
+        if all(obj == first for obj in objects[1:]):
+            return first
+
+        zone_weight = settings.zone_weight
+        zone_weights = weights * [getattr(obj, str(zone_weight)) for obj in objects]
+        areas = weights * [obj.area for obj in objects]
+        log(f'using zone {zone_weight} as weighting factor in "{cls.__name__}" combine_many.')
+
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+        new_attr = {
+            "DimmingType": max(obj.DimmingType for obj in objects),
+            "EquipmentAvailabilitySchedule": UmiSchedule.combine_many(
+                [obj.EquipmentAvailabilitySchedule for obj in objects],
+                weights=areas,
+                quantity=True,
+            ),
+            "EquipmentPowerDensity": cls.float_mean_many(objects, "EquipmentPowerDensity", zone_weights),
+            "IlluminanceTarget": cls.float_mean_many(objects, "IlluminanceTarget", zone_weights),
+            "LightingPowerDensity": cls.float_mean_many(objects, "LightingPowerDensity", zone_weights),
+            "LightsAvailabilitySchedule": UmiSchedule.combine_many(
+                [obj.LightsAvailabilitySchedule for obj in objects],
+                weights=areas,
+                quantity=True,
+            ),
+            "OccupancySchedule": UmiSchedule.combine_many(
+                [obj.OccupancySchedule for obj in objects],
+                weights=areas,
+                quantity=True,
+            ),
+            "IsEquipmentOn": any(obj.IsEquipmentOn for obj in objects),
+            "IsLightingOn": any(obj.IsLightingOn for obj in objects),
+            "IsPeopleOn": any(obj.IsPeopleOn for obj in objects),
+            "PeopleDensity": cls.float_mean_many(objects, "PeopleDensity", zone_weights),
+        }
+
+        new_obj = cls(**meta, **new_attr, allow_duplicates=first.allow_duplicates)
+        new_obj.area = float(areas.sum())
+        new_obj.volume = float(np.dot(weights, [obj.volume for obj in objects]))
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def validate(self):
         """Validate object and fill in missing values."""
         if self.DimmingType is None:
@@ -195,6 +195,72 @@ class UmiSchedule(Schedule, UmiBase):
         new_obj.weights = sum(weights)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None, quantity=None):
+        """Combine many UmiSchedule objects together in a single weighted average.
+
+        Values of all the schedules are stacked in one array and averaged at once,
+        which avoids the intermediate objects created by a pairwise reduction.
+
+        Args:
+            objects (list of UmiSchedule): The schedules to combine. None items are
+                ignored.
+            weights (list-like, optional): One weight per schedule. If None, each
+                schedule has a weight of 1.
+            quantity (bool or list-like, optional): If True, the weight of each
+                schedule is multiplied by its quantity. If a list-like is passed,
+                the weights are multiplied by those values instead.
+
+        Returns:
+            (UmiSchedule): the combined UmiSchedule object.
+        """
+        objects = list(objects)
+        if quantity is not None and not isinstance(quantity, bool):
+            weights = np.ones(len(objects)) if weights is None else np.asarray(weights, dtype=float)
+            weights = weights * np.asarray(quantity, dtype=float)
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+
+        values = np.stack([obj.all_values for obj in objects])
+        # Schedules that are only zeros should not affect the others.
+        non_zero = values.any(axis=1)
+        if non_zero.any() and not non_zero.all():
+            objects = [obj for obj, keep in zip(objects, non_zero) if keep]
+            values, weights = values[non_zero], weights[non_zero]
+        if len(objects) == 1:
+            return objects[0]
+
+        quantities = np.array([np.nan if obj.quantity is None else obj.quantity for obj in objects], dtype=float)
+        first = objects[0]
+        if all(obj == first for obj in objects[1:]):
+            if np.isnan(quantities).all():
+                return first
+            new_obj = first.duplicate()
+            new_obj.quantity = np.nansum(quantities)
+            return new_obj
+
+        if quantity is True:
+            weights = weights * np.nan_to_num(quantities, nan=1)
+        if not weights.any():
+            weights = np.ones_like(weights)
+        new_values = np.average(values, axis=0, weights=weights)
+
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+        # Overriding meta Name
+        hasher = hashlib.md5()
+        hasher.update(new_values)
+        meta["Name"] = f"Combined_UmiSchedule_{hasher.hexdigest()}"
+        new_obj = UmiSchedule.from_values(
+            Values=new_values,
+            Type="Fraction",
+            quantity=np.nansum(np.where(quantities == 0, np.nan, quantities)),
+            **meta,
+        )
+        new_obj.predecessors.update(predecessors)
+        new_obj.weights = weights.sum()
+        return new_obj
+
     def develop(self):
         """Develop the UmiSchedule into a Year-Week-Day schedule structure."""
         year, weeks, days = self.to_year_week_day()
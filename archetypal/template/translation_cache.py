@@ -0,0 +1,86 @@
+"""archetypal translation cache.
+
+Reuse the template components translated from the EnergyPlus objects of an IDF
+model while a template is being extracted from it. Each thread has its own
+caches: components are mutable, so they are never shared between threads.
+"""
+
+import contextlib
+import threading
+from weakref import WeakKeyDictionary
+
+_LOCAL = threading.local()
+
+
+def _caches():
+    """Return the translation caches of the calling thread, keyed by IDF model."""
+    try:
+        return _LOCAL.caches
+    except AttributeError:
+        _LOCAL.caches = WeakKeyDictionary()
+        return _LOCAL.caches
+
+
+@contextlib.contextmanager
+def translation_cache(idf):
+    """Reuse the components translated from `idf` inside the `with` block.
+
+    While the block is active, :func:`translate` returns the component already
+    built for an EpBunch of `idf` with the same key and field values instead of
+    translating it again. The cache is dropped when the block exits, so that
+    changes made to the model afterwards are always picked up. Nested blocks for
+    the same model share the outer cache. The cache only applies to the thread
+    that opened the block.
+
+    Examples:
+        >>> from archetypal import IDF
+        >>> from archetypal.template import BuildingTemplate
+        >>> idf = IDF("myidf.idf")
+        >>> with translation_cache(idf):
+        >>>     bt = BuildingTemplate.from_idf(idf)
+
+    Args:
+        idf (IDF): The IDF model.
+    """
+    caches = _caches()
+    if idf in caches:
+        yield caches[idf]
+        return
+    caches[idf] = cache = {}
+    try:
+        yield cache
+    finally:
+        caches.pop(idf, None)
+
+
+def translate(epbunch, factory, **kwargs):
+    """Translate an EpBunch into a template component, reusing cached results.
+
+    The result is keyed by the factory, the object key, its field values (which
+    include the name and, for constructions, the material layer names) and the
+    keyword arguments. Outside a :func:`translation_cache` block of the calling
+    thread, this simply calls `factory`.
+
+    Args:
+        epbunch (EpBunch): The EnergyPlus object to translate.
+        factory (callable): The constructor called as `factory(epbunch, **kwargs)`,
+            e.g. :meth:`OpaqueConstruction.from_epbunch`.
+        **kwargs: Keywords passed to `factory`. Must be hashable.
+
+    Returns:
+        UmiBase: The translated component.
+    """
+    cache = _caches().get(epbunch.theidf)
+    if cache is None:
+        return factory(epbunch, **kwargs)
+    key = (
+        factory,
+        epbunch.key.upper(),
+        tuple(epbunch.fieldvalues),
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        return cache[key]
+    except KeyError:
+        cache[key] = component = factory(epbunch, **kwargs)
+        return component
@@ -8,7 +8,7 @@ from typing import ClassVar
 import numpy as np
 from validator_collection import validators
 
-from archetypal.utils import lcm
+from archetypal.utils import lcm, reduce
 
 
 def _resolve_combined_names(predecessors):
@@ -215,6 +215,67 @@ class UmiBase:
     def combine(self, other, allow_duplicates=False):
         pass
 
+    @classmethod
+    def combine_many(cls, objects, weights=None, **kwargs):
+        """Combine a sequence of objects into a single new object.
+
+        The base implementation falls back on a pairwise reduction with
+        :meth:`combine`. Subclasses that carry schedules or extensive quantities
+        override it to compute each attribute as one weighted average over all the
+        objects, creating a single combined object per component.
+
+        Args:
+            objects (list of UmiBase): The objects to combine. None items are
+                ignored.
+            weights (list-like, optional): One weight per object. Classes that
+                carry an area or a volume multiply it by these weights, so that zone
+                multipliers can be passed directly. If None, each object has a
+                weight of 1.
+            **kwargs: keywords passed to :meth:`combine`.
+
+        Returns:
+            (UmiBase): the combined object or None if there is nothing to combine.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        return reduce(cls.combine, objects, **kwargs)
+
+    @classmethod
+    def _combinable(cls, objects, weights=None):
+        """Drop empty objects from objects and return the rest with their weights.
+
+        Args:
+            objects (list of UmiBase): The objects to combine.
+            weights (list-like, optional): One weight per object. If None, each
+                object has a weight of 1.
+
+        Returns:
+            (list, np.ndarray): The objects to combine and their weights.
+        """
+        objects = list(objects)
+        weights = np.ones(len(objects)) if weights is None else np.asarray(weights, dtype=float)
+        if len(weights) != len(objects):
+            raise ValueError(f"Expected {len(objects)} weights, got {len(weights)}.")
+        keep = [i for i, obj in enumerate(objects) if obj]
+        for i in keep:
+            if not isinstance(objects[i], cls):
+                msg = f"Cannot combine {cls.__name__} with {objects[i].__class__.__name__}"
+                raise NotImplementedError(msg)
+        return [objects[i] for i in keep], weights[keep]
+
+    def _get_predecessors_meta_many(self, objects):
+        """Get the meta attributes and the union of predecessors of objects.
+
+        Args:
+            objects (list of UmiBase): The objects being combined.
+
+        Returns:
+            (dict, MetaData): The meta attributes and the predecessors.
+        """
+        predecessors = MetaData()
+        for obj in objects:
+            predecessors.update(obj.predecessors)
+        return self.combine_meta(predecessors), predecessors
+
     def rename(self, name):
         """renames self as well as the cached object
 
@@ -300,6 +361,44 @@ class UmiBase:
             other_attr_ = np.tile(other_attr_, int(l_ / len(other_attr_)))
             return np.average([self_attr_, other_attr_], weights=weights, axis=0)
 
+    @staticmethod
+    def float_mean_many(objects, attr, weights=None):
+        """Calculates the weighted average attribute value of many objects.
+
+        None and NaN values are ignored. Lists are tiled to their least common
+        length before averaging.
+
+        Args:
+            objects (list of UmiBase): The objects to calculate the average value of.
+            attr (str): The attribute of the UmiBase objects.
+            weights (iterable, optional): Weights of each object. If None or all
+                zeros, equal weights are used.
+        """
+        if weights is None:
+            weights = np.ones(len(objects))
+        values, weights_ = [], []
+        for obj, weight in zip(objects, weights):
+            value = getattr(obj, attr)
+            if value is None:
+                continue
+            if not isinstance(value, (list, np.ndarray)) and math.isnan(value):
+                continue
+            values.append(value)
+            weights_.append(weight)
+        if not values:
+            # All None or NaN. Return NaN if any value was NaN.
+            return next((getattr(obj, attr) for obj in objects if getattr(obj, attr) is not None), None)
+        weights_ = np.asarray(weights_, dtype=float)
+        if not weights_.any():
+            weights_ = np.ones_like(weights_)
+
+        if any(isinstance(value, (list, np.ndarray)) for value in values):
+            arrays = [np.atleast_1d(np.asarray(value, dtype=float)) for value in values]
+            length = math.lcm(*(len(array) for array in arrays))
+            stacked = np.stack([np.tile(array, length // len(array)) for array in arrays])
+            return np.average(stacked, weights=weights_, axis=0)
+        return float(np.average(values, weights=weights_))
+
     def _str_mean(self, other, attr, append=False):
         """Returns the combined string attributes
 
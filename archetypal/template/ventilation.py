@@ -637,6 +637,67 @@ class VentilationSetting(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None, **kwargs):
+        """Combine many VentilationSetting objects together.
+
+        Args:
+            objects (list of VentilationSetting): The objects to combine.
+            weights (list-like, optional): A multiplier for each object (e.g. the
+                zone multiplier). The area and volume of each object are multiplied
+                by it to weight the averages. If None, 1 is used.
+            kwargs: keywords passed to constructor.
+
+        Returns:
+            (VentilationSetting): the combined VentilationSetting object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        areas = weights * [obj.area for obj in objects]
+        volumes = weights * [obj.volume for obj in objects]
+        area = 1 if all(obj.area == 1 for obj in objects) else float(areas.sum())
+        volume = 1 if all(obj.volume == 1 for obj in objects) else float(volumes.sum())
+
+        first = objects[0]
+        if len(objects) == 1 or all(obj == first for obj in objects[1:]):
+            new_obj = first.duplicate()
+            new_obj.area = area
+            new_obj.volume = volume
+            return new_obj
+
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+
+        # create a new object with the combined attributes
+        new_obj = cls(
+            NatVentSchedule=UmiSchedule.combine_many([obj.NatVentSchedule for obj in objects], areas),
+            ScheduledVentilationSchedule=UmiSchedule.combine_many(
+                [obj.ScheduledVentilationSchedule for obj in objects],
+                weights=volumes,
+                quantity=True,
+            ),
+            Afn=any(obj.Afn for obj in objects),
+            Infiltration=cls.float_mean_many(objects, "Infiltration", areas),
+            IsBuoyancyOn=any(obj.IsBuoyancyOn for obj in objects),
+            IsInfiltrationOn=any(obj.IsInfiltrationOn for obj in objects),
+            IsNatVentOn=any(obj.IsNatVentOn for obj in objects),
+            IsScheduledVentilationOn=any(obj.IsScheduledVentilationOn for obj in objects),
+            IsWindOn=any(obj.IsWindOn for obj in objects),
+            NatVentMaxOutdoorAirTemp=cls.float_mean_many(objects, "NatVentMaxOutdoorAirTemp", areas),
+            NatVentMaxRelHumidity=cls.float_mean_many(objects, "NatVentMaxRelHumidity", areas),
+            NatVentMinOutdoorAirTemp=cls.float_mean_many(objects, "NatVentMinOutdoorAirTemp", areas),
+            NatVentZoneTempSetpoint=cls.float_mean_many(objects, "NatVentZoneTempSetpoint", areas),
+            ScheduledVentilationAch=cls.float_mean_many(objects, "ScheduledVentilationAch", volumes),
+            ScheduledVentilationSetpoint=cls.float_mean_many(objects, "ScheduledVentilationSetpoint", areas),
+            area=area,
+            volume=volume,
+            **meta,
+            **kwargs,
+            allow_duplicates=first.allow_duplicates,
+        )
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def validate(self):
         """Validate object and fill in missing values."""
         if self.NatVentSchedule is None:
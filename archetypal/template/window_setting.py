@@ -14,6 +14,7 @@ from archetypal.template.constructions.window_construction import (
     WindowType,
 )
 from archetypal.template.schedule import UmiSchedule
+from archetypal.template.translation_cache import translate
 from archetypal.template.umi_base import UmiBase
 from archetypal.utils import log, timeit
 
@@ -477,11 +478,11 @@ class WindowSetting(UmiBase):
             construction = surface.get_referenced_object("Construction_Name")
             if construction is None:
                 construction = surface.theidf.getobject("CONSTRUCTION", surface.Construction_Name)
-            construction = WindowConstruction.from_epbunch(construction)
+            construction = translate(construction, WindowConstruction.from_epbunch)
             shading_control = surface.get_referenced_object("Shading_Control_Name")
         elif surface.key.upper() == "WINDOW":
             construction = surface.get_referenced_object("Construction_Name")
-            construction = WindowConstruction.from_epbunch(construction)
+            construction = translate(construction, WindowConstruction.from_epbunch)
             shading_control = next(
                 iter(
                     surface.getreferingobjs(
@@ -701,6 +702,55 @@ class WindowSetting(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None):
+        """Combine many WindowSetting objects together. Return a new object.
+
+        Args:
+            objects (list of WindowSetting): The objects to combine.
+            weights (list-like, optional): One weight per object. If None, equal
+                weights are used.
+
+        Returns:
+            WindowSetting: A new combined object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        first = objects[0]
+        if all(obj == first for obj in objects[1:]):
+            return first
+
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+        new_attr = {
+            "Construction": WindowConstruction.combine_many([obj.Construction for obj in objects], weights),
+            "AfnWindowAvailability": UmiSchedule.combine_many([obj.AfnWindowAvailability for obj in objects], weights),
+            "IsShadingSystemOn": any(obj.IsShadingSystemOn for obj in objects),
+            "IsVirtualPartition": any(obj.IsVirtualPartition for obj in objects),
+            "IsZoneMixingOn": any(obj.IsZoneMixingOn for obj in objects),
+            "ShadingSystemType": max(obj.ShadingSystemType for obj in objects),
+            "ZoneMixingAvailabilitySchedule": UmiSchedule.combine_many(
+                [obj.ZoneMixingAvailabilitySchedule for obj in objects], weights
+            ),
+            "ShadingSystemAvailabilitySchedule": UmiSchedule.combine_many(
+                [obj.ShadingSystemAvailabilitySchedule for obj in objects], weights
+            ),
+            "Type": max(obj.Type for obj in objects),
+        }
+        for attr in (
+            "AfnDischargeC",
+            "AfnTempSetpoint",
+            "OperableArea",
+            "ShadingSystemSetpoint",
+            "ShadingSystemTransmittance",
+            "ZoneMixingDeltaTemperature",
+            "ZoneMixingFlowRate",
+        ):
+            new_attr[attr] = cls.float_mean_many(objects, attr, weights)
+        new_obj = cls(**meta, **new_attr)
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def to_dict(self):
         """Return WindowSetting dictionary representation."""
         self.validate()  # Validate object before trying to get json format
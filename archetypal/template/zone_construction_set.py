@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, ClassVar
 from validator_collection import validators
 
 from archetypal.template.constructions.opaque_construction import OpaqueConstruction
+from archetypal.template.translation_cache import translate
 from archetypal.template.umi_base import UmiBase
 from archetypal.utils import log, reduce, timeit
 
@@ -241,39 +242,37 @@ class ZoneConstructionSet(UmiBase):
             zone (ZoneDefinition): The zone object.
         """
         name = zone.Name + "_ZoneConstructionSet"
-        # dispatch surfaces
-        facade, ground, partition, roof, slab = [], [], [], [], []
+        # dispatch surfaces. The dispatched constructions are shared by all the
+        # surfaces using them, so the area of each construction is summed here.
+        facade, ground, partition, roof, slab = {}, {}, {}, {}, {}
         zonesurfaces = zone.zone_surfaces
         for surf in zonesurfaces:
             disp_surf = SurfaceDispatcher(surf, zone).resolved_surface
             if disp_surf:
                 if disp_surf.Category == "Facade":
-                    if zone.is_part_of_conditioned_floor_area:
-                        facade.append(disp_surf)
+                    if not zone.is_part_of_conditioned_floor_area:
+                        continue
+                    constructions = facade
                 elif disp_surf.Category == "Ground":
-                    ground.append(disp_surf)
+                    constructions = ground
                 elif disp_surf.Category == "Partition":
-                    partition.append(disp_surf)
+                    constructions = partition
                 elif disp_surf.Category == "Roof":
-                    roof.append(disp_surf)
+                    constructions = roof
                 elif disp_surf.Category == "Slab":
-                    slab.append(disp_surf)
+                    constructions = slab
                 else:
                     msg = f'Surface Type "{disp_surf.Surface_Type}" is not known, this method is not' " implemented"
                     raise NotImplementedError(msg)
+                _, area = constructions.get(id(disp_surf), (disp_surf, 0))
+                constructions[id(disp_surf)] = (disp_surf, area + surf.area)
 
-        # Returning a set() for each groups of Constructions.
-
-        facades = set(facade)
-        facade = reduce(OpaqueConstruction.combine, facades) if facades else None
-        grounds = set(ground)
-        ground = reduce(OpaqueConstruction.combine, grounds) if grounds else None
-        partitions = set(partition)
-        partition = reduce(OpaqueConstruction.combine, partitions) if partitions else None
-        roofs = set(roof)
-        roof = reduce(OpaqueConstruction.combine, roofs) if roofs else None
-        slabs = set(slab)
-        slab = reduce(OpaqueConstruction.combine, slabs) if slabs else None
+        # Combining each group of Constructions, weighted by their area.
+        facade = _combine_by_area(facade.values())
+        ground = _combine_by_area(ground.values())
+        partition = _combine_by_area(partition.values())
+        roof = _combine_by_area(roof.values())
+        slab = _combine_by_area(slab.values())
 
         z_set = cls(
             Facade=facade,
@@ -397,6 +396,57 @@ class ZoneConstructionSet(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    def combine_many(cls, objects, weights=None, **kwargs):
+        """Combine many ZoneConstructionSet objects together.
+
+        Args:
+            objects (list of ZoneConstructionSet): The objects to combine.
+            weights (list-like, optional): A multiplier for each object (e.g. the
+                zone multiplier) applied to its area and volume. If None, 1 is used.
+            kwargs: keywords passed to constructor.
+
+        Returns:
+            (ZoneConstructionSet): the combined ZoneConstructionSet object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        areas = weights * [obj.area for obj in objects]
+        volumes = weights * [obj.volume for obj in objects]
+        area = 1 if all(obj.area == 1 for obj in objects) else float(areas.sum())
+        volume = 1 if all(obj.volume == 1 for obj in objects) else float(volumes.sum())
+
+        first = objects[0]
+        if len(objects) == 1 or all(obj == first for obj in objects[1:]):
+            new_obj = first.duplicate()
+            new_obj.area = area
+            new_obj.volume = volume
+            return new_obj
+
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+
+        # create a new object with the combined attributes
+        new_obj = cls(
+            Slab=OpaqueConstruction.combine_many([obj.Slab for obj in objects], areas),
+            IsSlabAdiabatic=any(obj.IsSlabAdiabatic for obj in objects),
+            Roof=OpaqueConstruction.combine_many([obj.Roof for obj in objects], areas),
+            IsRoofAdiabatic=any(obj.IsRoofAdiabatic for obj in objects),
+            Partition=OpaqueConstruction.combine_many([obj.Partition for obj in objects], areas),
+            IsPartitionAdiabatic=any(obj.IsPartitionAdiabatic for obj in objects),
+            Ground=OpaqueConstruction.combine_many([obj.Ground for obj in objects], areas),
+            IsGroundAdiabatic=any(obj.IsGroundAdiabatic for obj in objects),
+            Facade=OpaqueConstruction.combine_many([obj.Facade for obj in objects], areas),
+            IsFacadeAdiabatic=any(obj.IsFacadeAdiabatic for obj in objects),
+            area=area,
+            volume=volume,
+            **meta,
+            **kwargs,
+            allow_duplicates=first.allow_duplicates,
+        )
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def to_dict(self):
         """Return ZoneConstructionSet dictionary representation."""
         self.validate()
@@ -521,6 +571,25 @@ class ZoneConstructionSet(UmiBase):
         return self.Facade, self.Ground, self.Partition, self.Roof, self.Slab
 
 
+def _combine_by_area(constructions):
+    """Combine the constructions of a group of surfaces.
+
+    Args:
+        constructions (iterable of tuple): The (OpaqueConstruction, area) pairs,
+            one per distinct construction.
+
+    Returns:
+        OpaqueConstruction: The combined construction, or None if there is none.
+    """
+    combined = []
+    for oc, area in constructions:
+        # a copy holds the area: the construction itself is in the translation cache.
+        oc = oc.__class__(**oc.mapping(validate=False))
+        oc.area = area
+        combined.append(oc)
+    return reduce(OpaqueConstruction.combine, combined) if combined else None
+
+
 class SurfaceDispatcher:
     """Surface dispatcher class."""
 
@@ -578,9 +647,11 @@ class SurfaceDispatcher:
             lg.DEBUG,
             name=surf.theidf.name,
         )
-        oc = OpaqueConstruction.from_epbunch(surf.theidf.getobject("Construction".upper(), surf.Construction_Name))
-        oc.area = surf.area
-        oc.Category = "Facade"
+        oc = translate(
+            surf.theidf.getobject("Construction".upper(), surf.Construction_Name),
+            OpaqueConstruction.from_epbunch,
+            Category="Facade",
+        )
         return oc
 
     @staticmethod
@@ -590,18 +661,18 @@ class SurfaceDispatcher:
             lg.DEBUG,
             name=surf.theidf.name,
         )
-        oc = OpaqueConstruction.from_epbunch(surf.get_referenced_object("Construction_Name"))
-        oc.area = surf.area
-        oc.Category = "Ground"
+        oc = translate(
+            surf.get_referenced_object("Construction_Name"),
+            OpaqueConstruction.from_epbunch,
+            Category="Ground",
+        )
         return oc
 
     @staticmethod
     def _do_partition(surf):
         the_construction = surf.theidf.getobject("Construction".upper(), surf.Construction_Name)
         if the_construction:
-            oc = OpaqueConstruction.from_epbunch(the_construction)
-            oc.area = surf.area
-            oc.Category = "Partition"
+            oc = translate(the_construction, OpaqueConstruction.from_epbunch, Category="Partition")
             log(
                 f'surface "{surf.Name}" assigned as a Partition',
                 lg.DEBUG,
@@ -621,9 +692,11 @@ class SurfaceDispatcher:
             lg.DEBUG,
             name=surf.theidf.name,
         )
-        oc = OpaqueConstruction.from_epbunch(surf.theidf.getobject("Construction".upper(), surf.Construction_Name))
-        oc.area = surf.area
-        oc.Category = "Roof"
+        oc = translate(
+            surf.theidf.getobject("Construction".upper(), surf.Construction_Name),
+            OpaqueConstruction.from_epbunch,
+            Category="Roof",
+        )
         return oc
 
     @staticmethod
@@ -633,9 +706,11 @@ class SurfaceDispatcher:
             lg.DEBUG,
             name=surf.theidf.name,
         )
-        oc = OpaqueConstruction.from_epbunch(surf.theidf.getobject("Construction".upper(), surf.Construction_Name))
-        oc.area = surf.area
-        oc.Category = "Slab"
+        oc = translate(
+            surf.theidf.getobject("Construction".upper(), surf.Construction_Name),
+            OpaqueConstruction.from_epbunch,
+            Category="Slab",
+        )
         return oc
 
     @staticmethod
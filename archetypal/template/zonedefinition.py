@@ -1,14 +1,15 @@
 """archetypal ZoneDefinition module."""
 
 import collections
-import sqlite3
 import time
 from typing import ClassVar
 
+import numpy as np
 from eppy.bunch_subclass import BadEPFieldError
 from sigfig import round
 from validator_collection import validators
 
+from archetypal.idfclass.sql import zone_summary
 from archetypal.template.conditioning import ZoneConditioning
 from archetypal.template.constructions.internal_mass import InternalMass
 from archetypal.template.constructions.opaque_construction import OpaqueConstruction
@@ -18,6 +19,7 @@ from archetypal.template.umi_base import UmiBase
 from archetypal.template.ventilation import VentilationSetting
 from archetypal.template.window_setting import WindowSetting
 from archetypal.template.zone_construction_set import ZoneConstructionSet
+from archetypal.tracing import traced
 from archetypal.utils import log, settings
 
 
@@ -430,6 +432,7 @@ class ZoneDefinition(UmiBase):
         )
 
     @classmethod
+    @traced
     def from_epbunch(cls, ep_bunch, construct_parents=True, **kwargs):
         """Create a Zone object from an eppy 'ZONE' epbunch.
 
@@ -442,74 +445,6 @@ class ZoneDefinition(UmiBase):
         start_time = time.time()
         log(f'Constructing :class:`Zone` for zone "{ep_bunch.Name}"')
 
-        def calc_zone_area(zone_ep):
-            """Get zone area from simulation sql file."""
-            with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-                sql_query = """
-                    SELECT t.Value
-                    FROM TabularDataWithStrings t
-                    WHERE TableName='Zone Summary' and ColumnName='Area' and RowName=?
-                """
-                (res,) = conn.execute(sql_query, (zone_ep.Name.upper(),)).fetchone()
-            return float(res)
-
-        def calc_zone_volume(zone_ep):
-            """Get zone volume from simulation sql file."""
-            with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-                sql_query = (
-                    "SELECT CAST(t.Value AS float) FROM TabularDataWithStrings t "
-                    "WHERE TableName='Zone Summary' and ColumnName='Volume' and "
-                    "RowName=?"
-                )
-                (res,) = conn.execute(sql_query, (zone_ep.Name.upper(),)).fetchone()
-            return float(res)
-
-        def calc_zone_occupants(zone_ep):
-            """Get zone occupants from simulation sql file."""
-            with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-                sql_query = (
-                    "SELECT CAST(t.Value AS float) FROM TabularDataWithStrings t "
-                    "WHERE TableName='Average Outdoor Air During Occupied Hours' and ColumnName='Nominal Number of Occupants' and RowName=?"
-                )
-
-                fetchone = conn.execute(sql_query, (zone_ep.Name.upper(),)).fetchone()
-                (res,) = fetchone or (0,)
-            return res
-
-        def calc_is_part_of_conditioned_floor_area(zone_ep):
-            """Return True if zone is part of the conditioned floor area."""
-            with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-                sql_query = (
-                    "SELECT t.Value FROM TabularDataWithStrings t WHERE "
-                    "TableName='Zone Summary' and ColumnName='Conditioned (Y/N)' "
-                    "and RowName=?"
-                    ""
-                )
-                res = conn.execute(sql_query, (zone_ep.Name.upper(),)).fetchone()
-            return "Yes" in res
-
-        def calc_is_part_of_total_floor_area(zone_ep):
-            """Return True if zone is part of the total floor area."""
-            with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-                sql_query = (
-                    "SELECT t.Value FROM TabularDataWithStrings t WHERE "
-                    "TableName='Zone Summary' and ColumnName='Part of "
-                    "Total Floor Area (Y/N)' and RowName=?"
-                )
-                res = conn.execute(sql_query, (zone_ep.Name.upper(),)).fetchone()
-            return "Yes" in res
-
-        def calc_multiplier(zone_ep):
-            """Get the zone multiplier from simulation sql."""
-            with sqlite3.connect(zone_ep.theidf.sql_file) as conn:
-                sql_query = (
-                    "SELECT t.Value FROM TabularDataWithStrings t WHERE "
-                    "TableName='Zone Summary' and "
-                    "ColumnName='Multipliers' and RowName=?"
-                )
-                (res,) = conn.execute(sql_query, (zone_ep.Name.upper(),)).fetchone()
-            return int(float(res))
-
         def is_core(zone_ep):
             # if all surfaces don't have boundary condition == "Outdoors"
             iscore = True
@@ -526,15 +461,17 @@ class ZoneDefinition(UmiBase):
             return iscore
 
         name = ep_bunch.Name
+        # geometry and nominal attributes of all zones, read once per sql file.
+        summary = zone_summary(ep_bunch.theidf.sql_file).loc[name.upper()]
         zone = cls(
             Name=name,
             Category=ep_bunch.theidf.name,
-            area=calc_zone_area(ep_bunch),
-            volume=calc_zone_volume(ep_bunch),
-            occupants=calc_zone_occupants(ep_bunch),
-            is_part_of_conditioned_floor_area=calc_is_part_of_conditioned_floor_area(ep_bunch),
-            is_part_of_total_floor_area=calc_is_part_of_total_floor_area(ep_bunch),
-            multiplier=calc_multiplier(ep_bunch),
+            area=float(summary["area"]),
+            volume=float(summary["volume"]),
+            occupants=float(summary["occupants"]),
+            is_part_of_conditioned_floor_area=bool(summary["is_part_of_conditioned_floor_area"]),
+            is_part_of_total_floor_area=bool(summary["is_part_of_total_floor_area"]),
+            multiplier=int(summary["multiplier"]),
             zone_surfaces=ep_bunch.zonesurfaces,
             is_core=is_core(ep_bunch),
             **kwargs,
@@ -632,6 +569,74 @@ class ZoneDefinition(UmiBase):
         new_obj.predecessors.update(self.predecessors + other.predecessors)
         return new_obj
 
+    @classmethod
+    @traced
+    def combine_many(cls, objects, weights=None):
+        """Combine many ZoneDefinition objects together.
+
+        Each component (loads, conditioning, ventilation, etc.) is combined in a
+        single weighted average over all the zones, which creates one new object
+        per component instead of one per pair of zones.
+
+        Args:
+            objects (list of ZoneDefinition): The zones to combine.
+            weights (list-like, optional): A multiplier for each zone, typically the
+                zone multiplier. The `settings.zone_weight` of each zone is
+                multiplied by it to weight the averages, and the area, volume and
+                occupants are summed accordingly. If None, 1 is used.
+
+        Returns:
+            (ZoneDefinition): the combined Zone object.
+        """
+        objects, weights = cls._combinable(objects, weights)
+        if not objects:
+            return None
+        areas = weights * [obj.area for obj in objects]
+        volumes = weights * [obj.volume for obj in objects]
+
+        first = objects[0]
+        if len(objects) == 1 or all(obj == first for obj in objects[1:]):
+            new_obj = first.duplicate()
+            new_obj.area = 1 if all(obj.area == 1 for obj in objects) else float(areas.sum())
+            new_obj.volume = 1 if all(obj.volume == 1 for obj in objects) else float(volumes.sum())
+            return new_obj
+
+        zone_weight = settings.zone_weight
+        zone_weights = weights * [getattr(obj, str(zone_weight)) for obj in objects]
+        log(f'using zone {zone_weight} as weighting factor in "{cls.__name__}" combine_many.')
+
+        meta, predecessors = first._get_predecessors_meta_many(objects)
+        new_attr = {
+            "Conditioning": ZoneConditioning.combine_many([obj.Conditioning for obj in objects], weights),
+            "Constructions": ZoneConstructionSet.combine_many([obj.Constructions for obj in objects], weights),
+            "Ventilation": VentilationSetting.combine_many([obj.Ventilation for obj in objects], weights),
+            "Windows": WindowSetting.combine_many([obj.Windows for obj in objects], zone_weights),
+            "DaylightMeshResolution": cls.float_mean_many(objects, "DaylightMeshResolution", zone_weights),
+            "DaylightWorkplaneHeight": cls.float_mean_many(objects, "DaylightWorkplaneHeight", zone_weights),
+            "DomesticHotWater": DomesticHotWaterSetting.combine_many(
+                [obj.DomesticHotWater for obj in objects], weights
+            ),
+            "InternalMassConstruction": OpaqueConstruction.combine_many(
+                [obj.InternalMassConstruction for obj in objects]
+            ),
+            "InternalMassExposedPerFloorArea": cls.float_mean_many(
+                objects, "InternalMassExposedPerFloorArea", zone_weights
+            ),
+            "Loads": ZoneLoad.combine_many([obj.Loads for obj in objects], weights),
+        }
+        new_obj = cls(**meta, **new_attr)
+
+        # transfer aggregated values [volume, area, occupants] to new combined zone
+        new_obj.volume = float(volumes.sum())
+        new_obj.area = float(areas.sum())
+        new_obj.occupants = float(np.dot(weights, [obj.occupants for obj in objects]))
+
+        if new_attr["Windows"]:  # Could be None
+            new_attr["Windows"].area = new_obj.area
+
+        new_obj.predecessors.update(predecessors)
+        return new_obj
+
     def validate(self):
         """Validate object and fill in missing values."""
         if self.InternalMassConstruction is None:
@@ -773,18 +778,20 @@ def resolve_obco(ep_bunch):
         return None, None
 
 
-def is_core(zone):
+def is_core(zone, surfaces=None):
     """Return true if zone is a core zone.
 
     Args:
         zone (eppy.bunch_subclass.EpBunch): The Zone object.
+        surfaces (list of EpBunch, optional): The surfaces of the zone, if already
+            known. Otherwise, they are searched in the whole model.
 
     Returns:
         (bool): Whether the zone is a core zone or not.
     """
     # if all surfaces don't have boundary condition == "Outdoors"
     iscore = True
-    for s in zone.zonesurfaces:
+    for s in zone.zonesurfaces if surfaces is None else surfaces:
         try:
             if (abs(int(s.tilt)) < 180) & (abs(int(s.tilt)) > 0):
                 obc = s.Outside_Boundary_Condition.lower()
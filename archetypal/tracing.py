@@ -0,0 +1,233 @@
+"""Lightweight tracing of the simulate→template pipeline.
+
+Stages of the pipeline (preprocessors, EnergyPlus, SQL reads, schedule parsing,
+zone extraction, combining and serialization) are wrapped in nested spans. Spans
+are only recorded inside a :func:`tracing` block; otherwise entering a span costs
+a single global lookup.
+
+Examples:
+    >>> from archetypal import IDF
+    >>> from archetypal.template import BuildingTemplate
+    >>> from archetypal.tracing import tracing
+    >>> with tracing("profile.json"):
+    >>>     idf = IDF("myidf.idf", epw="weather.epw").simulate()
+    >>>     bt = BuildingTemplate.from_idf(idf)
+
+The profile is written in the Chrome trace event format, which can be opened as
+a flame graph in https://ui.perfetto.dev, https://www.speedscope.app or
+chrome://tracing. :meth:`Tracer.to_folded` gives the folded stacks read by
+`flamegraph.pl`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+_TRACER = None
+
+
+class Span:
+    """A timed stage of the pipeline.
+
+    Args:
+        name (str): The name of the stage, e.g. "IDF.simulate".
+        stack (tuple of str): The names of the enclosing spans of the same
+            thread, outermost first.
+        thread_id (int): The identifier of the thread the span ran in.
+        start (int): Start time [ns], relative to the start of the trace.
+        attributes (dict): Additional information shown with the span.
+    """
+
+    __slots__ = ("name", "stack", "thread_id", "start", "end", "attributes")
+
+    def __init__(self, name, stack, thread_id, start, attributes):
+        self.name = name
+        self.stack = stack
+        self.thread_id = thread_id
+        self.start = start
+        self.end = None
+        self.attributes = attributes
+
+    @property
+    def duration(self) -> int:
+        """Wall time of the span [ns]."""
+        return self.end - self.start
+
+    def __repr__(self):
+        return f"Span({self.name!r}, {self.duration / 1e9:.3f} s)"
+
+
+class Tracer:
+    """Collects the spans of a run.
+
+    Spans can be opened from several threads, e.g. by
+    :func:`~archetypal.utils.parallel_process`. Each thread keeps its own stack
+    of open spans.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._origin = time.perf_counter_ns()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        """Record the wall time of the `with` block as a span named `name`."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        record = Span(
+            name,
+            tuple(stack),
+            threading.get_ident(),
+            time.perf_counter_ns() - self._origin,
+            attributes,
+        )
+        stack.append(name)
+        try:
+            yield record
+        finally:
+            record.end = time.perf_counter_ns() - self._origin
+            stack.pop()
+            with self._lock:
+                self.spans.append(record)
+
+    def to_chrome_trace(self) -> dict:
+        """Return the spans in the Chrome trace event format.
+
+        Returns:
+            dict: A JSON-serializable trace with one complete ("X") event per
+            span. Times are in microseconds.
+        """
+        pid = os.getpid()
+        thread_ids = {}
+        events = []
+        for span in sorted(self.spans, key=lambda s: (s.start, -s.end)):
+            tid = thread_ids.setdefault(span.thread_id, len(thread_ids))
+            events.append(
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": span.start / 1e3,
+                    "dur": span.duration / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {key: str(value) for key, value in span.attributes.items()},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_folded(self) -> str:
+        """Return the spans as folded stacks.
+
+        Each line is a semicolon-separated stack followed by the self time of its
+        innermost span in microseconds, as read by `flamegraph.pl` and speedscope.
+        """
+        self_time = defaultdict(int)
+        for span in self.spans:
+            self_time[(*span.stack, span.name)] += span.duration
+            if span.stack:
+                self_time[span.stack] -= span.duration
+        return "".join(
+            f"{';'.join(stack)} {max(duration, 0) // 1000}\n" for stack, duration in sorted(self_time.items())
+        )
+
+    def save(self, path):
+        """Write the profile to `path`.
+
+        Files with the ".folded" or ".txt" extension get folded stacks; any other
+        file gets a Chrome trace.
+
+        Args:
+            path (str or Path): The output file.
+
+        Returns:
+            Path: The output file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix in (".folded", ".txt"):
+            path.write_text(self.to_folded())
+        else:
+            with open(path, "w") as f:
+                json.dump(self.to_chrome_trace(), f)
+        return path
+
+
+@contextlib.contextmanager
+def tracing(path=None):
+    """Record the spans opened inside the `with` block.
+
+    Nested blocks share the outer tracer.
+
+    Args:
+        path (str or Path, optional): If given, the profile is written to this
+            file when the block exits. See :meth:`Tracer.save`.
+
+    Yields:
+        Tracer: The tracer collecting the spans.
+    """
+    global _TRACER
+    if _TRACER is not None:
+        yield _TRACER
+        return
+    _TRACER = tracer = Tracer()
+    try:
+        yield tracer
+    finally:
+        _TRACER = None
+        if path is not None:
+            tracer.save(path)
+
+
+def span(name, **attributes):
+    """Record the wall time of a `with` block if tracing is enabled.
+
+    Examples:
+        >>> with span("ExpandObjects", idf=idf.name):
+        >>>     ...
+
+    Args:
+        name (str): The name of the span.
+        **attributes: Additional information shown with the span.
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, **attributes)
+
+
+def traced(func=None, *, name=None):
+    """Record each call of the decorated function as a span.
+
+    Examples:
+        >>> @traced
+        >>> def from_epbunch(cls, epbunch):
+        >>>     ...
+
+    Args:
+        func (callable): The decorated function.
+        name (str, optional): The name of the span. Defaults to the qualified
+            name of the function.
+    """
+    if func is None:
+        return functools.partial(traced, name=name)
+    span_name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _TRACER
+        if tracer is None:
+            return func(*args, **kwargs)
+        with tracer.span(span_name):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging as lg
+import re
 from collections import OrderedDict, defaultdict
 from concurrent.futures.thread import ThreadPoolExecutor
 from typing import ClassVar, Union
@@ -39,6 +40,7 @@ from archetypal.template.ventilation import VentilationSetting
 from archetypal.template.window_setting import WindowSetting
 from archetypal.template.zone_construction_set import ZoneConstructionSet
 from archetypal.template.zonedefinition import ZoneDefinition
+from archetypal.tracing import traced
 from archetypal.utils import CustomJSONEncoder, log, parallel_process
 
 
@@ -76,6 +78,47 @@ class UmiTemplateLibrary:
         "BuildingTemplates",
     ]
 
+    # Sections of a template library file, in the order they are written, and the
+    # sections their components reference.
+    _SECTION_REFERENCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "GasMaterials": (),
+        "GlazingMaterials": (),
+        "OpaqueMaterials": (),
+        "OpaqueConstructions": ("GasMaterials", "GlazingMaterials", "OpaqueMaterials"),
+        "WindowConstructions": ("GasMaterials", "GlazingMaterials"),
+        "StructureDefinitions": ("OpaqueMaterials",),
+        "DaySchedules": (),
+        "WeekSchedules": ("DaySchedules",),
+        "YearSchedules": ("WeekSchedules",),
+        "DomesticHotWaterSettings": ("YearSchedules",),
+        "VentilationSettings": ("YearSchedules",),
+        "ZoneConditionings": ("YearSchedules",),
+        "ZoneConstructionSets": ("OpaqueConstructions",),
+        "ZoneLoads": ("YearSchedules",),
+        "Zones": (
+            "ZoneConditionings",
+            "ZoneConstructionSets",
+            "DomesticHotWaterSettings",
+            "OpaqueConstructions",
+            "ZoneLoads",
+            "VentilationSettings",
+        ),
+        "WindowSettings": ("YearSchedules", "WindowConstructions"),
+        "BuildingTemplates": (
+            "Zones",
+            "StructureDefinitions",
+            "WindowSettings",
+            "YearSchedules",
+            "WindowConstructions",
+        ),
+    }
+
+    # Groups stored under another name in template library files.
+    _SECTION_NAMES: ClassVar[dict[str, str]] = {
+        "StructureInformations": "StructureDefinitions",
+        "ZoneDefinitions": "Zones",
+    }
+
     def __init__(
         self,
         name="unnamed",
@@ -193,6 +236,7 @@ class UmiTemplateLibrary:
         return objs
 
     @classmethod
+    @traced
     def from_idf_files(
         cls,
         idf_files,
@@ -317,159 +361,189 @@ class UmiTemplateLibrary:
         return BuildingTemplate.from_idf(idf, **kwargs)
 
     @classmethod
-    def open(cls, filename):
+    @traced
+    def open(cls, filename, chunk_size=2**16):
         """Initialize an UmiTemplate object from an UMI Template Library File.
 
+        The file is read section by section: each section is decoded and turned
+        into components before the next one is read, so that the memory used is
+        bounded by the largest section rather than by the size of the file.
+
         Args:
             filename (str or Path): PathLike object giving the pathname of the UMI
                 Template File.
+            chunk_size (int): The number of characters read from the file at a
+                time.
 
         Returns:
             UmiTemplateLibrary: The template object.
         """
         name = Path(filename)
         with open(filename) as f:
-            t = cls.loads(f.read(), name)
+            t = cls.from_sections(_iter_json_sections(f, chunk_size), name)
 
         return t
 
     @classmethod
+    @traced
     def loads(cls, s, name):
         """load string."""
-        datastore = json.loads(s)
-        # with datastore, create each objects
+        return cls.from_sections(json.loads(s).items(), name)
+
+    @classmethod
+    def from_sections(cls, sections, name):
+        """Create an UmiTemplateLibrary from the sections of a template library file.
+
+        Each section is loaded as soon as the sections it references are loaded,
+        and is then released. Sections written in dependency order, as done by
+        :meth:`to_json`, are therefore never held in memory together. Unknown
+        sections are ignored.
+
+        Args:
+            sections (Iterable of tuple): The (name, list of component dicts) pairs
+                of the file, e.g. ``json.load(f).items()``.
+            name (str or Path): The name of the library.
+
+        Returns:
+            UmiTemplateLibrary: The template object.
+
+        Raises:
+            KeyError: If a section is missing.
+        """
         t = cls(name)
-        t.GasMaterials = [GasMaterial.from_dict(store, allow_duplicates=False) for store in datastore["GasMaterials"]]
-        t.GlazingMaterials = [
-            GlazingMaterial.from_dict(store, allow_duplicates=False) for store in datastore["GlazingMaterials"]
-        ]
-        t.OpaqueMaterials = [
-            OpaqueMaterial.from_dict(store, allow_duplicates=False) for store in datastore["OpaqueMaterials"]
-        ]
-        t.OpaqueConstructions = [
-            OpaqueConstruction.from_dict(
-                store,
-                materials={a.id: a for a in (t.GasMaterials + t.GlazingMaterials + t.OpaqueMaterials)},
-                allow_duplicates=True,
-            )
-            for store in datastore["OpaqueConstructions"]
-        ]
-        t.WindowConstructions = [
-            WindowConstruction.from_dict(
-                store,
-                materials={a.id: a for a in (t.GasMaterials + t.GlazingMaterials)},
-                allow_duplicates=True,
-            )
-            for store in datastore["WindowConstructions"]
-        ]
-        t.StructureInformations = [
-            StructureInformation.from_dict(
-                store,
-                materials={a.id: a for a in t.OpaqueMaterials},
-                allow_duplicates=True,
-            )
-            for store in datastore["StructureDefinitions"]
-        ]
-        t.DaySchedules = [DaySchedule.from_dict(store, allow_duplicates=True) for store in datastore["DaySchedules"]]
-        t.WeekSchedules = [
-            WeekSchedule.from_dict(
-                store,
-                day_schedules={a.id: a for a in t.DaySchedules},
-                allow_duplicates=True,
-            )
-            for store in datastore["WeekSchedules"]
-        ]
-        t.YearSchedules = [
-            YearSchedule.from_dict(
-                store,
-                week_schedules={a.id: a for a in t.WeekSchedules},
-                allow_duplicates=True,
-            )
-            for store in datastore["YearSchedules"]
-        ]
-        t.DomesticHotWaterSettings = [
-            DomesticHotWaterSetting.from_dict(
-                store,
-                schedules={a.id: a for a in t.YearSchedules},
-                allow_duplicates=True,
-            )
-            for store in datastore["DomesticHotWaterSettings"]
-        ]
-        t.VentilationSettings = [
-            VentilationSetting.from_dict(
-                store,
-                schedules={a.id: a for a in t.YearSchedules},
-                allow_duplicates=True,
-            )
-            for store in datastore["VentilationSettings"]
-        ]
-        t.ZoneConditionings = [
-            ZoneConditioning.from_dict(
-                store,
-                schedules={a.id: a for a in t.YearSchedules},
-                allow_duplicates=True,
-            )
-            for store in datastore["ZoneConditionings"]
-        ]
-        t.ZoneConstructionSets = [
-            ZoneConstructionSet.from_dict(
-                store,
-                opaque_constructions={a.id: a for a in t.OpaqueConstructions},
-                allow_duplicates=True,
-            )
-            for store in datastore["ZoneConstructionSets"]
-        ]
-        t.ZoneLoads = [
-            ZoneLoad.from_dict(
-                store,
-                schedules={a.id: a for a in t.YearSchedules},
-                allow_duplicates=True,
-            )
-            for store in datastore["ZoneLoads"]
-        ]
-        t.ZoneDefinitions = [
-            ZoneDefinition.from_dict(
-                store,
-                zone_conditionings={a.id: a for a in t.ZoneConditionings},
-                zone_construction_sets={a.id: a for a in t.ZoneConstructionSets},
-                domestic_hot_water_settings={a.id: a for a in t.DomesticHotWaterSettings},
-                opaque_constructions={a.id: a for a in t.OpaqueConstructions},
-                zone_loads={a.id: a for a in t.ZoneLoads},
-                ventilation_settings={a.id: a for a in t.VentilationSettings},
-                allow_duplicates=True,
-            )
-            for store in datastore["Zones"]
-        ]
-        t.WindowSettings = [
-            WindowSetting.from_ref(
-                store["$ref"],
-                datastore["BuildingTemplates"],
-                schedules={a.id: a for a in t.YearSchedules},
-                window_constructions={a.id: a for a in t.WindowConstructions},
-            )
-            if "$ref" in store
-            else WindowSetting.from_dict(
-                store,
-                schedules={a.id: a for a in t.YearSchedules},
-                window_constructions={a.id: a for a in t.WindowConstructions},
-                allow_duplicates=True,
-            )
-            for store in datastore["WindowSettings"]
-        ]
-        t.BuildingTemplates = [
-            BuildingTemplate.from_dict(
-                store,
-                zone_definitions={a.id: a for a in t.ZoneDefinitions},
-                structure_definitions={a.id: a for a in t.StructureInformations},
-                window_settings={a.id: a for a in t.WindowSettings},
-                schedules={a.id: a for a in t.YearSchedules},
-                window_constructions={a.id: a for a in t.WindowConstructions},
-                allow_duplicates=True,
-            )
-            for store in datastore["BuildingTemplates"]
-        ]
+        pending, loaded = {}, set()
+        for key, stores in sections:
+            if key not in cls._SECTION_REFERENCES:
+                continue
+            pending[key] = stores
+            progress = True
+            while progress:
+                progress = False
+                for section in list(pending):
+                    if not loaded.issuperset(cls._SECTION_REFERENCES[section]):
+                        continue
+                    if (
+                        section == "WindowSettings"
+                        and "BuildingTemplates" not in pending
+                        and any("$ref" in store for store in pending[section])
+                    ):
+                        # Referenced WindowSettings are stored in the BuildingTemplates.
+                        continue
+                    t._load_section(section, pending.pop(section), pending)
+                    loaded.add(section)
+                    progress = True
+        for section in cls._SECTION_REFERENCES:
+            if section not in loaded:
+                raise KeyError(section)
         return t
 
+    def _load_section(self, key, stores, pending):
+        """Create the components of a section of a template library file.
+
+        Args:
+            key (str): The name of the section.
+            stores (list of dict): The components of the section.
+            pending (dict): The sections read but not loaded yet.
+        """
+
+        def by_id(*groups):
+            return {a.id: a for group in groups for a in group}
+
+        if key == "GasMaterials":
+            self.GasMaterials = [GasMaterial.from_dict(store, allow_duplicates=False) for store in stores]
+        elif key == "GlazingMaterials":
+            self.GlazingMaterials = [GlazingMaterial.from_dict(store, allow_duplicates=False) for store in stores]
+        elif key == "OpaqueMaterials":
+            self.OpaqueMaterials = [OpaqueMaterial.from_dict(store, allow_duplicates=False) for store in stores]
+        elif key == "OpaqueConstructions":
+            materials = by_id(self.GasMaterials, self.GlazingMaterials, self.OpaqueMaterials)
+            self.OpaqueConstructions = [
+                OpaqueConstruction.from_dict(store, materials=materials, allow_duplicates=True) for store in stores
+            ]
+        elif key == "WindowConstructions":
+            materials = by_id(self.GasMaterials, self.GlazingMaterials)
+            self.WindowConstructions = [
+                WindowConstruction.from_dict(store, materials=materials, allow_duplicates=True) for store in stores
+            ]
+        elif key == "StructureDefinitions":
+            materials = by_id(self.OpaqueMaterials)
+            self.StructureInformations = [
+                StructureInformation.from_dict(store, materials=materials, allow_duplicates=True) for store in stores
+            ]
+        elif key == "DaySchedules":
+            self.DaySchedules = [DaySchedule.from_dict(store, allow_duplicates=True) for store in stores]
+        elif key == "WeekSchedules":
+            day_schedules = by_id(self.DaySchedules)
+            self.WeekSchedules = [
+                WeekSchedule.from_dict(store, day_schedules=day_schedules, allow_duplicates=True) for store in stores
+            ]
+        elif key == "YearSchedules":
+            week_schedules = by_id(self.WeekSchedules)
+            self.YearSchedules = [
+                YearSchedule.from_dict(store, week_schedules=week_schedules, allow_duplicates=True) for store in stores
+            ]
+        elif key in ("DomesticHotWaterSettings", "VentilationSettings", "ZoneConditionings", "ZoneLoads"):
+            component = {
+                "DomesticHotWaterSettings": DomesticHotWaterSetting,
+                "VentilationSettings": VentilationSetting,
+                "ZoneConditionings": ZoneConditioning,
+                "ZoneLoads": ZoneLoad,
+            }[key]
+            schedules = by_id(self.YearSchedules)
+            setattr(
+                self,
+                key,
+                [component.from_dict(store, schedules=schedules, allow_duplicates=True) for store in stores],
+            )
+        elif key == "ZoneConstructionSets":
+            opaque_constructions = by_id(self.OpaqueConstructions)
+            self.ZoneConstructionSets = [
+                ZoneConstructionSet.from_dict(store, opaque_constructions=opaque_constructions, allow_duplicates=True)
+                for store in stores
+            ]
+        elif key == "Zones":
+            references = {
+                "zone_conditionings": by_id(self.ZoneConditionings),
+                "zone_construction_sets": by_id(self.ZoneConstructionSets),
+                "domestic_hot_water_settings": by_id(self.DomesticHotWaterSettings),
+                "opaque_constructions": by_id(self.OpaqueConstructions),
+                "zone_loads": by_id(self.ZoneLoads),
+                "ventilation_settings": by_id(self.VentilationSettings),
+            }
+            self.ZoneDefinitions = [
+                ZoneDefinition.from_dict(store, **references, allow_duplicates=True) for store in stores
+            ]
+        elif key == "WindowSettings":
+            schedules = by_id(self.YearSchedules)
+            window_constructions = by_id(self.WindowConstructions)
+            self.WindowSettings = [
+                WindowSetting.from_ref(
+                    store["$ref"],
+                    pending["BuildingTemplates"],
+                    schedules=schedules,
+                    window_constructions=window_constructions,
+                )
+                if "$ref" in store
+                else WindowSetting.from_dict(
+                    store,
+                    schedules=schedules,
+                    window_constructions=window_constructions,
+                    allow_duplicates=True,
+                )
+                for store in stores
+            ]
+        elif key == "BuildingTemplates":
+            references = {
+                "zone_definitions": by_id(self.ZoneDefinitions),
+                "structure_definitions": by_id(self.StructureInformations),
+                "window_settings": by_id(self.WindowSettings),
+                "schedules": by_id(self.YearSchedules),
+                "window_constructions": by_id(self.WindowConstructions),
+            }
+            self.BuildingTemplates = [
+                BuildingTemplate.from_dict(store, **references, allow_duplicates=True) for store in stores
+            ]
+
     def validate(self, defaults=True):
         """Validate the object."""
         pass
@@ -481,6 +555,7 @@ class UmiTemplateLibrary:
         sort_keys=False,
         compression="infer",
         storage_options=None,
+        json_backend="json",
     ):
         """Save to json file.
 
@@ -508,6 +583,8 @@ class UmiTemplateLibrary:
                 “gcs://”. An error will be raised if providing this argument with a
                 non-fsspec URL. See the fsspec and backend storage implementation
                 docs for the set of allowed keys and values.
+            json_backend (str): The JSON encoder, "json" or "orjson". See
+                :meth:`to_json`.
         """
         if path_or_buf is None:
             basedir = Path(self.name).dirname()
@@ -520,8 +597,10 @@ class UmiTemplateLibrary:
             sort_keys=sort_keys,
             compression=compression,
             storage_options=storage_options,
+            json_backend=json_backend,
         )
 
+    @traced
     def to_json(
         self,
         path_or_buf=None,
@@ -530,9 +609,13 @@ class UmiTemplateLibrary:
         default_handler=None,
         compression="infer",
         storage_options=None,
+        json_backend="json",
     ):
         """Convert the object to a JSON string.
 
+        The library is encoded and written section by section, so that the memory
+        used is bounded by the largest section rather than by the whole library.
+
         Args:
             path_or_buf (path-like): File path or object. If not specified,
                 the result is returned as a string.
@@ -558,23 +641,34 @@ class UmiTemplateLibrary:
                 “gcs://”. An error will be raised if providing this argument with a
                 non-fsspec URL. See the fsspec and backend storage implementation
                 docs for the set of allowed keys and values.
+            json_backend (str): The JSON encoder. "json" (the default) uses the
+                standard library. "orjson" is several times faster but requires the
+                optional `orjson` package, only supports an `indent` of None or 2,
+                ignores `default_handler` and writes NaN as null.
         """
-        if default_handler is None:
-            default_handler = CustomJSONEncoder
+        if json_backend == "json":
+            if default_handler is None:
+                default_handler = CustomJSONEncoder
 
-        data_dict = self.to_dict()
+            def encode(obj):
+                return json.dumps(obj, indent=indent, cls=default_handler)
 
-        if sort_keys is not None:
-            # Sort values
-            for key in data_dict:
-                # Sort the list elements by their Name
-                try:
-                    data_dict[key] = sorted(data_dict[key], key=sort_keys)
-                except Exception:
-                    # revert to sorting by Name if failure
-                    data_dict[key] = sorted(data_dict[key], key=lambda x: x.get("Name"))
+        elif json_backend == "orjson":
+            try:
+                import orjson
+            except ImportError as e:
+                raise ImportError("orjson required for json_backend='orjson'") from e
+            if indent not in (None, 2):
+                raise ValueError(f"json_backend='orjson' only supports an indent of None or 2, not {indent!r}")
+            option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
 
-        response = json.dumps(data_dict, indent=indent, cls=default_handler)
+            def encode(obj):
+                return orjson.dumps(obj, option=option).decode()
+
+        else:
+            raise ValueError(f"Invalid json_backend '{json_backend}'. Choose 'json' or 'orjson'.")
+
+        chunks = self._iter_json(encode, indent, sort_keys)
         if path_or_buf is not None:
             # apply compression and byte/text conversion
             with get_handle(
@@ -583,39 +677,71 @@ class UmiTemplateLibrary:
                 compression=compression,
                 storage_options=storage_options,
             ) as handles:
-                handles.handle.write(response)
+                for chunk in chunks:
+                    handles.handle.write(chunk)
         else:
-            return response
+            return "".join(chunks)
+
+    def _iter_json(self, encode, indent, sort_keys):
+        """Yield the JSON text of the library, one section at a time.
 
+        The text is the same as encoding :meth:`to_dict` in one go.
+
+        Args:
+            encode (callable): Encodes the list of component dicts of a section.
+            indent (int or str): The indent passed to `encode`.
+            sort_keys (callable): The sort key of the components of a section.
+        """
+        if indent is None:
+            opening, separator, closing = "{", ", ", "}"
+        else:
+            indent = " " * indent if isinstance(indent, int) else indent
+            opening, separator, closing = "{\n" + indent, ",\n" + indent, "\n}"
+        yield opening
+        for i, (key, section) in enumerate(self._iter_sections()):
+            if sort_keys is not None:
+                # Sort the list elements by their Name
+                try:
+                    section = sorted(section, key=sort_keys)
+                except Exception:
+                    # revert to sorting by Name if failure
+                    section = sorted(section, key=lambda x: x.get("Name"))
+            text = encode(section)
+            if indent is not None:
+                # Nest the section one level deeper. JSON strings cannot contain
+                # raw newlines, so every newline is a line break of the layout.
+                text = text.replace("\n", "\n" + indent)
+            yield (separator if i else "") + json.dumps(key) + ": " + text
+        yield closing
+
+    @traced
     def to_dict(self):
         """Return UmiTemplateLibrary dictionary representation."""
-        data_dict = OrderedDict([(key, []) for key in self._LIB_GROUPS])
+        return OrderedDict(self._iter_sections())
+
+    def _iter_sections(self):
+        """Yield the name and the component dicts of each section of the library.
 
+        Sections come in the order of :attr:`_SECTION_REFERENCES`, so that a
+        section only references sections that come before it.
+        """
         for group_name, group in self:
             UniqueName.existing = {}
+            section = []
             for obj in group:
                 data = obj.to_dict()
                 data.update({"Name": UniqueName(data.get("Name"))})
-                data_dict[group_name].append(data)
-
-        if not data_dict["GasMaterials"]:
-            data = GasMaterial(Name="AIR").to_dict()
-            data.update({"Name": UniqueName(data.get("Name"))})
-            data_dict["GasMaterials"].append(data)
-            data_dict.move_to_end("GasMaterials", last=False)
+                section.append(data)
 
-        for key in list(data_dict.keys()):
-            if key == "ZoneDefinitions":
-                data_dict["Zones"] = data_dict.pop(key)
-            elif key == "StructureInformations":
-                data_dict["StructureDefinitions"] = data_dict.pop(key)
-
-        assert no_duplicates(data_dict, attribute="Name")
+            if group_name == "GasMaterials" and not section:
+                data = GasMaterial(Name="AIR").to_dict()
+                data.update({"Name": UniqueName(data.get("Name"))})
+                section.append(data)
 
-        for key in data_dict:
-            data_dict[key] = sorted(data_dict[key], key=lambda x: x.get("Name"))
+            key = self._SECTION_NAMES.get(group_name, group_name)
+            assert no_duplicates({key: section}, attribute="Name")
 
-        return data_dict
+            yield key, sorted(section, key=lambda x: x.get("Name"))
 
     def unique_components(self, *args: str, exceptions: list[str] | None = None, keep_orphaned=False):
         """Keep only unique components.
@@ -738,6 +864,79 @@ class UmiTemplateLibrary:
         return G
 
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _iter_json_sections(fp, chunk_size=2**16):
+    """Yield the (key, value) pairs of the top-level JSON object of a text file.
+
+    The file is read in chunks and each value is decoded as soon as its text is
+    complete, so that only the text of one value is held in memory at a time.
+
+    Args:
+        fp (file-like): The open text file.
+        chunk_size (int): The minimum number of characters read at a time.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON object.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        # Grow the read size with the pending text so that decoding a large value
+        # is retried a logarithmic number of times.
+        chunk = fp.read(max(chunk_size, len(buffer) - pos))
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+
+    def peek():
+        """Skip whitespace and return the next character; "" at the end of file."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos : pos + 1]
+            read_more()
+
+    def expect(chars):
+        nonlocal pos
+        char = peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", buffer, pos)
+        pos += 1
+        return char
+
+    def decode():
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value that ends with the buffer may be truncated, e.g. a number.
+                if end < len(buffer) or eof:
+                    pos = end
+                    return value
+            read_more()
+
+    expect("{")
+    if peek() == "}":
+        return
+    while True:
+        key = decode()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", buffer, pos)
+        expect(":")
+        yield key, decode()
+        if expect(",}") == "}":
+            return
+
+
 def no_duplicates(file: Union[str, dict], attribute="Name"):
     """Assert whether or not dict has duplicated Names."""
 
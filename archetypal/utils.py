@@ -7,6 +7,8 @@
 
 import contextlib
 import datetime as dt
+import functools
+import inspect
 import json
 import logging
 import logging as lg
@@ -41,6 +43,11 @@ def config(
     default_weight_factor="area",
     ep_version=settings.ep_version,
     debug=settings.debug,
+    *,
+    cache_expire_after=settings.cache_expire_after,
+    cache_max_size=settings.cache_max_size,
+    cache_ground_heat_transfer=settings.cache_ground_heat_transfer,
+    run_folder=settings.run_folder,
 ):
     """Package configurations. Call this method at the beginning of script or at the
     top of an interactive python environment to set package-wide settings.
@@ -63,12 +70,24 @@ def config(
         default_weight_factor:
         ep_version (str): EnergyPlus version to use. eg. "9-2-0".
         debug (bool): Use debug behavior in various part of code base.
+        cache_expire_after (float): number of seconds after which a cached
+            response is requested again. None to never expire.
+        cache_max_size (int): maximum size in bytes of the compressed responses
+            kept in the cache. The oldest responses are evicted first.
+        cache_ground_heat_transfer (bool): if True, reuse the results of the
+            Basement and Slab preprocessors for identical inputs.
+        run_folder (str): where the programs run, e.g. a tmpfs mount. If None,
+            next to the simulation results.
 
     Returns:
         None
     """
     # set each global variable to the passed-in parameter value
     settings.cache_responses = cache_responses
+    settings.cache_expire_after = cache_expire_after
+    settings.cache_max_size = cache_max_size
+    settings.cache_ground_heat_transfer = cache_ground_heat_transfer
+    settings.run_folder = Path(run_folder).expand().makedirs_p() if run_folder else None
     settings.cache_folder = Path(cache_folder).expand().makedirs_p()
     settings.data_folder = Path(data_folder).expand().makedirs_p()
     settings.imgs_folder = Path(imgs_folder).expand().makedirs_p()
@@ -539,6 +558,8 @@ def parallel_process(
     position=0,
     debug=False,
     executor=None,
+    initializer=None,
+    initargs=(),
 ) -> dict:
     """A parallel version of the map function with a progress b
 
@@ -566,6 +587,11 @@ def parallel_process(
             Automatic if unspecified. Useful to manage multiple bars at once
             (eg, from threads).
         executor (Executor)
+        initializer (callable, optional): Called with `initargs` in each worker,
+            once its settings are those of this process, e.g. to load data shared
+            by the calls of `function`. If `processors` is 1, it is called in this
+            process.
+        initargs (tuple): The arguments of `initializer`.
 
     Returns:
         [function(array[0]), function(array[1]), ...]
@@ -590,6 +616,8 @@ def parallel_process(
     }
 
     if processors == 1:
+        if initializer is not None:
+            initializer(*initargs)
         if use_kwargs:
             out = {filename: submit(function, **in_dict[filename]) for filename in tqdm(in_dict, **kwargs)}
         else:
@@ -597,23 +625,7 @@ def parallel_process(
     else:
         with _executor_factory(
             max_workers=processors,
-            initializer=config,
-            initargs=(
-                settings.data_folder,
-                settings.logs_folder,
-                settings.imgs_folder,
-                settings.cache_folder,
-                settings.cache_responses,
-                settings.log_file,
-                settings.log_console,
-                settings.log_level,
-                settings.log_name,
-                settings.log_filename,
-                settings.useful_idf_objects,
-                "area",
-                settings.ep_version,
-                settings.debug,
-            ),
+            initializer=functools.partial(_initialize_worker, _worker_config(), initializer, initargs),
         ) as executor:
             out = {}
 
@@ -638,6 +650,34 @@ def parallel_process(
     return out
 
 
+def _worker_config():
+    """Return the value of every field of the settings, to reproduce them in a worker."""
+    return {name: getattr(settings, name) for name in type(settings).model_fields}
+
+
+def _initialize_worker(values, initializer, initargs):
+    """Configure a worker like this process, then call the initializer of the caller."""
+    _configure_worker(**values)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _configure_worker(**values):
+    """Apply the settings of the parent process in a worker.
+
+    The parameters of :func:`config` go through it, so that folders and loggers
+    are set up; the other fields are assigned directly.
+    """
+    parameters = inspect.signature(config).parameters
+    for name, value in values.items():
+        if name not in parameters:
+            setattr(settings, name, value)
+    config(
+        default_weight_factor=settings.zone_weight.get_weight_attr(),
+        **{name: value for name, value in values.items() if name in parameters},
+    )
+
+
 def submit(fn, *args, **kwargs):
     """return fn or Exception"""
     try:
@@ -0,0 +1,238 @@
+"""Parsed EnergyPlus weather files shared between runs.
+
+An EPW file is parsed once and stored in the cache folder under the digest of
+its content: the header as json and each hourly field as a numpy array. The
+arrays are opened as read-only memory maps, so runs and processes using the
+same climate file share one parsed copy through the page cache.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+from path import Path
+
+from archetypal import settings
+
+EPW_COLUMNS = (
+    "Year",
+    "Month",
+    "Day",
+    "Hour",
+    "Minute",
+    "Data Source and Uncertainty Flags",
+    "Dry Bulb Temperature",
+    "Dew Point Temperature",
+    "Relative Humidity",
+    "Atmospheric Station Pressure",
+    "Extraterrestrial Horizontal Radiation",
+    "Extraterrestrial Direct Normal Radiation",
+    "Horizontal Infrared Radiation Intensity",
+    "Global Horizontal Radiation",
+    "Direct Normal Radiation",
+    "Diffuse Horizontal Radiation",
+    "Global Horizontal Illuminance",
+    "Direct Normal Illuminance",
+    "Diffuse Horizontal Illuminance",
+    "Zenith Luminance",
+    "Wind Direction",
+    "Wind Speed",
+    "Total Sky Cover",
+    "Opaque Sky Cover",
+    "Visibility",
+    "Ceiling Height",
+    "Present Weather Observation",
+    "Present Weather Codes",
+    "Precipitable Water",
+    "Aerosol Optical Depth",
+    "Snow Depth",
+    "Days Since Last Snowfall",
+    "Albedo",
+    "Liquid Precipitation Depth",
+    "Liquid Precipitation Quantity",
+)
+
+# the keywords of the 8 header lines of an EPW file.
+EPW_HEADER = (
+    "LOCATION",
+    "DESIGN CONDITIONS",
+    "TYPICAL/EXTREME PERIODS",
+    "GROUND TEMPERATURES",
+    "HOLIDAYS/DAYLIGHT SAVINGS",
+    "COMMENTS 1",
+    "COMMENTS 2",
+    "DATA PERIODS",
+)
+
+
+def epw_digest(epw) -> str:
+    """Return the hexadecimal SHA-256 digest of the content of a weather file."""
+    sha = hashlib.sha256()
+    with open(epw, "rb") as f:
+        for chunk in iter(functools.partial(f.read, 2**20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class Weather:
+    """The header and hourly fields of a parsed weather file.
+
+    Use :func:`read_epw` to get the shared instance of a file.
+
+    Args:
+        path (str or Path): The cache directory of the parsed file.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.header = json.loads((self.path / "header.json").read_text())
+        self._columns = {}
+
+    @property
+    def columns(self) -> list:
+        """list of str: The names of the hourly fields."""
+        return [name for name in EPW_COLUMNS if (self.path / f"{_filename(name)}.npy").exists()]
+
+    def __getitem__(self, name) -> np.ndarray:
+        """Return the read-only memory-mapped values of the field `name`."""
+        if name not in self._columns:
+            try:
+                self._columns[name] = np.load(self.path / f"{_filename(name)}.npy", mmap_mode="r")
+            except FileNotFoundError:
+                raise KeyError(name) from None
+        return self._columns[name]
+
+    @property
+    def location(self) -> dict:
+        """dict: The fields of the LOCATION header line."""
+        city, state, country, source, wmo, latitude, longitude, time_zone, elevation, *_ = self.header["LOCATION"]
+        return {
+            "city": city,
+            "state": state,
+            "country": country,
+            "source": source,
+            "wmo": wmo,
+            "latitude": float(latitude),
+            "longitude": float(longitude),
+            "time_zone": float(time_zone),
+            "elevation": float(elevation),
+        }
+
+    @functools.cached_property
+    def index(self) -> pd.DatetimeIndex:
+        """pd.DatetimeIndex: The start of each record, in the year 2018.
+
+        Files with records on February 29 are placed in the leap year 2020.
+        """
+        minute = self["Minute"].astype(int)
+        records_per_hour = int(self.header["DATA PERIODS"][1] or 1)
+        # the Minute field is the end of the record, 0 and 60 both ending the hour.
+        minutes = (self["Hour"].astype(int) - 1) * 60 + np.where(minute == 0, 60, minute) - 60 // records_per_hour
+        month, day = self["Month"].astype(int), self["Day"].astype(int)
+        year = 2020 if ((month == 2) & (day == 29)).any() else 2018
+        dates = pd.to_datetime({"year": year, "month": month, "day": day})
+        return pd.DatetimeIndex(dates + pd.to_timedelta(minutes, unit="min"))
+
+    def series(self, name) -> pd.Series:
+        """Return the field `name` as a Series on the hourly :attr:`index`."""
+        return pd.Series(self[name], index=self.index, name=name, copy=False)
+
+    def to_frame(self, columns=None) -> pd.DataFrame:
+        """Return several fields as a DataFrame on the hourly :attr:`index`.
+
+        Args:
+            columns (list of str, optional): The fields. All of them if None.
+        """
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({name: self[name] for name in columns}, index=self.index)
+
+    def __repr__(self):
+        return f"Weather({self.location['city']}, {self.path.basename()})"
+
+
+def _filename(name):
+    return name.replace(" ", "_").lower()
+
+
+class WeatherCache:
+    """Local on-disk cache of the parsed weather files.
+
+    Each file is stored in a directory named after its :func:`epw_digest`.
+
+    Args:
+        path (str or Path): The directory holding the parsed files.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def get(self, epw) -> Weather:
+        """Return the parsed weather file `epw`, parsing it on a miss."""
+        directory = self.path / epw_digest(epw)
+        if not (directory / "header.json").exists():
+            self._parse(epw, directory)
+        return _open_weather(directory)
+
+    def _parse(self, epw, directory):
+        with open(epw, encoding="latin-1") as f:
+            header = {}
+            for _ in EPW_HEADER:
+                keyword, *fields = next(f).rstrip("\r\n").split(",")
+                header[keyword.strip().upper()] = fields
+        data = pd.read_csv(epw, skiprows=len(EPW_HEADER), header=None, encoding="latin-1")
+        data.columns = EPW_COLUMNS[: data.shape[1]]
+
+        # Parse into a temporary directory first so that concurrent runs never
+        # read a partially written result.
+        tmp = self.path.makedirs_p() / f"{directory.basename()}.{uuid.uuid4().hex[:8]}.tmp"
+        tmp.mkdir()
+        for name, column in data.items():
+            values = column.to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            np.save(tmp / f"{_filename(name)}.npy", values)
+        (tmp / "header.json").write_text(json.dumps(header))
+        try:
+            os.replace(tmp, directory)
+        except OSError:
+            # another run parsed the same file in the meantime.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def clear(self):
+        """Delete all the parsed weather files."""
+        if self.path.exists():
+            for directory in self.path.dirs():
+                directory.rmtree_p()
+        _open_weather.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _open_weather(directory):
+    return Weather(directory)
+
+
+def _weather_cache():
+    """Return the WeatherCache configured by the package settings."""
+    return WeatherCache(Path(settings.cache_folder) / "weather")
+
+
+def read_epw(epw) -> Weather:
+    """Return the parsed weather file `epw`, shared by all the runs using it.
+
+    Examples:
+        >>> from archetypal.weather import read_epw
+        >>> weather = read_epw("tests/input_data/CAN_PQ_Montreal.Intl.AP.716270_CWEC.epw")
+        >>> weather.series("Dry Bulb Temperature").mean()
+
+    Args:
+        epw (str or Path): The weather file.
+
+    Returns:
+        Weather: The header and memory-mapped hourly fields.
+    """
+    return _weather_cache().get(epw)
@@ -10,7 +10,7 @@ from eppy.bunch_subclass import EpBunch
 from tqdm.auto import tqdm
 
 from archetypal.plot import save_and_show
-from archetypal.template.zonedefinition import is_core, resolve_obco
+from archetypal.template.zonedefinition import is_core
 from archetypal.utils import log
 
 
@@ -31,6 +31,36 @@ def add_to_report(adj_report, zone, surface, adj_zone, adj_surf, counter):
     adj_report["Surface Type_"].append(adj_surf["Surface_Type"])
 
 
+def surfaces_by_zone(idf):
+    """Return the surfaces of all the zones, read in a single pass over the model.
+
+    Equivalent to calling :func:`eppy.function_helpers.zonesurfaces` for each
+    zone, which searches the whole model every time.
+
+    Args:
+        idf (IDF): The model.
+
+    Returns:
+        dict: The lists of surfaces by upper-case zone name.
+    """
+    surfaces = defaultdict(list)
+    zones = idf.idfobjects["ZONE"]
+    if not zones:
+        return surfaces
+    references = zones[0].getfieldidd("Name").get("reference", [])
+    for objects in idf.idfobjects.values():
+        if not objects:
+            continue
+        first = objects[0]
+        if first.getfieldidd("key").get("group") != "Thermal Zones and Surfaces" or "Zone_Name" not in first.objls:
+            continue
+        if first.getfieldidd("Zone_Name").get("object-list", [None])[0] not in references:
+            continue
+        for obj in objects:
+            surfaces[obj.Zone_Name.upper()].append(obj)
+    return surfaces
+
+
 class ZoneGraph(networkx.Graph):
     """A subclass of :class:`networkx.Graph`. This class implements useful
     methods to visualize and navigate a template along the thermal adjacency of
@@ -57,16 +87,19 @@ class ZoneGraph(networkx.Graph):
     """
 
     @classmethod
-    def from_idf(cls, idf, log_adj_report=True, **kwargs):
+    def from_idf(cls, idf, log_adj_report=False, **kwargs):
         """Create a graph representation of all the building zones. An edge
         between two zones represents the adjacency of the two zones.
 
+        The surfaces of the model are indexed by zone and by name in a single
+        pass, so the graph builds in linear time of the number of surfaces.
+
         If skeleton is False, this method will create all the building
         objects iteratively over the building zones.
 
         Args:
             log_adj_report (bool, optional): If True, prints an adjacency report
-                in the log.
+                in the log. Defaults to False.
             skeleton (bool, optional): If True, create a zone graph without
                 creating hierarchical objects, eg. zones > zoneloads > ect.
             force (bool): If True, will recalculate the graph.
@@ -79,53 +112,58 @@ class ZoneGraph(networkx.Graph):
 
         G = cls(name=idf.name)
 
+        surfaces = surfaces_by_zone(idf)
+        surface_names = {}
+        for zone_surfaces in surfaces.values():
+            for surface in zone_surfaces:
+                surface_names.setdefault(surface.Name.upper(), surface)
+        zones = {zone.Name.upper(): zone for zone in idf.idfobjects["ZONE"]}
+
+        nodes = []
+        edges = []
+        adj_reports = {}
         counter = 0
         zone: EpBunch
-        for zone in tqdm(idf.idfobjects["ZONE"], desc="zone_loop", position=idf.position, **kwargs):
-            # initialize the adjacency report dictionary. default list.
-            adj_report = defaultdict(list)
-            zone_obj = None
-            zonesurfaces = zone.zonesurfaces
-            _is_core = is_core(zone)
-            G.add_node(zone.Name, epbunch=zone, core=_is_core, zone=zone_obj)
-
-            for surface in zonesurfaces:
-                if surface.key.upper() in ["INTERNALMASS", "WINDOWSHADINGCONTROL"]:
-                    # Todo deal with internal mass surfaces
-                    pass
-                else:
-                    adj_zone: EpBunch
-                    adj_surf: EpBunch
-                    adj_surf, adj_zone = resolve_obco(surface)
-
-                    if adj_zone and adj_surf:
-                        counter += 1
-
-                        zone_obj = None
-                        _is_core = is_core(zone)
-
-                        # create node for adjacent zone
-                        G.add_node(zone.Name, epbunch=adj_zone, core=_is_core, zone=zone_obj)
-                        try:
-                            this_cstr = surface["Construction_Name"]
-                            their_cstr = adj_surf["Construction_Name"]
-                            is_diff_cstr = surface["Construction_Name"] != adj_surf["Construction_Name"]
-                        except Exception:
-                            this_cstr, their_cstr, is_diff_cstr = None, None, None
-                        # create edge from this zone to the adjacent zone
-                        G.add_edge(
-                            zone.Name,
-                            adj_zone.Name,
-                            this_cstr=this_cstr,
-                            their_cstr=their_cstr,
-                            is_diff_cstr=is_diff_cstr,
-                        )
-
-                        add_to_report(adj_report, zone, surface, adj_zone, adj_surf, counter)
-                    else:
-                        pass
-            if log_adj_report:
-                msg = f"Printing Adjacency Report for zone {zone.Name}\n"
+        for zone in tqdm(zones.values(), desc="zone_loop", position=idf.position, **kwargs):
+            zone_surfaces = surfaces.get(zone.Name.upper(), [])
+            nodes.append((zone.Name, {"epbunch": zone, "core": is_core(zone, zone_surfaces), "zone": None}))
+            adj_report = adj_reports[zone.Name] = defaultdict(list)
+
+            for surface in zone_surfaces:
+                # only surfaces facing another surface make an adjacency
+                if surface.key.upper() in ["INTERNALMASS", "WINDOWSHADINGCONTROL"] or (
+                    "Outside_Boundary_Condition" not in surface.objls
+                    or surface.Outside_Boundary_Condition.upper() != "SURFACE"
+                ):
+                    continue
+                adj_surf = surface_names.get(surface.Outside_Boundary_Condition_Object.upper())
+                adj_zone = zones.get(adj_surf.Zone_Name.upper()) if adj_surf is not None else None
+                if adj_zone is None:
+                    continue
+                counter += 1
+                try:
+                    this_cstr = surface["Construction_Name"]
+                    their_cstr = adj_surf["Construction_Name"]
+                    is_diff_cstr = this_cstr != their_cstr
+                except Exception:
+                    this_cstr, their_cstr, is_diff_cstr = None, None, None
+                # edge from this zone to the adjacent zone
+                edges.append(
+                    (
+                        zone.Name,
+                        adj_zone.Name,
+                        {"this_cstr": this_cstr, "their_cstr": their_cstr, "is_diff_cstr": is_diff_cstr},
+                    )
+                )
+                if log_adj_report:
+                    add_to_report(adj_report, zone, surface, adj_zone, adj_surf, counter)
+
+        G.add_nodes_from(nodes)
+        G.add_edges_from(edges)
+
+        if log_adj_report:
+            for name, adj_report in adj_reports.items():
+                msg = f"Printing Adjacency Report for zone {name}\n"
                 msg += tabulate.tabulate(adj_report, headers="keys")
                 log(msg)
 
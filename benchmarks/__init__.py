@@ -0,0 +1,20 @@
+"""archetypal benchmark suite.
+
+Times schedule parsing, SQL extraction, template creation, combine/reduce and
+JSON I/O on the fixtures in `tests/input_data`, without network access.
+Benchmarks that need a simulation are skipped when EnergyPlus is not installed.
+
+Usage::
+
+    python -m benchmarks                   # run, record in the history
+    python -m benchmarks --save-baseline   # run and store as the baseline
+    python -m benchmarks --compare         # run and flag regressions
+    python -m benchmarks -k sql            # only benchmarks matching "sql"
+
+Every run is appended to `benchmarks/.results/history.jsonl`.
+"""
+
+from benchmarks import bench_library, bench_schedules, bench_sql, bench_templates  # noqa: F401
+from benchmarks.harness import BENCHMARKS, benchmark, compare, run_benchmarks
+
+__all__ = ["BENCHMARKS", "benchmark", "compare", "run_benchmarks"]
@@ -0,0 +1,58 @@
+"""Command line interface of the benchmark suite."""
+
+import argparse
+import sys
+import warnings
+from pathlib import Path
+
+from benchmarks import compare, run_benchmarks
+from benchmarks.harness import RESULTS_DIR, append_history, load_baseline, save_baseline
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks whose name contains PATTERN")
+    parser.add_argument("--repeat", type=int, default=10, help="timed repeats of each benchmark (default: 10)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed calls before timing (default: 1)")
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR, help="where history and baseline are stored")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare this run against the baseline")
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level (default: 0.05)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="minimum relative slowdown (default: 0.1)")
+    args = parser.parse_args(argv)
+    # Warnings raised while timing would bury the results table.
+    warnings.simplefilter("ignore")
+
+    results = run_benchmarks(args.pattern, repeat=args.repeat, warmup=args.warmup)
+    record = append_history(results, args.results_dir / "history.jsonl")
+
+    comparison = {}
+    baseline_file = args.results_dir / "baseline.json"
+    if args.compare:
+        if not baseline_file.exists():
+            parser.error(f"no baseline at {baseline_file}; run with --save-baseline first")
+        comparison = compare(results, load_baseline(baseline_file), alpha=args.alpha, threshold=args.threshold)
+
+    width = max((len(name) for name in results), default=4)
+    print(f"{'name':<{width}}  {'median [s]':>11}  {'stdev [s]':>10}  {'ratio':>6}  {'p-value':>8}")
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<{width}}  skipped: {result['skipped']}")
+            continue
+        line = f"{name:<{width}}  {result['median']:>11.4f}  {result['stdev']:>10.4f}"
+        if name in comparison:
+            c = comparison[name]
+            line += f"  {c['ratio']:>6.2f}  {c['p_value']:>8.3f}"
+            if c["regression"]:
+                line += "  REGRESSION"
+        print(line)
+
+    if args.save_baseline:
+        save_baseline(record, baseline_file)
+        print(f"Saved baseline to {baseline_file}")
+
+    return 1 if any(c["regression"] for c in comparison.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""JSON I/O and combine/reduce benchmarks on an UMI template library."""
+
+import tempfile
+from pathlib import Path
+
+from archetypal import UmiTemplateLibrary
+from archetypal.template import ZoneDefinition
+from benchmarks.harness import DATA_DIR, benchmark
+
+LIBRARY = DATA_DIR / "umi_samples" / "BostonTemplateLibrary_2.json"
+
+
+def _library():
+    return UmiTemplateLibrary.open(LIBRARY)
+
+
+@benchmark("library.open")
+def open_library():
+    UmiTemplateLibrary.open(LIBRARY)
+
+
+@benchmark("library.to_json", setup=_library)
+def library_to_json(library):
+    with tempfile.TemporaryDirectory() as tmp:
+        library.to_json(Path(tmp) / "library.json")
+
+
+@benchmark("library.combine_zone_definitions", setup=_library)
+def combine_zone_definitions(library):
+    ZoneDefinition.combine_many(library.ZoneDefinitions)
@@ -0,0 +1,35 @@
+"""Schedule parsing and conversion benchmarks."""
+
+from archetypal import IDF, UmiTemplateLibrary
+from archetypal.schedule import Schedule
+from archetypal.template.schedule import UmiSchedule
+from benchmarks.harness import DATA_DIR, benchmark
+
+
+def _year_schedules():
+    library = UmiTemplateLibrary.open(DATA_DIR / "umi_samples" / "BostonTemplateLibrary_2.json")
+    return library.YearSchedules
+
+
+def _schedules_idf():
+    idf = IDF(DATA_DIR / "schedules" / "schedules.idf")
+    return [idf.schedules_dict[name] for name in sorted(idf.schedules_dict)]
+
+
+@benchmark("schedules.year_schedule_values", setup=_year_schedules)
+def year_schedule_values(year_schedules):
+    for schedule in year_schedules:
+        schedule._values = None  # values are cached on first access
+        schedule.all_values  # noqa: B018
+
+
+@benchmark("schedules.to_year_week_day", setup=_year_schedules)
+def to_year_week_day(year_schedules):
+    for schedule in year_schedules:
+        UmiSchedule.from_values(schedule.Name, Values=schedule.all_values).to_year_week_day()
+
+
+@benchmark("schedules.from_epbunch", setup=_schedules_idf, requires_energyplus=True)
+def schedules_from_epbunch(epbunches):
+    for epbunch in epbunches:
+        Schedule.from_epbunch(epbunch)
@@ -0,0 +1,123 @@
+"""SQL extraction benchmarks on annual EnergyPlus SQLite files.
+
+The file of a checked-in model is used when EnergyPlus is installed. There is no
+EnergyPlus output checked in with the test fixtures, so the ".synthetic"
+benchmarks read a generated file with the same schema instead: they run
+without EnergyPlus and their size (zones x variables x hours) is fixed.
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from archetypal import IDF
+from archetypal.idfclass import sql as sql_module
+from archetypal.idfclass.sql import Sql
+from archetypal.reportdata import ReportData
+from benchmarks.harness import DATA_DIR, benchmark
+
+N_ZONES = 20
+VARIABLES = (
+    "Zone Lights Total Heating Energy",
+    "Zone Electric Equipment Total Heating Energy",
+    "Zone People Total Heating Energy",
+    "Zone Mean Air Temperature",
+    "Zone Ideal Loads Supply Air Total Heating Energy",
+)
+
+
+def _simulated_sql_file():
+    """Simulate a checked-in model for a year with the VARIABLES reported hourly."""
+    idf = IDF(
+        DATA_DIR / "umi_samples" / "B_Off_0.idf",
+        epw=DATA_DIR / "CAN_PQ_Montreal.Intl.AP.716270_CWEC.epw",
+        annual=True,
+    )
+    idf.outputs.add_custom(
+        [
+            {"key": "OUTPUT:VARIABLE", "Variable_Name": variable, "Reporting_Frequency": "Hourly"}
+            for variable in VARIABLES
+        ]
+    ).apply()
+    return str(idf.simulate().sql_file)
+
+
+def _annual_sql_file():
+    """Write an hourly annual eplusout.sql with one series per zone and variable.
+
+    The schema is the subset of the EnergyPlus output tables read by
+    :class:`Sql` and :class:`ReportData`.
+    """
+    file_path = Path(tempfile.mkdtemp()) / "eplusout.sql"
+    days = np.repeat(np.arange(365), 24)
+    dates = np.datetime64("2018-01-01") + days
+    months = dates.astype("datetime64[M]").astype(int) % 12 + 1
+    month_days = (dates - dates.astype("datetime64[M]")).astype(int) + 1
+    hours = np.tile(np.arange(1, 25), 365)
+    times = [(i + 1, int(m), int(d), int(h)) for i, (m, d, h) in enumerate(zip(months, month_days, hours))]
+    series = [(zone, variable) for variable in VARIABLES for zone in range(1, N_ZONES + 1)]
+    rng = np.random.default_rng(0)
+    with sqlite3.connect(file_path) as conn:
+        conn.execute("CREATE TABLE EnvironmentPeriods (EnvironmentPeriodIndex INTEGER, EnvironmentType INTEGER)")
+        conn.execute("INSERT INTO EnvironmentPeriods VALUES (1, 3)")
+        conn.execute(
+            "CREATE TABLE Time (TimeIndex INTEGER PRIMARY KEY, Month INTEGER, Day INTEGER, Hour INTEGER, "
+            "Minute INTEGER, Dst INTEGER, Interval INTEGER, IntervalType INTEGER, SimulationDays INTEGER, "
+            "DayType TEXT, EnvironmentPeriodIndex INTEGER, WarmupFlag INTEGER)"
+        )
+        conn.executemany("INSERT INTO Time VALUES (?, ?, ?, ?, 0, 0, 60, 1, 1, 'Monday', 1, 0)", times)
+        conn.execute(
+            "CREATE TABLE ReportDataDictionary (ReportDataDictionaryIndex INTEGER PRIMARY KEY, IsMeter INTEGER, "
+            "Type TEXT, IndexGroup TEXT, TimestepType TEXT, KeyValue TEXT, Name TEXT, ReportingFrequency TEXT, "
+            "ScheduleName TEXT, Units TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO ReportDataDictionary VALUES (?, 0, 'Sum', 'Facility:Zone', 'Zone', ?, ?, 'Hourly', NULL, 'J')",
+            [(i, f"ZONE {zone}", variable) for i, (zone, variable) in enumerate(series, start=1)],
+        )
+        conn.execute(
+            "CREATE TABLE ReportData (ReportDataIndex INTEGER PRIMARY KEY, TimeIndex INTEGER, "
+            "ReportDataDictionaryIndex INTEGER, Value REAL)"
+        )
+        values = rng.random((len(times), len(series)))
+        conn.executemany(
+            "INSERT INTO ReportData VALUES (NULL, ?, ?, ?)",
+            (
+                (time_index, dictionary_index, float(values[time_index - 1, dictionary_index - 1]))
+                for time_index in range(1, len(times) + 1)
+                for dictionary_index in range(1, len(series) + 1)
+            ),
+        )
+        conn.execute("CREATE TABLE ReportExtendedData (ReportExtendedDataIndex INTEGER, ReportDataIndex INTEGER)")
+    return str(file_path)
+
+
+def _clear_caches():
+    """Drop the per-file caches so that each sample reads the file again."""
+    sql_module._read_time_index.cache_clear()
+    sql_module._read_zone_summary.cache_clear()
+    sql_module._read_nominal_loads.cache_clear()
+
+
+@benchmark("sql.timeseries_by_name", setup=_simulated_sql_file, requires_energyplus=True)
+def timeseries_by_name(file_path):
+    _clear_caches()
+    Sql(file_path).timeseries_by_name(list(VARIABLES), reporting_frequency="Hourly")
+
+
+@benchmark("sql.report_data", setup=_simulated_sql_file, requires_energyplus=True)
+def report_data(file_path):
+    _clear_caches()
+    ReportData.from_sqlite(file_path, table_name=list(VARIABLES), reporting_frequency="Hourly")
+
+
+@benchmark("sql.timeseries_by_name.synthetic", setup=_annual_sql_file)
+def timeseries_by_name_synthetic(file_path):
+    timeseries_by_name(file_path)
+
+
+@benchmark("sql.report_data.synthetic", setup=_annual_sql_file)
+def report_data_synthetic(file_path):
+    report_data(file_path)
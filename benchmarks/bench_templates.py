@@ -0,0 +1,32 @@
+"""Template creation benchmarks."""
+
+from archetypal import IDF
+from archetypal.template import BuildingTemplate
+from benchmarks.harness import DATA_DIR, benchmark
+
+MEDIUM_OFFICE = "necb/NECB 2011-MediumOffice-NECB HDD Method-CAN_PQ_Montreal.Intl.AP.716270_CWEC.epw.idf"
+
+
+def _simulated_idf(file="umi_samples/B_Off_0.idf"):
+    idf = IDF(DATA_DIR / file, epw=DATA_DIR / "CAN_PQ_Montreal.Intl.AP.716270_CWEC.epw")
+    return idf.simulate()
+
+
+def _simulated_medium_office():
+    return _simulated_idf(MEDIUM_OFFICE)
+
+
+@benchmark("templates.building_template_from_idf", setup=_simulated_idf, requires_energyplus=True)
+def building_template_from_idf(idf):
+    BuildingTemplate.from_idf(idf)
+
+
+# the medium office has 18 zones: compare the serial path with the pool of worker processes.
+@benchmark("templates.building_template_from_idf.serial", setup=_simulated_medium_office, requires_energyplus=True)
+def building_template_from_idf_serial(idf):
+    BuildingTemplate.from_idf(idf, processors=1)
+
+
+@benchmark("templates.building_template_from_idf.parallel", setup=_simulated_medium_office, requires_energyplus=True)
+def building_template_from_idf_parallel(idf):
+    BuildingTemplate.from_idf(idf, processors=-1)
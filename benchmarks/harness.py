@@ -0,0 +1,202 @@
+"""Benchmark registry, runner and regression tracking."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from scipy.stats import mannwhitneyu
+
+DATA_DIR = Path(__file__).parents[1] / "tests" / "input_data"
+RESULTS_DIR = Path(__file__).parent / ".results"
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+class Benchmark:
+    """A timed function with an optional untimed setup.
+
+    Args:
+        name (str): The unique name of the benchmark, e.g. "sql.timeseries_by_name".
+        func (callable): The timed function. Called with the value returned by
+            `setup`, if any.
+        setup (callable, optional): Called once before timing. Its return value is
+            passed to `func`.
+        requires_energyplus (bool): If True, the benchmark is skipped when
+            EnergyPlus is not installed.
+    """
+
+    def __init__(self, name, func, setup=None, requires_energyplus=False):
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.requires_energyplus = requires_energyplus
+
+    def run(self, repeat=10, warmup=1) -> list[float]:
+        """Time the benchmark and return the duration of each repeat [s]."""
+        args = () if self.setup is None else (self.setup(),)
+        for _ in range(warmup):
+            self.func(*args)
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            self.func(*args)
+            samples.append(time.perf_counter() - start)
+        return samples
+
+
+def benchmark(name: str, setup: Callable | None = None, requires_energyplus: bool = False):
+    """Register the decorated function as a benchmark.
+
+    Examples:
+        >>> @benchmark("library.open")
+        >>> def open_library():
+        >>>     UmiTemplateLibrary.open(DATA_DIR / "umi_samples/BostonTemplateLibrary_2.json")
+
+    Args:
+        name (str): The unique name of the benchmark.
+        setup (callable, optional): Called once before timing. Its return value is
+            passed to the decorated function.
+        requires_energyplus (bool): If True, the benchmark is skipped when
+            EnergyPlus is not installed.
+    """
+
+    def decorator(func):
+        if name in BENCHMARKS:
+            raise ValueError(f"A benchmark named '{name}' is already registered")
+        BENCHMARKS[name] = Benchmark(name, func, setup=setup, requires_energyplus=requires_energyplus)
+        return func
+
+    return decorator
+
+
+def energyplus_available() -> bool:
+    """Return True if the EnergyPlus version set in the settings is installed."""
+    from archetypal import EnergyPlusVersion
+    from archetypal.eplus_interface.exceptions import EnergyPlusVersionError
+
+    try:
+        return EnergyPlusVersion.current().current_install_dir.exists()
+    except EnergyPlusVersionError:
+        return False
+
+
+def run_benchmarks(pattern="", repeat=10, warmup=1) -> dict[str, dict]:
+    """Run the registered benchmarks whose name contains `pattern`.
+
+    Args:
+        pattern (str): Only run the benchmarks whose name contains this string.
+        repeat (int): The number of timed repeats of each benchmark.
+        warmup (int): The number of untimed calls before timing.
+
+    Returns:
+        dict: The result of each benchmark, keyed by name, with its timing
+        `samples` [s] and their `median`, `mean` and `stdev`. Skipped benchmarks
+        have a `skipped` reason instead.
+    """
+    has_energyplus = None
+    results = {}
+    for name, bench in sorted(BENCHMARKS.items()):
+        if pattern not in name:
+            continue
+        if bench.requires_energyplus:
+            if has_energyplus is None:
+                has_energyplus = energyplus_available()
+            if not has_energyplus:
+                results[name] = {"skipped": "EnergyPlus is not installed"}
+                continue
+        samples = bench.run(repeat=repeat, warmup=warmup)
+        results[name] = {
+            "samples": samples,
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+    return results
+
+
+def environment() -> dict:
+    """Return the machine and revision the benchmarks ran on."""
+    from archetypal import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "archetypal": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+    }
+
+
+def append_history(results: dict, history_file: Path) -> dict:
+    """Append a run to the JSON-lines history file and return the record."""
+    record = {**environment(), "results": results}
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def save_baseline(record: dict, baseline_file: Path):
+    """Store a run as the baseline that later runs are compared against."""
+    baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_file, "w") as f:
+        json.dump(record, f, indent=2)
+
+
+def load_baseline(baseline_file: Path) -> dict:
+    """Load the results of the stored baseline run."""
+    with open(baseline_file) as f:
+        return json.load(f)["results"]
+
+
+def compare(results: dict, baseline: dict, alpha=0.05, threshold=0.1) -> dict[str, dict]:
+    """Compare benchmark results against a baseline.
+
+    A benchmark is flagged as a regression if its samples are significantly
+    greater than the baseline samples (one-sided Mann-Whitney U test at level
+    `alpha`) *and* its median is more than `threshold` slower. The second
+    condition ignores changes that are significant but too small to matter.
+
+    Args:
+        results (dict): The results of :func:`run_benchmarks`.
+        baseline (dict): The results of the baseline run.
+        alpha (float): The significance level of the test.
+        threshold (float): The minimum relative slowdown of the median, e.g. 0.1
+            for 10 %.
+
+    Returns:
+        dict: For each benchmark present in both runs, the `ratio` of the medians
+        (current / baseline), the `p_value` of the test and whether it is a
+        `regression`.
+    """
+    comparison = {}
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if "samples" not in result or not reference or "samples" not in reference:
+            continue
+        ratio = result["median"] / reference["median"] if reference["median"] else float("inf")
+        p_value = mannwhitneyu(result["samples"], reference["samples"], alternative="greater").pvalue
+        comparison[name] = {
+            "ratio": ratio,
+            "p_value": float(p_value),
+            "regression": bool(p_value < alpha and ratio > 1 + threshold),
+        }
+    return comparison
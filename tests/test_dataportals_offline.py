@@ -0,0 +1,114 @@
+"""Tests of the dataportal requests, cache and harvester that run offline."""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from archetypal import dataportal, settings
+
+
+@pytest.fixture()
+def stub_server():
+    """A local HTTP server returning the requested path as JSON.
+
+    The first request to "/flaky" fails with a 503 to exercise the retries.
+    """
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            if self.path == "/flaky" and hits.count("/flaky") == 1:
+                self.send_response(503)
+                self.end_headers()
+                return
+            body = json.dumps({"path": self.path}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_many(stub_server, tmp_path, monkeypatch):
+    """Test responses are fetched concurrently, retried and then read from the cache."""
+    monkeypatch.setattr(settings, "cache_folder", tmp_path)
+    monkeypatch.setattr(settings, "cache_responses", True)
+    base_url, hits = stub_server
+    urls = [f"{base_url}/{i}" for i in range(20)] + [f"{base_url}/flaky"]
+
+    responses = dataportal.fetch_many(urls, max_workers=4)
+    assert [r["path"] for r in responses] == [f"/{i}" for i in range(20)] + ["/flaky"]
+    assert hits.count("/flaky") == 2
+
+    # the second time, all responses come from the single SQLite cache.
+    n_hits = len(hits)
+    assert dataportal.fetch_many(urls) == responses
+    assert len(hits) == n_hits
+    assert dataportal.get_from_cache(urls[0]) == {"path": "/0"}
+    assert list(tmp_path.iterdir()) == [tmp_path / "responses.sqlite"]
+
+
+def test_response_cache(tmp_path):
+    """Test the expiry and size cap of the response cache."""
+    cache = dataportal.ResponseCache(tmp_path / "responses.sqlite", max_size=110)
+    cache.set_many({f"url{i}": {"value": "x" * i} for i in range(3)})
+    assert cache.get("url1") == {"value": "x"}
+
+    # the total compressed size exceeds the cap: the oldest responses are evicted.
+    cache.set("large", {"value": hashlib.sha256(b"large").hexdigest() * 2})
+    assert set(cache.get_many(["url0", "url1", "url2", "large"])) == {"url2", "large"}
+
+    assert dataportal.ResponseCache(cache.path, expire_after=-1).get("url2") is None
+
+
+def test_harvest_tabula(tmp_path, monkeypatch):
+    """Test the typology is harvested once and then served locally."""
+    requested = []
+
+    def fake_fetch_many(urls, max_workers=8, timeout=60):
+        responses = []
+        for url in urls:
+            requested.append(url)
+            if "/matrix/building/" in url:
+                buildings = [
+                    {"code_buildingtype_column1": "FR.N.SFH.01.Gen", "suffix_building_column1": "ReEx.001"},
+                    {"code_buildingtype_column1": "FR.N.AB.02.Gen", "suffix_building_column1": "ReEx.001"},
+                ]
+                responses.append({"data": buildings, "success": True})
+            elif "/building/detail/" in url:
+                code = url.split("/detail/")[1].split("/")[0] + "." + url.split("/bv/")[1].split("/")[0]
+                responses.append({"data": [{"label": "<b>Code</b>", "val": code}], "success": True})
+            else:
+                responses.append({"data": {"system": url}})
+        return responses
+
+    monkeypatch.setattr(dataportal, "fetch_many", fake_fetch_many)
+    monkeypatch.setattr(settings, "data_folder", tmp_path)
+
+    store = dataportal.harvest_tabula(countries=["France"], variants=(1, 2))
+    # 1 country + 2 building types x 2 variants + 2 boundary conditions x 2 variants
+    assert len(requested) == 9
+    dataportal.harvest_tabula(countries=["France"], variants=(1, 2))
+    assert len(requested) == 9
+
+    assert store.tabula_available_buildings("France").shape == (2, 2)
+    # the module functions are served from the local database
+    sheet = dataportal.tabula_building_details_sheet(code_building="FR.N.AB.02.Gen.ReEx.001.002")
+    assert sheet["val"][0] == "FR.N.AB.02.Gen.ReEx.001.002"
+    assert sheet["label"][0] == " Code "
+    assert not dataportal.tabula_system("FR", "MUH", 2).empty
+    assert len(requested) == 9
@@ -0,0 +1,40 @@
+"""Tests of the EndUseBalance computations that do not need a simulation."""
+
+import numpy as np
+import pandas as pd
+from energy_pandas import EnergyDataFrame
+
+from archetypal.idfclass.end_use_balance import EndUseBalance
+
+
+def test_separate_gains_and_losses():
+    """Test gains and losses are split by period and aggregated over time."""
+    index = pd.date_range("2018-01-01", periods=24 * 59, freq="h")
+    rng = np.random.default_rng(0)
+    columns = pd.MultiIndex.from_product(
+        [["Surface"], ["ZONE 2", "ZONE 1"], ["Lights"]], names=["IndexGroup", "KeyValue", "Name"]
+    )
+    lighting = EnergyDataFrame(rng.normal(size=(len(index), 2)), index=index, columns=columns)
+    is_heating = pd.DataFrame({"ZONE 1": index.month == 1, "ZONE 2": index.day % 2 == 0}, index=index).rename_axis(
+        "KeyValue", axis=1
+    )
+    eu = EndUseBalance(
+        *[None] * 3,
+        lighting,
+        *[None] * 14,
+        is_cooling=~is_heating,
+        is_heating=is_heating,
+    )
+
+    separated = eu.separate_gains_and_losses("lighting", "KeyValue")
+    assert separated.columns.names == ["IndexGroup", "KeyValue", "Name", "Period", "Gain/Loss"]
+    assert separated.columns.is_monotonic_increasing
+    zone_1 = separated.xs("ZONE 1", level="KeyValue", axis=1).droplevel(["IndexGroup", "Name"], axis=1)
+    heating = lighting.xs("ZONE 1", level="KeyValue", axis=1).iloc[:, 0].where(is_heating["ZONE 1"], 0)
+    np.testing.assert_allclose(zone_1["Heating Periods", "Heat Gain"], heating.clip(lower=0))
+    np.testing.assert_allclose(zone_1["Heating Periods", "Heat Loss"], heating.clip(upper=0))
+    np.testing.assert_allclose(separated.sum(axis=1), lighting.sum(axis=1))
+
+    monthly = eu.separate_gains_and_losses("lighting", "KeyValue", freq="M")
+    assert len(monthly) == 2
+    np.testing.assert_allclose(monthly.values, separated.groupby(index.month).sum().values)
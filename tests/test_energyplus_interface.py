@@ -1,8 +1,15 @@
+import io
+import logging
+
 import pytest
 from path import Path
 
+from archetypal.eplus_interface.basement import BasementThread
 from archetypal.eplus_interface.energy_plus import EnergyPlusExe, EnergyPlusProgram
 from archetypal.eplus_interface.exceptions import EnergyPlusVersionError
+from archetypal.eplus_interface.ground_heat_transfer import GroundHeatTransferCache, ght_digest
+from archetypal.eplus_interface.output import OutputConsumer, log_tail
+from archetypal.eplus_interface.staging import publish_dir, stage_file
 from archetypal.eplus_interface.version import EnergyPlusVersion
 
 
@@ -37,3 +44,94 @@ def test_energyplus_program_home(tmp_path):
     idf = type("IDF", (), {"file_version": version})()
     program = EnergyPlusProgram(idf)
     assert program.eplus_home == Path(tmp_path)
+
+
+def test_ground_heat_transfer_cache(tmp_path, mocker):
+    ghtin = Path(tmp_path / "BasementGHTIn.idf")
+    ghtin.write_text("GroundHeatTransfer:Control, Yes, No;")
+    epw = Path(tmp_path / "in.epw")
+    epw.write_text("LOCATION,Montreal")
+    version = EnergyPlusVersion("9.2.0")
+    digest = ght_digest("Basement", version, [ghtin], epw)
+    assert digest != ght_digest("Slab", version, [ghtin], epw)
+
+    cache = GroundHeatTransferCache(tmp_path / "cache")
+    assert cache.get(digest) is None
+    cache.set(digest, "SurfaceProperty:OtherSideCoefficients, Wall;")
+    assert cache.get(digest) == "SurfaceProperty:OtherSideCoefficients, Wall;"
+
+    # The weather file is part of the key.
+    epw.write_text("LOCATION,Boston")
+    assert cache.get(ght_digest("Basement", version, [ghtin], epw)) is None
+
+    # On a hit, the objects are added without running the Basement program.
+    mocker.patch("archetypal.eplus_interface.basement._ght_cache", return_value=cache)
+    add_ep_objects = mocker.patch.object(BasementThread, "add_ep_objects")
+    cache.set(ght_digest("Basement", version, [ghtin], epw), "Boston objects")
+    idf = type(
+        "IDF",
+        (),
+        {"name": "in.idf", "include": [ghtin], "epw": epw, "file_version": version, "output_directory": tmp_path},
+    )()
+    thread = BasementThread(idf, tmp_path)
+    thread.run()
+    add_ep_objects.assert_called_once_with("Boston objects")
+    assert not hasattr(thread, "p")
+
+
+def test_staging(tmp_path):
+    epw = Path(tmp_path / "in.epw")
+    epw.write_text("LOCATION,Montreal")
+    run_dir = Path(tmp_path / "eplus_run").mkdir()
+
+    staged = stage_file(epw, run_dir)
+    assert staged == run_dir / "in.epw"
+    assert staged.read_text() == "LOCATION,Montreal"
+    # staging twice replaces the previous file.
+    assert stage_file(epw, run_dir).read_text() == "LOCATION,Montreal"
+
+    (run_dir / "eplusout.sql").write_text("results")
+    save_dir = Path(tmp_path / "simulation").mkdir()
+    (save_dir / "old.sql").write_text("old results")
+    assert publish_dir(run_dir, save_dir) == save_dir
+    assert not run_dir.exists()
+    assert sorted(f.basename() for f in save_dir.files()) == ["eplusout.sql", "in.epw"]
+    assert epw.read_text() == "LOCATION,Montreal"
+
+
+def test_output_consumer(tmp_path, mocker):
+    stdout = b"".join(
+        [
+            b"EnergyPlus Starting\n",
+            b" Warming up {1}\n" * 6,
+            b" Starting Simulation at 01/01 for RUN PERIOD 1\n",
+            b" Continuing Simulation at 02/01 for RUN PERIOD 1\n" * 3,
+            b"EnergyPlus Completed Successfully.",
+        ]
+    )
+    msg_callback = mocker.Mock()
+    consumer = OutputConsumer(io.BufferedReader(io.BytesIO(stdout)), Path(tmp_path / "eplusout.stdout"), msg_callback)
+    state = consumer.consume()
+    assert (state.lines, state.environment, state.date, state.completed) == (12, "RUN PERIOD 1", "02/01", True)
+    assert state.warmup_days == 6
+    # the full output is kept but only the summary lines are logged.
+    assert Path(tmp_path / "eplusout.stdout").read_bytes() == stdout
+    logged = [call.args[0] for call in msg_callback.call_args_list if call.kwargs["level"] == logging.INFO]
+    assert logged == [
+        "EnergyPlus Starting",
+        "Starting Simulation at 01/01 for RUN PERIOD 1",
+        "EnergyPlus Completed Successfully.",
+    ]
+
+
+def test_log_tail(tmp_path, mocker):
+    # the other programs print none of the EnergyPlus markers; their errors are in the last lines.
+    stdout = b"".join([b" Calculating day %d\n" % day for day in range(100)] + [b" Error: could not open input file\n"])
+    msg_callback = mocker.Mock()
+    consumer = OutputConsumer(io.BufferedReader(io.BytesIO(stdout)), Path(tmp_path / "Slab.stdout"), msg_callback)
+    consumer.consume()
+    assert not [call for call in msg_callback.call_args_list if call.kwargs["level"] >= logging.INFO]
+    log_tail(Path(tmp_path / "Slab.stdout"), msg_callback, lines=2)
+    message = msg_callback.call_args.args[0]
+    assert msg_callback.call_args.kwargs["level"] == logging.ERROR
+    assert message.splitlines()[1:] == [" Calculating day 99", " Error: could not open input file"]
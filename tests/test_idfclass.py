@@ -9,6 +9,7 @@ from archetypal.eplus_interface import (
     InvalidEnergyPlusVersion,
 )
 from archetypal.eplus_interface.version import EnergyPlusVersion
+from archetypal.idfclass.geometry import SurfaceGeometry
 from archetypal.idfclass.idf import SimulationNotRunError
 from archetypal.utils import parallel_process
 
@@ -324,6 +325,102 @@ class TestIDF:
         # Assert has been added to model
         assert shoebox_model.getobject("BUILDING", "Building")
 
+    def test_addidfobjects_from_string(self, shoebox_model):
+        """Test the bulk ingest of generated objects replaces objects of the same name."""
+        ep_objects = """
+        ! Basement-generated objects
+        SurfaceProperty:OtherSideCoefficients,
+            SurfPropOthSdCoefBasementAvgWall, !- Name
+            0.0,                      !- Combined Convective/Radiative Film Coefficient
+            1,                        !- Constant Temperature {C}
+            1;                        !- Constant Temperature Coefficient
+        SurfaceProperty:OtherSideCoefficients,
+            SurfPropOthSdCoefBasementAvgWall, !- Name
+            0.0,                      !- Combined Convective/Radiative Film Coefficient
+            12.5,                     !- Constant Temperature {C}
+            1;                        !- Constant Temperature Coefficient
+        Site:GroundTemperature:BuildingSurface,
+            18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18;
+        """
+        n_objects = len(shoebox_model.idfobjects["SURFACEPROPERTY:OTHERSIDECOEFFICIENTS"])
+        added_objects = shoebox_model.addidfobjects_from_string(ep_objects)
+        assert len(added_objects) == 2
+        assert len(shoebox_model.idfobjects["SURFACEPROPERTY:OTHERSIDECOEFFICIENTS"]) == n_objects + 1
+        surface_property = shoebox_model.getobject(
+            "SURFACEPROPERTY:OTHERSIDECOEFFICIENTS", "SurfPropOthSdCoefBasementAvgWall"
+        )
+        assert surface_property.Constant_Temperature == 12.5
+        assert len(shoebox_model.idfobjects["SITE:GROUNDTEMPERATURE:BUILDINGSURFACE"]) == 1
+
+    def test_addidfobjects_from_string_existing(self, shoebox_model):
+        """Test objects equal to objects of the model are kept in place instead of being added again."""
+        zone = shoebox_model.idfobjects["ZONE"][0]
+        timestep = shoebox_model.idfobjects["TIMESTEP"][0]
+        n_variables = len(shoebox_model.idfobjects["OUTPUT:VARIABLE"])
+        ep_objects = f"""
+        {zone!r}
+        {timestep!r}
+        Output:Variable, *, Site Outdoor Air Drybulb Temperature, hourly;
+        Output:Variable, *, Site Outdoor Air Drybulb Temperature, Hourly;
+        """
+        added_objects = shoebox_model.addidfobjects_from_string(ep_objects)
+        assert added_objects[:2] == [zone, timestep]
+        assert shoebox_model.idfobjects["ZONE"][0] is zone
+        assert shoebox_model.idfobjects["TIMESTEP"][0] is timestep
+        assert len(shoebox_model.idfobjects["OUTPUT:VARIABLE"]) == n_variables + 1
+
+        # the unnamed objects are not added twice and a unique object is replaced.
+        added_objects = shoebox_model.addidfobjects_from_string(ep_objects.replace(repr(timestep), "Timestep, 60;"))
+        assert len(shoebox_model.idfobjects["OUTPUT:VARIABLE"]) == n_variables + 1
+        assert list(shoebox_model.idfobjects["TIMESTEP"]) == [added_objects[1]]
+        assert shoebox_model.idfobjects["TIMESTEP"][0].Number_of_Timesteps_per_Hour == 60
+
+    def test_update_from_idf_string(self, shoebox_model):
+        """Test the model is updated in place to the objects that differ."""
+        zone = shoebox_model.idfobjects["ZONE"][0]
+        building = shoebox_model.idfobjects["BUILDING"][0]
+        expanded = shoebox_model.idfstr().replace(repr(building), "")
+        expanded += "\nBuilding, Expanded Building;\nSchedule:Constant, AlwaysOn, , 1;\n"
+
+        removed, added = shoebox_model.update_from_idf_string(expanded)
+        assert removed == [building]
+        assert [obj.Name for obj in added] == ["Expanded Building", "AlwaysOn"]
+        assert shoebox_model.idfobjects["ZONE"][0] is zone
+        assert shoebox_model.idfobjects["BUILDING"][0].Name == "Expanded Building"
+        assert shoebox_model.update_from_idf_string(shoebox_model.idfstr()) == ([], [])
+
+    def test_request_outputs(self, shoebox_model, mocker):
+        """Test missing outputs are added in one go with a single simulation."""
+        simulate = mocker.patch.object(IDF, "simulate")
+        variables = ["Zone Mean Air Temperature", "Zone Air Relative Humidity"]
+        meters = ["Electricity:Facility", "Electricity:Facility"]
+
+        added = shoebox_model.request_outputs(variables=variables, meters=meters)
+        assert [obj.key.upper() for obj in added] == ["OUTPUT:VARIABLE"] * 2 + ["OUTPUT:METER"]
+        assert simulate.call_count == 1
+
+        # Outputs already in the model do not trigger a simulation.
+        assert shoebox_model.request_outputs(variables=variables, meters=meters) == []
+        assert simulate.call_count == 1
+
+    def test_surface_geometry(self, shoebox_model):
+        """Test that the geometry table matches the per-surface geometry."""
+        geometry = SurfaceGeometry.from_idf(shoebox_model)
+        surfaces = shoebox_model.getsurfaces() + shoebox_model.getsubsurfaces()
+        assert len(geometry) == len(surfaces)
+        for row, surface in enumerate(geometry.objects):
+            assert geometry.area[row] == pytest.approx(surface.area)
+            assert geometry.tilt[row] == pytest.approx(surface.tilt, abs=1e-6)
+            assert geometry.azimuth[row] % 360 == pytest.approx(surface.azimuth % 360, abs=1e-6)
+        for row, subsurfaces in geometry.subsurfaces.items():
+            wall = geometry.objects[row]
+            assert {geometry.objects[sub].Name for sub in subsurfaces} == {ss.Name for ss in wall.subsurfaces}
+
+    def test_set_wwr(self, shoebox_model):
+        shoebox_model.set_wwr(0.4, force=True)
+        wwr = shoebox_model.wwr(round_to=None)
+        assert wwr.loc[wwr.wall_area > 0, "wwr"].tolist() == pytest.approx([0.4] * (wwr.wall_area > 0).sum())
+
 
 class TestIDFTransition:
     def test_transition(self, tmp_path):
@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+
+import archetypal
+
+# Wall time allowed for `import archetypal` in a fresh interpreter [s].
+IMPORT_TIME_BUDGET = 1.0
+
+# Dependencies that must only be imported on first use.
+HEAVY_MODULES = (
+    "CoolProp",
+    "energy_pandas",
+    "eppy",
+    "geomeppy",
+    "matplotlib",
+    "networkx",
+    "numpy",
+    "pandas",
+    "scipy",
+    "sklearn",
+    "tabulate",
+)
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import archetypal
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted({m.split(".")[0] for m in sys.modules})}))
+"""
+
+
+def _import_archetypal():
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _SCRIPT], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """Test `import archetypal` defers the heavy dependencies."""
+    modules = _import_archetypal()["modules"]
+    assert not set(HEAVY_MODULES) & set(modules)
+
+
+def test_import_time_budget():
+    """Test `import archetypal` stays within its import-time budget."""
+    # The best of a few runs is robust to a busy machine.
+    elapsed = min(_import_archetypal()["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_TIME_BUDGET, f"import archetypal took {elapsed:.2f} s"
+
+
+def test_lazy_attributes():
+    """Test public objects are still reachable from the package."""
+    from archetypal.idfclass import IDF
+
+    assert archetypal.IDF is IDF
+    assert "UmiTemplateLibrary" in dir(archetypal)
+    assert archetypal.settings.unit_registry("degC").units == "degree_Celsius"
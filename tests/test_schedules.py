@@ -106,6 +106,38 @@ class TestSchedule:
         # assert the full load hours (sum) has not changed.
         assert new == pytest.approx(orig)
 
+    def test_to_year_week_day(self):
+        """Test the decomposition into unique days, unique weeks and year parts."""
+        workday, weekend = [0.0] * 8 + [1.0] * 10 + [0.0] * 6, [0.0] * 24
+        week = workday * 5 + weekend * 2
+        values = week * 20 + [0.5] * 24 * 7 * 10 + week * 22 + workday
+        sch = Schedule.from_values("Office", values)
+
+        year, weeks, days = sch.to_year_week_day()
+        assert [d.Name for d in days] == ["d_Office_00", "d_Office_01", "d_Office_02"]
+        # days and weeks are sorted by value
+        assert [d.all_values[8] for d in days] == [0.0, 1.0, 0.5]
+        assert [[d.Name[-2:] for d in w.Days] for w in weeks] == [["01"] * 5 + ["00"] * 2, ["02"] * 7]
+        parts = [(p.FromMonth, p.FromDay, p.ToMonth, p.ToDay, p.Schedule.Name) for p in year.Parts]
+        assert parts == [
+            (1, 1, 5, 20, "w_Office_00"),
+            (5, 21, 7, 29, "w_Office_01"),
+            (7, 30, 12, 31, "w_Office_00"),
+        ]
+        np.testing.assert_array_equal(year.all_values[:8736], values[:8736])
+
+    def test_to_year_week_day_many(self):
+        """Test the batch decomposition shares identical days between schedules."""
+        a = Schedule.from_values("A", [1.0] * 24 * 364 + [0.0] * 24)
+        b = Schedule.from_values("B", [0.0] * 24 * 7 + [1.0] * 24 * 358)
+
+        (year_a, weeks_a, days_a), (year_b, weeks_b, days_b) = Schedule.to_year_week_day_many([a, b])
+        assert days_b == days_a
+        assert days_b[0] is days_a[0]
+        assert [d.Name for d in days_b] == ["d_A_00", "d_A_01"]
+        assert [w.Name for w in weeks_b] == ["w_B_00", "w_B_01"]
+        assert len(year_b.Parts) == 2
+
 
 idf_file = data_dir / "schedules/test_multizone_EP.idf"
 
@@ -0,0 +1,230 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from archetypal.idfclass.sql import Sql, TimeIndex, nominal_loads
+from archetypal.reportdata import ReportData
+
+
+@pytest.fixture(scope="module")
+def sql_file(tmp_path_factory):
+    """A minimal EnergyPlus SQLite file with a design day and a weather run period."""
+    file_path = tmp_path_factory.mktemp("sql") / "eplusout.sql"
+    times = [
+        # (Month, Day, Hour, Minute, Interval, IntervalType, EnvironmentPeriodIndex, WarmupFlag)
+        *[(7, 21, h, 0, 60, 1, 1, 0) for h in range(1, 25)],
+        *[(1, 1, h, 0, 60, 1, 2, 1) for h in range(1, 25)],  # warmup
+        *[(1, 1 + (h - 1) // 24, (h - 1) % 24 + 1, 0, 60, 1, 2, 0) for h in range(1, 49)],
+        (1, 1, 24, 0, 1440, 2, 2, 0),
+        (1, 2, 24, 0, 1440, 2, 2, 0),
+    ]
+    with sqlite3.connect(file_path) as conn:
+        conn.execute("CREATE TABLE EnvironmentPeriods (EnvironmentPeriodIndex INTEGER, EnvironmentType INTEGER)")
+        conn.executemany("INSERT INTO EnvironmentPeriods VALUES (?, ?)", [(1, 1), (2, 3)])
+        conn.execute(
+            "CREATE TABLE Time (TimeIndex INTEGER PRIMARY KEY, Month INTEGER, Day INTEGER, Hour INTEGER, "
+            "Minute INTEGER, Dst INTEGER, Interval INTEGER, IntervalType INTEGER, SimulationDays INTEGER, "
+            "DayType TEXT, EnvironmentPeriodIndex INTEGER, WarmupFlag INTEGER)"
+        )
+        conn.executemany(
+            "INSERT INTO Time VALUES (?, ?, ?, ?, ?, 0, ?, ?, 1, 'Monday', ?, ?)",
+            [(i + 1, *t) for i, t in enumerate(times)],
+        )
+        conn.execute(
+            "CREATE TABLE ReportDataDictionary (ReportDataDictionaryIndex INTEGER PRIMARY KEY, IsMeter INTEGER, "
+            "Type TEXT, IndexGroup TEXT, TimestepType TEXT, KeyValue TEXT, Name TEXT, ReportingFrequency TEXT, "
+            "ScheduleName TEXT, Units TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO ReportDataDictionary VALUES (?, 0, 'Sum', 'Facility:Zone', 'Zone', ?, ?, ?, NULL, 'J')",
+            [
+                (1, "ZONE 2", "Zone Lights Total Heating Energy", "Hourly"),
+                (2, "ZONE 1", "Zone Lights Total Heating Energy", "Hourly"),
+                (3, "ZONE 1", "Zone Lights Total Heating Energy", "Daily"),
+            ],
+        )
+        conn.execute(
+            "CREATE TABLE ReportData (ReportDataIndex INTEGER PRIMARY KEY, TimeIndex INTEGER, "
+            "ReportDataDictionaryIndex INTEGER, Value REAL)"
+        )
+        rows = []
+        for time_index, t in enumerate(times, start=1):
+            dictionary_indices = (1, 2) if t[5] == 1 else (3,)
+            rows += [(None, time_index, d, float(time_index * 10 + d)) for d in dictionary_indices]
+        conn.executemany("INSERT INTO ReportData VALUES (?, ?, ?, ?)", rows)
+        conn.execute("CREATE TABLE ReportExtendedData (ReportExtendedDataIndex INTEGER, ReportDataIndex INTEGER)")
+        conn.execute("CREATE TABLE Zones (ZoneIndex INTEGER PRIMARY KEY, ZoneName TEXT)")
+        conn.executemany("INSERT INTO Zones VALUES (?, ?)", [(1, "ZONE 1"), (2, "ZONE 2")])
+        conn.execute("CREATE TABLE Schedules (ScheduleIndex INTEGER PRIMARY KEY, ScheduleName TEXT)")
+        conn.executemany("INSERT INTO Schedules VALUES (?, ?)", [(1, "ALWAYS ON"), (2, "OFFICE OCCUPANCY")])
+        for table in ("NominalElectricEquipment", "NominalGasEquipment", "NominalLighting"):
+            conn.execute(f"CREATE TABLE {table} (ZoneIndex INTEGER, ScheduleIndex INTEGER, DesignLevel REAL)")
+        conn.executemany("INSERT INTO NominalLighting VALUES (?, ?, ?)", [(1, 1, 100.0), (2, 1, 50.0), (1, 2, 25.0)])
+        conn.execute(
+            "CREATE TABLE NominalPeople (ZoneIndex INTEGER, NumberOfPeopleScheduleIndex INTEGER, NumberOfPeople REAL)"
+        )
+        conn.execute("INSERT INTO NominalPeople VALUES (1, 2, 5.0)")
+        conn.execute(
+            "CREATE TABLE TabularDataWithStrings (TabularDataIndex INTEGER PRIMARY KEY, TableName TEXT, "
+            "RowName TEXT, ColumnName TEXT, Value TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO TabularDataWithStrings VALUES (NULL, ?, ?, ?, ?)",
+            [
+                *[
+                    ("Zone Summary", zone, column, value)
+                    for zone, area, conditioned in (("ZONE 1", "100.00", "Yes"), ("ZONE 2", "50.00", "No"))
+                    for column, value in (
+                        ("Area", area),
+                        ("Volume", "300.00"),
+                        ("Conditioned (Y/N)", conditioned),
+                        ("Part of Total Floor Area (Y/N)", "Yes"),
+                        ("Multipliers", "2.00"),
+                    )
+                ],
+                ("Average Outdoor Air During Occupied Hours", "ZONE 1", "Nominal Number of Occupants", "5.00"),
+            ],
+        )
+    return str(file_path)
+
+
+def test_time_index_is_shared(sql_file):
+    """Test the Time table is read once per file and gives a vectorized index."""
+    time_index = TimeIndex.from_sqlite(sql_file)
+    assert TimeIndex.from_sqlite(sql_file) is time_index
+    positions, index = time_index.axis(3, ["Hourly"])
+    assert len(positions) == 48
+    assert index[0] == pd.Timestamp("2018-01-01 00:00")
+    assert index.freqstr == "h"
+
+
+def test_timeseries_by_name(sql_file):
+    """Test timeseries are placed on the time axis of their environment."""
+    sql = Sql(sql_file)
+    data = sql.timeseries_by_name("Zone Lights Total Heating Energy")
+    assert data.shape == (48, 2)
+    assert data.columns.get_level_values("KeyValue").tolist() == ["ZONE 1", "ZONE 2"]
+    # TimeIndex 49 is the first hour of the weather run period after warmup.
+    np.testing.assert_array_equal(data["Facility:Zone", "ZONE 1"].iloc[:2, 0], [492.0, 502.0])
+
+    design_day = sql.timeseries_by_name("Zone Lights Total Heating Energy", environment_type=1)
+    assert design_day.index[0] == pd.Timestamp("2018-07-21 00:00")
+
+    daily = sql.timeseries_by_name("Zone Lights Total Heating Energy", reporting_frequency="Daily")
+    assert daily.shape == (2, 1)
+
+
+def test_report_data_from_sqlite(sql_file):
+    """Test ReportData gets its time columns from the shared time index."""
+    report = ReportData.from_sqlite(
+        sql_file, table_name="Zone Lights Total Heating Energy", reporting_frequency="Hourly"
+    )
+    assert list(report.columns) == list(ReportData._COLUMNS)
+    assert len(report) == 96
+    assert (report["WarmupFlag"] == 0).all()
+    assert (report["EnvironmentType"] == 3).all()
+    row = report.set_index("ReportDataIndex").sort_index().iloc[0]
+    assert (row["Month"], row["Day"], row["Hour"]) == (1, 1, 1)
+
+    design_day = ReportData.from_sqlite(sql_file, table_name="Zone Lights Total Heating Energy", environment_type=1)
+    assert len(design_day) > 0
+    assert (design_day["EnvironmentType"] == 1).all()
+    assert (design_day["WarmupFlag"] == 0).all()
+
+
+def test_zone_summary(sql_file):
+    """Test all zones are summarized in one pass."""
+    summary = Sql(sql_file).zone_summary
+    assert summary.loc["ZONE 1"].to_dict() == {
+        "area": 100.0,
+        "volume": 300.0,
+        "occupants": 5.0,
+        "is_part_of_conditioned_floor_area": True,
+        "is_part_of_total_floor_area": True,
+        "multiplier": 2,
+    }
+    assert summary.loc["ZONE 2", "occupants"] == 0
+    assert not summary.loc["ZONE 2", "is_part_of_conditioned_floor_area"]
+
+    # the cached summary is shared by the zones read from the same file.
+    assert Sql(sql_file).zone_summary is summary
+
+
+def test_nominal_loads(sql_file):
+    """Test the nominal loads of all zones are split by zone with their schedule names."""
+    loads = nominal_loads(sql_file)
+    assert nominal_loads(sql_file) is loads
+    assert loads["NominalLighting"]["ZONE 1"]["ScheduleName"].tolist() == ["ALWAYS ON", "OFFICE OCCUPANCY"]
+    assert loads["NominalLighting"]["ZONE 2"]["DesignLevel"].tolist() == [50.0]
+    assert loads["NominalPeople"]["ZONE 1"]["ScheduleName"].tolist() == ["OFFICE OCCUPANCY"]
+    assert "ZONE 2" not in loads["NominalPeople"]
+    assert loads["NominalGasEquipment"] == {}
+
+
+def test_read_variables(sql_file):
+    """Test several variables are read in one pass, keyed by KeyValue."""
+    from archetypal.idfclass.variables import _read_variables
+
+    series = _read_variables(sql_file, {"Zone Lights Total Heating Energy", "Missing"}, "Hourly", 3)
+    assert list(series) == ["Zone Lights Total Heating Energy"]
+    data, units = series["Zone Lights Total Heating Energy"]
+    assert units == "J"
+    assert data.shape == (48, 2)
+    assert data.columns.tolist() == ["ZONE 1", "ZONE 2"]
+    assert data.index[0] == pd.Timestamp("2018-01-01 00:00")
+    np.testing.assert_array_equal(data["ZONE 1"].iloc[:2], [492.0, 502.0])
+
+    design_day, _ = _read_variables(sql_file, {"Zone Lights Total Heating Energy"}, "Hourly", 1)[
+        "Zone Lights Total Heating Energy"
+    ]
+    assert design_day.index[0] == pd.Timestamp("2018-07-21 00:00")
+
+
+def test_collect_groups_units(sql_file):
+    """Test the groups are converted to the units asked by the caller."""
+    from types import SimpleNamespace
+
+    from archetypal.idfclass.variables import VariableGroup
+
+    idf = SimpleNamespace(sql_file=sql_file, design_day=False, annual=True, _add_missing_outputs=lambda objects: None)
+    group = VariableGroup(idf, {})
+    variable = SimpleNamespace(
+        _epobject=SimpleNamespace(Variable_Name="Zone Lights Total Heating Energy", Reporting_Frequency="hourly")
+    )
+    group._properties["Zone_Lights_Total_Heating_Energy"] = variable
+
+    groups = {"lights": ["Zone Lights Total Heating Energy"]}
+    joules = group.collect_groups(groups)["lights"]
+    assert joules.iloc[0, 0] == 492.0
+
+    kwh = group.collect_groups(groups, units="kWh")["lights"]
+    assert kwh.iloc[0, 0] == pytest.approx(492.0 / 3.6e6)
+
+
+def test_filter_report_data(sql_file):
+    """Test keyword filters are resolved with the column indexes."""
+    report = ReportData.from_sqlite(
+        sql_file, table_name="Zone Lights Total Heating Energy", reporting_frequency="Hourly"
+    )
+    filtered = report.filter_report_data(keyvalue="ZONE 1", timeindex=(49, 50))
+    assert isinstance(filtered, ReportData)
+    assert filtered["Value"].tolist() == [492.0, 502.0]
+    assert report.filter_report_data(keyvalue=("ZONE 1", "ZONE 2")).shape == report.shape
+    assert report.filter_report_data(name="Missing").empty
+
+    # assigning a column drops its index.
+    report["KeyValue"] = "ZONE 3"
+    assert len(report.filter_report_data(keyvalue="ZONE 3")) == len(report)
+
+    # changing values in place rebuilds the index of the column.
+    report.loc[report.index[0], "KeyValue"] = "ZONE 4"
+    assert len(report.filter_report_data(keyvalue="ZONE 4")) == 1
+    assert len(report.filter_report_data(keyvalue="ZONE 3")) == len(report) - 1
+    report.iloc[1, report.columns.get_loc("KeyValue")] = "ZONE 4"
+    assert len(report.filter_report_data(keyvalue="ZONE 4")) == 2
+    report.at[report.index[2], "KeyValue"] = "ZONE 4"
+    assert len(report.filter_report_data(keyvalue="ZONE 4")) == 3
+    # without writes, the index is reused by the next queries.
+    assert report._column_index("KeyValue") is report._column_index("KeyValue")
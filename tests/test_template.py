@@ -1,5 +1,8 @@
+import collections
 import importlib
 import itertools
+import multiprocessing
+import os
 from copy import copy
 
 import numpy as np
@@ -33,6 +36,7 @@ from archetypal.template.schedule import (
     YearSchedulePart,
 )
 from archetypal.template.structure import MassRatio, StructureInformation
+from archetypal.template.translation_cache import translate, translation_cache
 from archetypal.template.umi_base import UniqueName
 from archetypal.template.ventilation import VentilationSetting
 from archetypal.template.window_setting import WindowSetting
@@ -144,6 +148,30 @@ core_name = "core"
 perim_name = "perim"
 
 
+class _ZoneModel:
+    """A stand-in for an IDF model, read from the names of its zones, that use one construction."""
+
+    def __init__(self, idfname, prep_outputs=True):
+        names = idfname.read() if hasattr(idfname, "read") else idfname
+        self.prep_outputs = prep_outputs
+        self.idfobjects = {"ZONE": [_Bunch(self, "ZONE", [name]) for name in names.split(",")]}
+        self.construction = _Bunch(self, "CONSTRUCTION", ["Wall", "Brick"])
+
+    def idfstr(self):
+        return ",".join(zone.Name for zone in self.idfobjects["ZONE"])
+
+    def getobject(self, key, name):
+        return next(obj for obj in self.idfobjects[key] if obj.Name == name)
+
+
+class _Bunch:
+    def __init__(self, theidf, key, fieldvalues):
+        self.theidf = theidf
+        self.key = key
+        self.fieldvalues = fieldvalues
+        self.Name = fieldvalues[0]
+
+
 class TestUnique:
     """Series of tests for the :class:`Unique` class"""
 
@@ -1087,6 +1115,24 @@ class TestOpaqueConstruction:
         desired = 3.237
         assert oc_c.u_value == pytest.approx(desired, 1e-3)
 
+    def test_combine_many_constant_ufactor_weights(self, construction_a, construction_b):
+        """Test the weights replace the areas of the constructions."""
+        construction_a.area, construction_b.area = 1, 3
+        pairwise = OpaqueConstruction.combine(construction_a, construction_b, method="constant_ufactor")
+        construction_a.area, construction_b.area = 1, 1
+
+        combined = OpaqueConstruction.combine_many(
+            [construction_a, construction_b], weights=[1, 3], method="constant_ufactor"
+        )
+        assert combined.u_value == pytest.approx(pairwise.u_value, 1e-3)
+        assert combined.area == 4
+        assert (construction_a.area, construction_b.area) == (1, 1)
+
+        reversed_weights = OpaqueConstruction.combine_many(
+            [construction_a, construction_b], weights=[3, 1], method="constant_ufactor"
+        )
+        assert reversed_weights.u_value != combined.u_value
+
     def test_iadd_opaque_construction(self, construction_a, construction_b):
         """Test __iadd__() for OpaqueConstruction
 
@@ -1210,6 +1256,28 @@ class TestOpaqueConstruction:
             surface = small_idf_obj.idfobjects["BUILDINGSURFACE:DETAILED"][0]
             OpaqueConstruction.from_epbunch(surface)
 
+    def test_from_epbunch_translation_cache(self, small_idf_obj):
+        """Test that constructions are translated once per translation_cache."""
+        construction = small_idf_obj.idfobjects["CONSTRUCTION"][0]
+
+        # Without a cache, each call builds a new object.
+        assert translate(construction, OpaqueConstruction.from_epbunch) is not translate(
+            construction, OpaqueConstruction.from_epbunch
+        )
+
+        with translation_cache(small_idf_obj):
+            oc = translate(construction, OpaqueConstruction.from_epbunch, Category="Facade")
+            assert translate(construction, OpaqueConstruction.from_epbunch, Category="Facade") is oc
+            # Different keywords give a different component.
+            partition = translate(construction, OpaqueConstruction.from_epbunch, Category="Partition")
+            assert partition is not oc
+            assert partition.Category == "Partition"
+            # Materials are shared between the components.
+            assert partition.Layers[0].Material is oc.Layers[0].Material
+
+        # The cache is dropped at the end of the block.
+        assert translate(construction, OpaqueConstruction.from_epbunch, Category="Facade") is not oc
+
 
 @pytest.mark.skipif(not has_coolprop, reason="CoolProp not installed")
 class TestWindowConstruction:
@@ -1679,6 +1747,25 @@ class TestUmiSchedule:
         sch4 = reduce(UmiSchedule.combine, (sch1, sch2, sch3))
         assert sch4
 
+    def test_combine_many(self):
+        import numpy as np
+
+        sch1 = UmiSchedule(Name="Equipment_10kw", Values=np.ones(24), quantity=10, Type="Fraction")
+        sch2 = UmiSchedule(Name="Equipment_20kw", Values=np.ones(24) / 2, quantity=20, Type="Fraction")
+        sch3 = UmiSchedule(Name="Equipment_30kw", Values=np.ones(24) / 3, quantity=30, Type="Fraction")
+        sch4 = UmiSchedule.combine_many([sch1, None, sch2, sch3], weights=[1, 1, 2, 3])
+        assert sch4.all_values == pytest.approx(np.full(24, (1 + 2 * 0.5 + 3 / 3) / 6))
+        assert sch4.quantity == 60
+        assert {sch1, sch2, sch3} <= sch4.predecessors.data
+
+        # weights are multiplied by the quantity of each schedule
+        sch5 = UmiSchedule.combine_many([sch1, sch2, sch3], quantity=True)
+        assert sch5.all_values == pytest.approx(np.full(24, (10 + 20 * 0.5 + 30 / 3) / 60))
+
+        # a schedule with only zeros does not affect the others
+        zeros = UmiSchedule(Name="AlwaysOff", Values=np.zeros(24), Type="Fraction")
+        assert UmiSchedule.combine_many([zeros, sch1]) is sch1
+
 
 class TestZoneConstructionSet:
     """Combines different :class:`ZoneConstructionSet` tests."""
@@ -1721,6 +1808,67 @@ class TestZoneConstructionSet:
         constrSet_ = ZoneConstructionSet.from_zone(z)
         assert constrSet_.Name == "Office_ZoneConstructionSet"
 
+    def test_zone_construction_set_from_zone_shared_construction(self, config, monkeypatch):
+        """Test that surfaces sharing a construction add up their areas."""
+
+        class Model:
+            name = "model"
+
+            def __init__(self):
+                self.construction = Bunch(self, "CONSTRUCTION", ["Wall"])
+
+            def getobject(self, key, name):
+                return self.construction
+
+        class Bunch:
+            def __init__(self, theidf, key, fieldvalues, **fields):
+                self.theidf = theidf
+                self.key = key
+                self.fieldvalues = fieldvalues
+                self.__dict__.update(fields)
+
+            def __getitem__(self, field):
+                return getattr(self, field)
+
+        idf = Model()
+        zone = Bunch(
+            idf,
+            "ZONE",
+            ["Zone 1"],
+            Name="Zone 1",
+            DataSource="model",
+            is_part_of_conditioned_floor_area=True,
+            zone_surfaces=[
+                Bunch(
+                    idf,
+                    "BUILDINGSURFACE:DETAILED",
+                    [name],
+                    Name=name,
+                    Surface_Type="Wall",
+                    Outside_Boundary_Condition="Outdoors",
+                    Construction_Name="Wall",
+                    area=area,
+                )
+                for name, area in (("Wall 1", 10), ("Wall 2", 30))
+            ],
+        )
+        layers = OpaqueConstruction.generic().Layers
+        monkeypatch.setattr(
+            OpaqueConstruction,
+            "from_epbunch",
+            lambda epbunch, **kwargs: OpaqueConstruction(Name=epbunch.fieldvalues[0], Layers=layers, **kwargs),
+        )
+
+        with translation_cache(idf):
+            cached = translate(idf.construction, OpaqueConstruction.from_epbunch, Category="Facade")
+            construction_set = ZoneConstructionSet.from_zone(zone)
+
+        assert construction_set.Facade.area == 40
+        assert construction_set.Facade.Category == "Facade"
+        # the construction in the translation cache is left untouched.
+        assert construction_set.Facade is not cached
+        assert cached.area == 1
+
     def test_zoneConstructionSet_from_to_dict(self):
         """Make dict with `to_dict` and load again with `from_dict`."""
         construction = OpaqueConstruction.generic()
@@ -2371,6 +2519,38 @@ class TestDomesticHotWaterSetting:
             total_water
         )
 
+    def test_combine_many(self):
+        """Test combining many objects with multipliers as weights."""
+        zone_1 = DomesticHotWaterSetting(
+            Name="zone_1",
+            FlowRatePerFloorArea=0.001,
+            area=25,
+            WaterSchedule=UmiSchedule.constant_schedule(1, Name="AlwaysOn"),
+        )
+        zone_2 = DomesticHotWaterSetting(
+            Name="zone_2",
+            FlowRatePerFloorArea=0.002,
+            area=75,
+            WaterSchedule=UmiSchedule.constant_schedule(0.5, Name="AlwaysHalf"),
+        )
+        combined = DomesticHotWaterSetting.combine_many([zone_1, zone_2], weights=[3, 1])
+        assert combined.area == 3 * zone_1.area + zone_2.area
+        assert combined.FlowRatePerFloorArea == pytest.approx((0.001 * 75 + 0.002 * 75) / 150)
+
+        # assert final annual quantity is kept.
+        total_water = 3 * sum(zone_1.WaterSchedule.all_values * zone_1.FlowRatePerFloorArea * zone_1.area) + sum(
+            zone_2.WaterSchedule.all_values * zone_2.FlowRatePerFloorArea * zone_2.area
+        )
+        assert sum(combined.WaterSchedule.all_values * combined.FlowRatePerFloorArea * combined.area) == pytest.approx(
+            total_water
+        )
+
+        # Same as pairwise combine when weights are 1.
+        pairwise = zone_1 + zone_2
+        combined = DomesticHotWaterSetting.combine_many([zone_1, zone_2])
+        assert combined.FlowRatePerFloorArea == pytest.approx(pairwise.FlowRatePerFloorArea)
+        assert combined.WaterSchedule.all_values == pytest.approx(pairwise.WaterSchedule.all_values)
+
     def test_hash_eq_dhw(self):
         """Test equality and hashing of :class:`DomesticHotWaterSetting`."""
 
@@ -2758,6 +2938,35 @@ class TestZoneDefinition:
         assert z_core.volume == pytest.approx(volume)
         assert z_core.area == pytest.approx(area)
 
+    def test_combine_many(self):
+        """Test combining many zones with their multipliers as weights."""
+        zones = [
+            ZoneDefinition(
+                f"Zone {i}",
+                area=10 * 10,
+                volume=10 * 10 * 3,
+                occupants=i,
+                Loads=ZoneLoad(f"Zone {i} Load", EquipmentPowerDensity=i * 10, area=10 * 10),
+                Conditioning=ZoneConditioning(f"Zone {i} Conditioning", HeatingSetpoint=20 + i, area=10 * 10),
+                InternalMassExposedPerFloorArea=i,
+                multiplier=i,
+            )
+            for i in (1, 2, 3)
+        ]
+        n_created = len(ZoneLoad._CREATED_OBJECTS)
+
+        combined = ZoneDefinition.combine_many(zones, weights=[zone.multiplier for zone in zones])
+
+        assert combined.area == pytest.approx(6 * 100)
+        assert combined.volume == pytest.approx(6 * 300)
+        assert combined.occupants == pytest.approx(1 + 2 * 2 + 3 * 3)
+        assert combined.InternalMassExposedPerFloorArea == pytest.approx(14 / 6)
+        assert combined.Loads.EquipmentPowerDensity == pytest.approx(140 / 6)
+        assert combined.Loads.area == pytest.approx(6 * 100)
+        assert combined.Conditioning.HeatingSetpoint == pytest.approx(20 + 14 / 6)
+        # a single ZoneLoad is created for the whole combination
+        assert len(ZoneLoad._CREATED_OBJECTS) == n_created + 1
+
     def test_hash_eq_zone(self):
         """Test equality and hashing of :class:`ZoneLoad`."""
         zone = ZoneDefinition(
@@ -2877,6 +3086,57 @@ class TestBuildingTemplate:
         bt_dup = bt.duplicate()
         assert bt == bt_dup
 
+    def test_from_idf_processors(self, config):
+        """Test that creating zones with a pool of workers matches the serial path."""
+        w = data_dir / "CAN_PQ_Montreal.Intl.AP.716270_CWEC.epw"
+        idf = IDF.from_example_files("5ZoneCostEst.idf", epw=w, annual=True)
+        if idf.sim_info is None:
+            idf.simulate()
+
+        serial = BuildingTemplate.from_idf(idf)
+        parallel = BuildingTemplate.from_idf(idf, processors=2)
+        assert parallel.Core == serial.Core
+        assert parallel.Perimeter == serial.Perimeter
+        assert parallel.Windows == serial.Windows
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork", reason="the workers must inherit the patched from_epbunch"
+    )
+    def test_from_idf_processors_worker_cache(self, config, monkeypatch):
+        """Test that each worker process reads the model once and shares its cache between zones."""
+        from archetypal.template import building_template
+
+        def material_from_epbunch(epbunch):
+            # records the worker and its model, and how many materials the worker translated.
+            return OpaqueMaterial(
+                Name="Brick",
+                Conductivity=1,
+                SpecificHeat=800,
+                DataSource=f"{os.getpid()} {id(epbunch.theidf)}",
+                Comments=str(next(translations)),
+            )
+
+        def from_epbunch(ep_bunch, allow_duplicates=False, **kwargs):
+            brick = translate(ep_bunch.theidf.construction, material_from_epbunch)
+            return OpaqueConstruction(Name=ep_bunch.Name, Layers=[MaterialLayer(brick, 0.2)])
+
+        translations = itertools.count()
+        monkeypatch.setattr(ZoneDefinition, "from_epbunch", from_epbunch)
+        zones = building_template._zones_from_idf(_ZoneModel(",".join(f"Zone {i}" for i in range(8))), "model", 2)
+
+        assert [zone.Name for zone in zones] == [f"Zone {i}" for i in range(8)]
+        bricks = [zone.Layers[0].Material for zone in zones[1:]]
+        workers = collections.defaultdict(set)
+        for brick in bricks:
+            pid, model = brick.DataSource.split()
+            workers[int(pid)].add((model, brick.Comments))
+        assert os.getpid() not in workers
+        # one model and one translation of the material per worker.
+        assert all(len(translated) == 1 for translated in workers.values())
+        # the components received from the workers are objects of this process.
+        assert len({brick.id for brick in bricks}) == len(bricks)
+        assert all(any(obj is brick for obj in OpaqueMaterial._CREATED_OBJECTS) for brick in bricks)
+
     def test_from_to_dict(
         self,
         zone_definition,
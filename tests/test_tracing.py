@@ -0,0 +1,54 @@
+import json
+import threading
+
+from archetypal.tracing import span, traced, tracing
+
+
+@traced
+def _parse():
+    with span("read", file="in.idf"):
+        pass
+
+
+def test_spans_are_not_recorded_by_default():
+    """Test spans are no-ops outside a tracing block."""
+    with span("stage") as record:
+        assert record is None
+    assert _parse() is None
+
+
+def test_nested_spans(tmp_path):
+    """Test nested spans, threads and the exported profiles."""
+    with tracing(tmp_path / "profile.json") as tracer:
+        with span("pipeline"):
+            _parse()
+            worker = threading.Thread(target=_parse)
+            worker.start()
+            worker.join()
+        with tracing() as inner:
+            assert inner is tracer
+
+    stacks = sorted((s.stack, s.name) for s in tracer.spans)
+    assert stacks == [
+        ((), "_parse"),
+        ((), "pipeline"),
+        (("_parse",), "read"),
+        (("pipeline",), "_parse"),
+        (("pipeline", "_parse"), "read"),
+    ]
+    assert all(s.duration >= 0 for s in tracer.spans)
+
+    trace = json.loads((tmp_path / "profile.json").read_text())
+    events = trace["traceEvents"]
+    assert [e["name"] for e in events][:3] == ["pipeline", "_parse", "read"]
+    assert {e["tid"] for e in events} == {0, 1}
+    assert events[2]["args"] == {"file": "in.idf"}
+
+    folded = tracer.to_folded().splitlines()
+    assert [line.rsplit(" ", 1)[0] for line in folded] == [
+        "_parse",
+        "_parse;read",
+        "pipeline",
+        "pipeline;_parse",
+        "pipeline;_parse;read",
+    ]
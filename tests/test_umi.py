@@ -100,6 +100,25 @@ class TestUmiTemplate:
             b[key] = sorted(b[key], key=lambda x: x.get("Name"))
         assert json.loads(json.dumps(a)) == json.loads(json.dumps(b))
 
+    def test_streaming_json(self, config, tmp_path):
+        """Test the library is read and written section by section."""
+        file = data_dir / "umi_samples/BostonTemplateLibrary_nodup.json"
+
+        a = UmiTemplateLibrary.open(file, chunk_size=64)  # many partial reads
+        with open(file) as f:
+            b = UmiTemplateLibrary.loads(f.read(), file)
+        assert a.to_json() == b.to_json()
+
+        # the streamed text is the one of the whole dict, in dependency order.
+        data_dict = a.to_dict()
+        assert list(data_dict)[5] == "StructureDefinitions"
+        for indent in (2, None):
+            assert a.to_json(indent=indent) == json.dumps(data_dict, indent=indent)
+
+        pytest.importorskip("orjson")
+        a.to_json(tmp_path / "library.json", json_backend="orjson")
+        assert UmiTemplateLibrary.open(tmp_path / "library.json").to_json() == a.to_json()
+
     @pytest.mark.slow
     def test_umitemplate(self, config):
         """Test creating UmiTemplateLibrary from 2 IDF files"""
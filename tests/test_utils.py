@@ -0,0 +1,32 @@
+import pytest
+from path import Path
+
+from archetypal import settings
+from archetypal.utils import parallel_process
+
+
+def _setting_in_worker(name):
+    return getattr(settings, name)
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("cache_expire_after", 60.0),
+        ("cache_max_size", 1024),
+        ("cache_ground_heat_transfer", False),
+        ("run_folder", Path("run")),
+        ("log_notebook", True),
+        ("log_name", "worker"),
+    ],
+)
+def test_parallel_process_forwards_settings(config, monkeypatch, tmp_path, name, value):
+    """Test the worker threads are configured with the settings of the caller."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, name, value)
+    value = getattr(settings, name)
+    out = parallel_process(
+        {"a": {"name": name}, "b": {"name": name}}, _setting_in_worker, processors=2, show_progress=False, debug=True
+    )
+    assert out == {"a": value, "b": value}
+    assert getattr(settings, name) == value
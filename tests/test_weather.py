@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from archetypal.weather import WeatherCache, epw_digest
+
+from .conftest import data_dir
+
+epw = data_dir / "CAN_PQ_Montreal.Intl.AP.716270_CWEC.epw"
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    cache = WeatherCache(tmp_path / "weather")
+    yield cache
+    cache.clear()
+
+
+def test_read_weather(cache):
+    """Test the hourly fields are parsed once and memory-mapped."""
+    weather = cache.get(epw)
+    assert weather.location["city"] == "Montreal Int'l"
+    assert weather.location["latitude"] == pytest.approx(45.47)
+    assert len(weather.index) == 8760
+    assert weather.index[0] == pd.Timestamp("2018-01-01 00:00")
+    assert weather.index[-1] == pd.Timestamp("2018-12-31 23:00")
+
+    dry_bulb = weather["Dry Bulb Temperature"]
+    assert isinstance(dry_bulb, np.memmap)
+    assert dry_bulb[0] == pytest.approx(6.8)
+    assert weather.series("Dry Bulb Temperature").index.equals(weather.index)
+
+    # the same parsed copy is shared.
+    assert cache.get(epw) is weather
+    assert (cache.path / epw_digest(epw)).is_dir()
+    with pytest.raises(KeyError):
+        weather["Missing"]
+
+
+def test_read_leap_year_weather(cache, tmp_path):
+    """Test a file with records on February 29 is placed in a leap year."""
+    lines = epw.read_text(encoding="latin-1").splitlines(keepends=True)
+    header, records = lines[:8], lines[8:]
+    feb_28 = [line for line in records if line.split(",")[1:3] == ["2", "28"]]
+    feb_29 = [line.replace(",2,28,", ",2,29,", 1) for line in feb_28]
+    i = records.index(feb_28[-1]) + 1
+    leap_epw = tmp_path / "leap.epw"
+    leap_epw.write_text("".join(header + records[:i] + feb_29 + records[i:]), encoding="latin-1")
+
+    weather = cache.get(leap_epw)
+    assert len(weather.index) == 8784
+    assert weather.index.is_monotonic_increasing
+    assert weather.index[0] == pd.Timestamp("2020-01-01 00:00")
+    assert weather.index[24 * 59] == pd.Timestamp("2020-02-29 00:00")
+    assert weather.index[-1] == pd.Timestamp("2020-12-31 23:00")
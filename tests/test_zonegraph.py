@@ -1,7 +1,7 @@
 import pytest
 
 from archetypal import IDF
-from archetypal.zone_graph import ZoneGraph
+from archetypal.zone_graph import ZoneGraph, surfaces_by_zone
 
 from .conftest import data_dir
 
@@ -28,6 +28,12 @@ class TestZoneGraph:
 
         assert G
 
+    def test_surfaces_by_zone(self, small_office):
+        """Test the surfaces indexed in one pass are the surfaces of each zone."""
+        surfaces = surfaces_by_zone(small_office)
+        for zone in small_office.idfobjects["ZONE"]:
+            assert surfaces[zone.Name.upper()] == zone.zonesurfaces
+
     @pytest.fixture(scope="class")
     def G(self, small_office):
         """